@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""
+Compares the cost of overriding a single app setting in a test using Django's
+``override_settings()`` with using a settings helper's
+``override_for_tests()`` method.
+
+Each simulated 'test' overrides one setting, then requests every setting
+value (including models, modules and objects) from several settings helpers,
+as a typical test for a project using a handful of apps might. Run from the
+project's root directory with:
+
+    python benchmarks/override_for_tests.py [--tests 2000] [--helpers 5]
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['DJANGO_SETTINGS_MODULE'] = 'cogwheels.tests.settings'
+
+import django  # noqa
+django.setup()
+
+from django.test import override_settings  # noqa
+from cogwheels.tests.conf import settings  # noqa
+
+VALUE_SETTINGS = ('INTEGER_SETTING', 'BOOLEAN_SETTING', 'STRING_SETTING', 'TUPLES_SETTING')
+MODEL_SETTINGS = ('VALID_MODEL',)
+MODULE_SETTINGS = ('VALID_MODULE',)
+OBJECT_SETTINGS = ('VALID_OBJECT',)
+
+
+def use_settings(helpers):
+    for helper in helpers:
+        for setting_name in VALUE_SETTINGS:
+            helper.get(setting_name)
+        for setting_name in MODEL_SETTINGS:
+            helper.get_model(setting_name)
+        for setting_name in MODULE_SETTINGS:
+            helper.get_module(setting_name)
+        for setting_name in OBJECT_SETTINGS:
+            helper.get_object(setting_name)
+
+
+def run_with_override_settings(helpers, num_tests):
+    start = time.perf_counter()
+    for i in range(num_tests):
+        with override_settings(COGWHEELS_TESTS_INTEGER_SETTING=i):
+            use_settings(helpers)
+    return time.perf_counter() - start
+
+
+def run_with_override_for_tests(helpers, num_tests):
+    start = time.perf_counter()
+    for i in range(num_tests):
+        with helpers[0].override_for_tests(INTEGER_SETTING=i):
+            use_settings(helpers)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--tests', type=int, default=2000)
+    parser.add_argument('--helpers', type=int, default=5)
+    args = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    helpers = [settings.__class__() for i in range(args.helpers)]
+    use_settings(helpers)  # Warm up caches and import everything
+
+    baseline = run_with_override_settings(helpers, args.tests)
+    optimised = run_with_override_for_tests(helpers, args.tests)
+
+    print("{} tests, {} settings helpers".format(args.tests, args.helpers))
+    print("override_settings():  {:.3f}s ({:.1f}us per test)".format(
+        baseline, baseline / args.tests * 1000000))
+    print("override_for_tests(): {:.3f}s ({:.1f}us per test)".format(
+        optimised, optimised / args.tests * 1000000))
+    print("Speedup: {:.1f}x".format(baseline / optimised))
+
+
+if __name__ == '__main__':
+    main()
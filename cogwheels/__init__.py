@@ -3,11 +3,27 @@ from .__version__ import ( # noqa
     __author__, __author_email__,
     __copyright__, __license__
 )
-from .exceptions import ( # noqa
-    DefaultValueError, DefaultValueTypeInvalid,
-    DefaultValueFormatInvalid, DefaultValueNotImportable,
-    OverrideValueError, OverrideValueTypeInvalid,
-    OverrideValueFormatInvalid, OverrideValueNotImportable,
-    UnknownSettingNameError
-)
-from .helpers import BaseAppSettingsHelper, DeprecatedAppSetting # noqa
+from .utils.lazy import setup_lazy_attributes
+
+# Exceptions and helpers are only imported when first accessed, so that
+# importing cogwheels does not import Django's settings machinery
+setup_lazy_attributes(__name__, (
+    ('DefaultValueError', '.exceptions'),
+    ('DefaultValueTypeInvalid', '.exceptions'),
+    ('DefaultValueFormatInvalid', '.exceptions'),
+    ('DefaultValueNotImportable', '.exceptions'),
+    ('OverrideValueError', '.exceptions'),
+    ('OverrideValueTypeInvalid', '.exceptions'),
+    ('OverrideValueFormatInvalid', '.exceptions'),
+    ('OverrideValueNotImportable', '.exceptions'),
+    ('UnknownSettingNameError', '.exceptions'),
+    ('BaseAppSettingsHelper', '.helpers'),
+    ('DeprecatedAppSetting', '.helpers'),
+    ('DeprecationUsageCollector', '.helpers'),
+    ('DerivedAppSetting', '.helpers'),
+    ('derived', '.helpers'),
+    ('SettingValueSource', '.helpers'),
+    ('SettingsSnapshot', '.helpers'),
+))
+
+default_app_config = 'cogwheels.apps.CogwheelsConfig'
@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+
+
+class CogwheelsConfig(AppConfig):
+    name = 'cogwheels'
+    verbose_name = 'Cogwheels'
+
+    def ready(self):
+        from . import checks  # noqa
+        from .helpers import registry
+        # Import paths for helpers using compiled values could not be bound
+        # before now, in case they reference models
+        for settings_helper in registry.get_helpers():
+            settings_helper.bind_compiled_imports()
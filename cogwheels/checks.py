@@ -0,0 +1,28 @@
+from django.core import checks
+
+from cogwheels.exceptions import SettingValueFormatInvalid, SettingValueTypeInvalid
+from cogwheels.helpers import registry
+
+
+def get_error_id(error):
+    if isinstance(error, SettingValueTypeInvalid):
+        return 'cogwheels.E001'
+    if isinstance(error, SettingValueFormatInvalid):
+        return 'cogwheels.E002'
+    return 'cogwheels.E003'
+
+
+@checks.register()
+def check_import_path_settings(app_configs=None, **kwargs):
+    """
+    Checks the values of 'import path' settings (those named in the
+    ``module_settings`` and ``object_settings`` attributes) for every
+    settings helper, without importing anything.
+    """
+    messages = []
+    for settings_helper in registry.autodiscover():
+        for error in settings_helper.check_import_paths():
+            messages.append(checks.Error(
+                str(error), obj=settings_helper.__class__, id=get_error_id(error),
+            ))
+    return messages
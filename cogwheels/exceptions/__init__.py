@@ -1,2 +1,29 @@
-from .deprecations import * # noqa
-from .settings import * # noqa
+from cogwheels.utils.lazy import setup_lazy_attributes
+
+# Exception classes are only imported when first accessed
+setup_lazy_attributes(__name__, (
+    ('ImproperlyConfigured', '.settings'),
+    # Deprecation definition errors
+    ('DeprecationsError', '.deprecations'),
+    ('IncorrectDeprecationsValueType', '.deprecations'),
+    ('InvalidDeprecationDefinition', '.deprecations'),
+    ('DuplicateDeprecationError', '.deprecations'),
+    # Derived setting errors
+    ('DerivedSettingsError', '.derived'),
+    ('UnknownDependencyError', '.derived'),
+    ('CircularDependencyError', '.derived'),
+    # Setting value errors
+    ('SettingValueError', '.settings'),
+    ('SettingValueTypeInvalid', '.settings'),
+    ('SettingValueFormatInvalid', '.settings'),
+    ('SettingValueNotImportable', '.settings'),
+    ('DefaultValueError', '.settings'),
+    ('DefaultValueTypeInvalid', '.settings'),
+    ('DefaultValueFormatInvalid', '.settings'),
+    ('DefaultValueNotImportable', '.settings'),
+    ('OverrideValueError', '.settings'),
+    ('OverrideValueTypeInvalid', '.settings'),
+    ('OverrideValueFormatInvalid', '.settings'),
+    ('OverrideValueNotImportable', '.settings'),
+    ('UnknownSettingNameError', '.settings'),
+))
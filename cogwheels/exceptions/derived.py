@@ -0,0 +1,23 @@
+from django.core.exceptions import ImproperlyConfigured
+
+# -----------------------------------------------------------------------------
+# Errors relating to derived settings in a settings helper's defaults module
+# -----------------------------------------------------------------------------
+
+
+class DerivedSettingsError(ImproperlyConfigured):
+    """There is a problem with one or more ``derived()`` values in a settings
+    helper's defaults module."""
+    pass
+
+
+class UnknownDependencyError(DerivedSettingsError):
+    """A derived setting depends on a setting name that cannot be found in
+    the defaults module."""
+    pass
+
+
+class CircularDependencyError(DerivedSettingsError):
+    """Two or more derived settings depend on each other, so none of their
+    values can be computed."""
+    pass
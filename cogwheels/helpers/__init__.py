@@ -1,2 +1,17 @@
-from .settings import BaseAppSettingsHelper # noqa
-from .deprecation import DeprecatedAppSetting # noqa
+from cogwheels.utils.lazy import setup_lazy_attributes
+
+# This is imported straight away (it has no dependencies), as importing the
+# 'derived' submodule later would replace the 'derived' function attribute
+from .derived import DerivedAppSetting, derived # noqa
+
+# Other helper classes are only imported when first accessed
+_lazy_attributes = (
+    ('BaseAppSettingsHelper', '.settings'),
+    ('DeprecatedAppSetting', '.deprecation'),
+    ('DeprecationUsageCollector', '.telemetry'),
+    ('SettingValueSource', '.sources'),
+    ('SettingsSnapshot', '.snapshot'),
+)
+__all__ = ['DerivedAppSetting', 'derived']
+__all__ += [name for name, submodule_name in _lazy_attributes]
+setup_lazy_attributes(__name__, _lazy_attributes)
@@ -1,3 +1,4 @@
+import sys
 import warnings
 
 
@@ -44,6 +45,25 @@ REPLACED_OLD_SETTING_USER_WARNING_FORMAT = (
     "{prefixed_replacement_name}. "
 ) + COMMON_OLD_SETTING_USED_WARNING_FORMAT
 
+# Identify the different kinds of warning that can be raised for a deprecation
+REQUESTED = 'requested'
+OVERRIDDEN = 'overridden'
+OLD_NAME_USED = 'old_name_used'
+
+
+def get_call_site(stacklevel):
+    """
+    Returns a ``(filename, lineno)`` tuple identifying the line of code that
+    ``stacklevel`` refers to, where ``stacklevel`` is relative to the caller
+    (in the same way as for ``warnings.warn()``). Returns ``(None, None)`` if
+    the stack is not that deep.
+    """
+    try:
+        frame = sys._getframe(stacklevel)
+    except ValueError:
+        return (None, None)
+    return (frame.f_code.co_filename, frame.f_lineno)
+
 
 class DeprecatedAppSetting:
     """
@@ -61,6 +81,7 @@ class DeprecatedAppSetting:
         self.warning_category = warning_category or DeprecationWarning
         self.additional_guidance = additional_guidance
         self._prefix = ''
+        self._warning_messages = {}
 
     @property
     def is_imminent(self):
@@ -75,6 +96,8 @@ class DeprecatedAppSetting:
     @prefix.setter
     def prefix(self, value):
         self._prefix = value
+        # Messages include the prefix, so must be generated again
+        self._warning_messages = {}
 
     @property
     def prefixed_setting_name(self):
@@ -106,31 +129,70 @@ class DeprecatedAppSetting:
             removing_in_version=self.get_removing_in_version_text(),
         )
 
-    def warn_if_overridden(self, stacklevel=2):
+    def get_warning_message(self, message_format):
+        """
+        Returns the result of ``_make_warning_message()`` for
+        ``message_format``, which is only generated once for each format.
+        """
+        try:
+            return self._warning_messages[message_format]
+        except KeyError:
+            message = self._make_warning_message(message_format)
+            self._warning_messages[message_format] = message
+            return message
+
+    def _warn(self, kind, message_format, stacklevel, registry=None,
+              collector=None):
+        """
+        Raises a deprecation warning using ``message_format``. ``stacklevel``
+        should be relative to this method (rather than the public method that
+        called it).
+
+        If a ``registry`` set is provided, the warning is only raised once for
+        each combination of ``kind`` and 'call site' (the line of code
+        identified by ``stacklevel``), and subsequent calls return straight
+        away, without generating a message or calling ``warnings.warn()``.
+
+        If a ``DeprecationUsageCollector`` is provided as ``collector``, no
+        warning is raised. Instead, the usage is counted by the collector.
+        """
+        if collector is not None:
+            collector.record(
+                (self.prefixed_setting_name, kind) + get_call_site(stacklevel))
+            return
+        if registry is not None:
+            key = (self.setting_name, kind) + get_call_site(stacklevel)
+            if key in registry:
+                return
+            registry.add(key)
         warnings.warn(
-            self._make_warning_message(DEPRECATED_SETTING_OVERRIDDEN_WARNING_FORMAT),
+            self.get_warning_message(message_format),
             category=self.warning_category,
             stacklevel=stacklevel,
         )
 
-    def warn_if_deprecated_setting_value_requested(self, stacklevel=2):
+    def warn_if_overridden(self, stacklevel=2, registry=None, collector=None):
+        self._warn(
+            OVERRIDDEN, DEPRECATED_SETTING_OVERRIDDEN_WARNING_FORMAT,
+            stacklevel + 1, registry, collector
+        )
+
+    def warn_if_deprecated_setting_value_requested(
+        self, stacklevel=2, registry=None, collector=None
+    ):
         message_format = SIMPLE_DEPRECATION_WARNING_FORMAT
         if self.replacement_name is not None:
             message_format = REPLACED_SETTING_REQUESTED_WARNING_FORMAT
             if self.is_renamed:
                 message_format = RENAMED_SETTING_REQUESTED_WARNING_FORMAT
-        warnings.warn(
-            self._make_warning_message(message_format),
-            category=self.warning_category,
-            stacklevel=stacklevel,
-        )
+        self._warn(REQUESTED, message_format, stacklevel + 1, registry, collector)
 
-    def warn_if_user_using_old_setting_name(self, stacklevel=2):
-        warnings.warn(
-            self._make_warning_message(
-                RENAMED_OLD_SETTING_USED_WARNING_FORMAT if self.is_renamed
-                else REPLACED_OLD_SETTING_USER_WARNING_FORMAT
-            ),
-            category=self.warning_category,
-            stacklevel=stacklevel,
+    def warn_if_user_using_old_setting_name(
+        self, stacklevel=2, registry=None, collector=None
+    ):
+        self._warn(
+            OLD_NAME_USED,
+            RENAMED_OLD_SETTING_USED_WARNING_FORMAT if self.is_renamed
+            else REPLACED_OLD_SETTING_USER_WARNING_FORMAT,
+            stacklevel + 1, registry, collector
         )
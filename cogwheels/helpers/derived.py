@@ -0,0 +1,47 @@
+class DerivedAppSetting:
+    """
+    An instance of ``DerivedAppSetting`` can be used in place of a static
+    value in a defaults module, to define a default value that is computed
+    from other settings. Instances are usually created using ``derived()``.
+    """
+    def __init__(self, func, depends_on=None):
+        self.func = func
+        self.depends_on = tuple(depends_on) if depends_on is not None else None
+
+    def get_dependencies(self, valid_names):
+        """
+        Returns a tuple of names of the settings this setting depends on.
+
+        If ``depends_on`` was not specified, upper-case names referenced by
+        ``func`` that are also in ``valid_names`` are assumed to be
+        dependencies (e.g. ``TIMEOUT`` for ``lambda s: s.TIMEOUT * 1000``).
+        """
+        if self.depends_on is not None:
+            return self.depends_on
+        code = getattr(self.func, '__code__', None)
+        if code is None:
+            return ()
+        return tuple(
+            name for name in code.co_names
+            if name.isupper() and name in valid_names
+        )
+
+    def compute(self, settings_helper):
+        return self.func(settings_helper)
+
+
+def derived(func, depends_on=None):
+    """
+    Returns a ``DerivedAppSetting`` for use in a defaults module. ``func`` is
+    called with the settings helper instance as the only argument, the first
+    time the value is needed. For example::
+
+        TIMEOUT = 30
+
+        TIMEOUT_MS = derived(lambda s: s.TIMEOUT * 1000)
+
+    The result is cached until one of the settings it depends on is changed.
+    Dependencies are identified automatically for simple functions, but can
+    also be specified explicitly using ``depends_on``.
+    """
+    return DerivedAppSetting(func, depends_on=depends_on)
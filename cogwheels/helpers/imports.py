@@ -0,0 +1,56 @@
+import copy
+from importlib import import_module
+
+
+# The results of import attempts made by all settings helpers, keyed by
+# module path. Failures are kept separately, so that they can be discarded
+# cheaply whenever settings change.
+_modules = {}
+_failures = {}
+
+
+def import_module_cached(module_path):
+    """
+    Returns the Python module identified by ``module_path``, importing it if
+    this hasn't been attempted already. The result is shared by all settings
+    helpers in the process, so that settings pointing at the same module only
+    result in a single call to ``importlib.import_module()``.
+
+    Failures are cached too, and a fresh copy of the original
+    ``ImportError`` is raised for each subsequent attempt (until
+    ``clear_failures()`` is called).
+
+    :raises: ImportError
+    """
+    try:
+        return _modules[module_path]
+    except KeyError:
+        pass
+    if module_path in _failures:
+        # Avoid tracebacks from previous failures accumulating on the error
+        raise copy.copy(_failures[module_path])
+    try:
+        module = import_module(module_path)
+    except ImportError as e:
+        _failures[module_path] = copy.copy(e)
+        raise
+    _modules[module_path] = module
+    return module
+
+
+def clear_failures():
+    """
+    Discards all cached import failures, so that subsequent attempts to
+    import those modules are made again. This is called by
+    ``BaseAppSettingsHelper.clear_failures_cache()``.
+    """
+    _failures.clear()
+
+
+def clear():
+    """
+    Discards all cached import results (e.g. after modules have been removed
+    from ``sys.modules`` or reloaded).
+    """
+    _modules.clear()
+    _failures.clear()
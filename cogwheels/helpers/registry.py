@@ -0,0 +1,78 @@
+import weakref
+
+from .utils import make_digest
+
+
+_helpers = weakref.WeakSet()
+
+# Incremented whenever the fingerprint of any settings helper is discarded,
+# so that fingerprint() can tell whether its last result is still valid
+_generation = 0
+
+# The most recent result of fingerprint(), along with the generation and
+# helpers it was made for
+_last_fingerprint = None
+
+
+def register(settings_helper):
+    """
+    Adds ``settings_helper`` to the registry. This is called automatically
+    by ``BaseAppSettingsHelper.__init__()``.
+    """
+    _helpers.add(settings_helper)
+    discard_fingerprint()
+
+
+def discard_fingerprint():
+    """
+    Marks the last result of ``fingerprint()`` as out of date. Called by
+    settings helpers when their own fingerprint is discarded.
+    """
+    global _generation
+    _generation += 1
+
+
+def get_helpers():
+    """
+    Returns a list of all settings helper instances currently in use, sorted
+    by the import path of each helper's class (for a consistent order).
+    """
+    return sorted(
+        _helpers,
+        key=lambda h: (h.__class__.__module__, h.__class__.__qualname__, h._prefix)
+    )
+
+
+def fingerprint(helpers=None):
+    """
+    Returns a hash of the setting values for all registered settings helpers
+    (or just those in ``helpers``, if provided), which changes whenever any
+    of those values change (see ``BaseAppSettingsHelper.fingerprint()``).
+
+    The result is memoized until the fingerprint of any helper changes.
+    """
+    global _last_fingerprint
+    if helpers is None:
+        # Helpers that are garbage collected are removed from the registry
+        key = (_generation, None, len(_helpers))
+    else:
+        helpers = tuple(helpers)
+        key = (_generation, tuple(id(h) for h in helpers), len(helpers))
+    if _last_fingerprint is not None and _last_fingerprint[0] == key:
+        return _last_fingerprint[1]
+    if helpers is None:
+        helpers = get_helpers()
+    result = make_digest(tuple((h._prefix, h.fingerprint()) for h in helpers))
+    _last_fingerprint = (key, result)
+    return result
+
+
+def autodiscover():
+    """
+    Imports the ``conf.settings`` module from each installed Django app
+    (where present), to ensure that the settings helpers they define are
+    registered. Returns the result of ``get_helpers()``.
+    """
+    from django.utils.module_loading import autodiscover_modules
+    autodiscover_modules('conf.settings')
+    return get_helpers()
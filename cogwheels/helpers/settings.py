@@ -1,5 +1,12 @@
-from collections import defaultdict
-from importlib import import_module
+import ast
+import logging
+import re
+from collections import OrderedDict, defaultdict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import update_wrapper
+from threading import RLock
+from types import MappingProxyType
 from django.conf import settings as django_settings
 from django.core.signals import setting_changed
 from cogwheels import (
@@ -13,7 +20,43 @@ from cogwheels.exceptions.deprecations import (
     IncorrectDeprecationsValueType, InvalidDeprecationDefinition,
     DuplicateDeprecationError,
 )
-from .utils import AttrReferToMethodHelper
+from cogwheels.exceptions.settings import SettingValueError
+from cogwheels.utils.inspection import CallableInfo
+from cogwheels.exceptions.derived import (
+    CircularDependencyError, UnknownDependencyError,
+)
+from .derived import DerivedAppSetting
+from .snapshot import SettingsSnapshot, current_snapshots
+from .units import parse_bytes, parse_duration, parse_rate
+from .sources import (
+    DEFAULT, DERIVED, OVERRIDE, DEPRECATED_OVERRIDE, TEST_OVERRIDE,
+    SettingValueSource,
+)
+from . import imports, registry
+from .utils import (
+    AttrReferToMethodHelper, deep_freeze, deep_merge, find_module_spec,
+    get_defined_names, import_failures_invalidator, make_digest, make_read_only,
+)
+
+# Used to report errors raised while calling on_change() callbacks
+logger = logging.getLogger('cogwheels')
+
+# Separates positional and keyword arguments in cache keys for depends_on()
+KWARGS_MARK = object()
+
+# Used by get_path() to identify paths that could not be found
+NOT_FOUND = object()
+
+# The type of compiled regular expressions ('re.Pattern' from Python 3.7)
+PATTERN_TYPE = type(re.compile(''))
+
+# Attributes that are the same for all instances of a helper class, which are
+# only prepared once (see BaseAppSettingsHelper._load_class_metadata())
+CLASS_METADATA_ATTRIBUTES = (
+    '_prefix', '_defaults_module_path', '_defaults', '_prefixed_names',
+    '_deprecated_settings', '_replacement_settings', '_derived_settings',
+    '_setting_dependents',
+)
 
 
 class BaseAppSettingsHelper:
@@ -32,42 +75,120 @@ class BaseAppSettingsHelper:
     value with the relevant name (a prefixed version of the variable defined in
     the ``defaults`` module), and returns that if found. If no override was
     found, the default value defined for the setting is returned instead.
+    For dictionary settings named in the ``deep_merge_settings`` attribute of
+    the helper class, override values are merged with the default value
+    instead, and the result is returned as a read-only mapping. Items within
+    dictionary values can be fetched using ``get_path()``. Setting
+    ``freeze_values`` to ``True`` on the helper class causes all values to be
+    converted to immutable equivalents (see ``utils.deep_freeze()``) when
+    they are first requested, so that they can be shared safely, without
+    callers needing to make defensive copies.
 
     Some app settings may refer to Django models, Python modules, classes or
     methods, in which case a settings helper instance's ``get_model()``,
     ``get_module()`` and ``get_object()`` methods can be used to import and
     return the objects themselves (provided the raw setting values are valid
-    'import path' strings).
+    'import path' strings), and ``get_models()``, ``get_modules()`` and
+    ``get_objects()`` can be used for lists of them. Failed attempts are
+    cached too, so that repeat requests fail quickly. Setting
+    ``clear_failures_on_invalidate_caches`` to ``True`` on the helper class
+    allows these failures to be forgotten when
+    ``importlib.invalidate_caches()`` is called (e.g. after new modules are
+    created at runtime). Listing the names of these settings in the
+    ``module_settings`` and ``object_settings`` attributes of the helper class
+    allows their values to be validated by ``check_import_paths()`` (and
+    Django's ``check`` management command) without importing anything.
 
     App settings can be deprecated by defining a list of
     ``DeprecatedAppSetting`` instances on the relevant (app specific) helper
     class, causing the settings helper instance to automatically raise
-    deprecation warnings where appropriate.
+    deprecation warnings where appropriate. Setting ``warn_once`` to ``True``
+    on the helper class limits each of those warnings to being raised once
+    per 'call site' (line of code), which can be useful where deprecated
+    settings are referenced in frequently run code. Alternatively, a
+    ``DeprecationUsageCollector`` can be set as
+    ``deprecation_usage_collector`` to count deprecated setting usage instead
+    of raising warnings at all.
+
+    Where settings are fixed when a project is built, the
+    ``cogwheels_compile`` management command can be used to generate a
+    module of resolved values, and ``compiled_settings_module`` can be set to
+    the import path of that module on the helper class, so that values are
+    served from it instead of being resolved at runtime (see
+    ``_load_compiled_values()``).
     """
 
     prefix = None
     defaults_path = None
     deprecations = ()
+    warn_once = False
+    deprecation_usage_collector = None
+    clear_failures_on_invalidate_caches = False
+    module_settings = ()
+    object_settings = ()
+    deep_merge_settings = ()
+    freeze_values = False
+    compiled_settings_module = None
 
     def __init__(self):
         self.__module_path_split = self.__class__.__module__.split('.')
-        self._set_prefix()
 
-        # Load values from defaults module
-        self._load_defaults()
+        # Load defaults, deprecation data and derived setting dependencies
+        self._load_class_metadata()
+        self._warning_registry = set() if self.warn_once else None
 
-        # Load deprecation data
-        self._prepare_deprecation_data()
+        # Computed values for derived settings. Unlike the other caches, this
+        # is only partially cleared when settings are changed.
+        self._derived_cache = {}
+        self._derived_generation = 0
+
+        # Ensures get_instance() only creates each instance once
+        self._instances_lock = RLock()
+
+        # Functions decorated with depends_on(), keyed by setting name
+        self._dependent_functions = {}
+
+        # Callbacks registered with on_change(), keyed by setting name, and
+        # the values they were last called with
+        self._change_callbacks = {}
+        self._last_values = {}
+
+        # Values applied by override_for_tests(), keyed by setting name
+        self._test_overrides = {}
+
+        # Lists that resolutions are recorded in (see _record_resolution())
+        self._resolution_logs = []
+
+        # Digests of setting values, and the fingerprint made from them (see
+        # fingerprint()). Like derived values, these are only discarded for
+        # settings that change.
+        self._value_digests = {}
+        self._fingerprint = None
+
+        # The most recent result of snapshot(), and the number of places it
+        # is currently pinned by pin_snapshots()
+        self._snapshot = None
+        self._pinned_snapshots = 0
+
+        # Set by _load_compiled_values()
+        self._using_compiled_values = False
+        self._compiled_values = {}
+        self._compiled_import_paths = {}
 
         # This will create the dictionaries if they don't already exist
+        self._cache_generation = 0
         self.reset_caches()
 
         # Define 'attribute reference' shortcuts
         self.models = AttrReferToMethodHelper(self, 'get_model')
         self.modules = AttrReferToMethodHelper(self, 'get_module')
         self.objects = AttrReferToMethodHelper(self, 'get_object')
+        self.regexes = AttrReferToMethodHelper(self, 'get_regex')
 
         setting_changed.connect(self.reset_caches, dispatch_uid=id(self))
+        registry.register(self)
+        if self.clear_failures_on_invalidate_caches:
+            import_failures_invalidator.register(self)
 
     def __getattr__(self, name):
         """
@@ -85,8 +206,53 @@ class BaseAppSettingsHelper:
                 self.__class__.__name__, name))
         if not self.in_defaults(name):
             self._raise_invalid_setting_name_error(name)
+        if self._pinned_snapshots:
+            snapshot = (current_snapshots.get() or {}).get(self)
+            if snapshot is not None:
+                return snapshot.get(name, warning_stacklevel=4)
         return self.get(name, warning_stacklevel=4)
 
+    def _load_class_metadata(self):
+        """
+        Called by ``__init__()`` to set the attributes named in
+        ``CLASS_METADATA_ATTRIBUTES``, which are the same for every instance
+        of a helper class. The first instance prepares them (by calling
+        ``_set_prefix()``, ``_load_defaults()``,
+        ``_prepare_deprecation_data()`` and ``_prepare_derived_settings()``),
+        and the results are saved on the class, so that subsequent instances
+        can simply copy them.
+
+        Saved values are only reused while the ``prefix``, ``defaults_path``
+        and ``deprecations`` attributes of the class remain unchanged.
+        """
+        cls = self.__class__
+        deprecations = self.deprecations
+        if isinstance(deprecations, list):
+            deprecations = tuple(deprecations)
+        try:
+            key = (self.prefix, self.defaults_path, deprecations)
+            hash(key)
+        except TypeError:
+            # _prepare_deprecation_data() will raise a more helpful error
+            key = None
+
+        metadata = cls.__dict__.get('_class_metadata')
+        if key is not None and metadata is not None and metadata[0] == key:
+            self.__dict__.update(metadata[1])
+            return
+
+        self._set_prefix()
+        self._load_defaults()
+        self._prefixed_names = {
+            name: self.get_prefix() + name for name in self._defaults
+        }
+        self._prepare_deprecation_data()
+        self._prepare_derived_settings()
+        if key is not None:
+            cls._class_metadata = (key, {
+                attr: getattr(self, attr) for attr in CLASS_METADATA_ATTRIBUTES
+            })
+
     def _set_prefix(self):
         """
         Called by ``__init()__`` to set the object's ``_prefix`` attribute,
@@ -120,8 +286,12 @@ class BaseAppSettingsHelper:
 
     @staticmethod
     def _do_import(module_path):
-        """A simple wrapper for importlib.import_module()."""
-        return import_module(module_path)
+        """
+        A simple wrapper for importlib.import_module(), which shares results
+        (including failures) with all other helpers in the process (see
+        ``cogwheels.helpers.imports``).
+        """
+        return imports.import_module_cached(module_path)
 
     @staticmethod
     def _make_cache_key(setting_name, accept_deprecated):
@@ -222,6 +392,71 @@ class BaseAppSettingsHelper:
 
                 self._replacement_settings[item.replacement_name].append(item)
 
+    def _prepare_derived_settings(self):
+        """
+        Identifies any ``DerivedAppSetting`` values in ``self._defaults`` and
+        prepopulates the following attributes:
+
+        ``self._derived_settings``:
+            Uses the names of derived settings as keys. Used to check whether
+            a default value must be computed.
+
+        ``self._setting_dependents``:
+            Uses setting names as keys, and sets of the names of derived
+            settings that depend on them directly as values. Used to work out
+            which derived values to discard when a setting is changed.
+
+        :raises: UnknownDependencyError, CircularDependencyError
+        """
+        self._derived_settings = {}
+        self._setting_dependents = defaultdict(set)
+
+        dependencies = {}
+        for setting_name, value in self._defaults.items():
+            if not isinstance(value, DerivedAppSetting):
+                continue
+            self._derived_settings[setting_name] = value
+            dependencies[setting_name] = value.get_dependencies(self._defaults)
+            for dependency in dependencies[setting_name]:
+                if not self.in_defaults(dependency):
+                    raise UnknownDependencyError(
+                        "There is an issue with the derived value for "
+                        "'{setting_name}' in {defaults_module_path}. It depends "
+                        "on '{dependency}', but no such value can be found "
+                        "there.".format(
+                            setting_name=setting_name,
+                            dependency=dependency,
+                            defaults_module_path=self._defaults_module_path,
+                        )
+                    )
+                self._setting_dependents[dependency].add(setting_name)
+
+        # Use a depth-first search to detect circular dependencies
+        visited = set()
+        for setting_name in dependencies:
+            path = [setting_name]
+            stack = [iter(dependencies[setting_name])]
+            while stack:
+                dependency = next(stack[-1], None)
+                if dependency is None:
+                    visited.add(path.pop())
+                    stack.pop()
+                    continue
+                if dependency in path:
+                    cycle = path[path.index(dependency):] + [dependency]
+                    raise CircularDependencyError(
+                        "The derived values in {defaults_module_path} cannot "
+                        "be computed, because they depend on each other: "
+                        "{cycle}.".format(
+                            defaults_module_path=self._defaults_module_path,
+                            cycle=' -> '.join(cycle),
+                        )
+                    )
+                if dependency in visited or dependency not in dependencies:
+                    continue
+                path.append(dependency)
+                stack.append(iter(dependencies[dependency]))
+
     def reset_caches(self, **kwargs):
         """
         Called by ``__init__()`` to initialise the caches for a helper instance.
@@ -229,31 +464,251 @@ class BaseAppSettingsHelper:
         caches when changes to settings are made.
 
         Although it requires slightly more memory, separate dictionaries are
-        used for raw values, models, modules and other objects to help with
-        lookup performance for each type.
+        used for raw values, models, modules, other objects and lists of those
+        to help with lookup performance for each type.
+
+        Each call also increments ``_cache_generation``, which allows methods
+        that resolve several values at once (e.g. ``get_many()``) to detect
+        that the caches were invalidated part way through.
+
+        Computed values for derived settings, and results cached by functions
+        decorated with ``depends_on()``, are only cleared if the changed
+        setting (identified by the signal's ``setting`` argument) affects
+        them. They are always cleared when this method is called directly.
         """
+        self._cache_generation += 1
         self._raw_cache = {}
+        self._sources_cache = {}
         self._models_cache = {}
         self._modules_cache = {}
         self._objects_cache = {}
+        self._callables_cache = {}
+        self._instances_cache = {}
+        self._lists_cache = {}
+        self._indexes_cache = {}
+        self._regexes_cache = {}
+        self._units_cache = {}
+        self._paths_cache = {}
+        self.clear_failures_cache()
+
+        if 'setting' in kwargs:
+            affected_names = self._get_affected_setting_names(kwargs['setting'])
+        else:
+            affected_names = set(self._dependent_functions.keys())
+            affected_names.update(self._derived_settings.keys())
+            self._value_digests = {}
+            self._discard_fingerprint()
+            self._snapshot = None
+        if affected_names:
+            self._snapshot = None
+
+        if self.compiled_settings_module is not None:
+            # Compiled values only need to be checked again when one of this
+            # helper's own settings has changed
+            if affected_names or 'setting' not in kwargs:
+                self._load_compiled_values()
+            else:
+                self._add_compiled_values_to_caches()
+
+        self._discard_derived_values(affected_names)
+        self._discard_value_digests(affected_names)
+        if self._change_callbacks:
+            self._dispatch_change_callbacks(
+                affected_names if 'setting' in kwargs else self._change_callbacks)
+
+    def _discard_derived_values(self, setting_names):
+        """
+        Discards computed values for any derived settings named in
+        ``setting_names``, along with results cached by functions decorated
+        with ``depends_on()`` for those settings.
+        """
+        self._derived_generation += 1
+        for setting_name in setting_names:
+            self._derived_cache.pop(setting_name, None)
+            for func in self._dependent_functions.get(setting_name, ()):
+                func.cache_clear()
+
+    def _discard_cached_values(self, setting_names):
+        """
+        Discards everything cached for the settings named in
+        ``setting_names`` (including failures, instances and derived values),
+        while leaving the caches intact for all other settings. Used by
+        ``override_for_tests()`` to avoid the cost of a full
+        ``reset_caches()``.
+        """
+        cache_keys = set()
+        for setting_name in setting_names:
+            cache_keys.add(setting_name)
+            for item in self._replacement_settings.get(setting_name, ()):
+                cache_keys.add(self._make_cache_key(setting_name, item.setting_name))
+
+        for cache in (
+            self._raw_cache, self._sources_cache, self._models_cache,
+            self._modules_cache, self._objects_cache, self._callables_cache
+        ):
+            for key in cache_keys:
+                cache.pop(key, None)
+        # Keys for these caches are (kind, cache_key) tuples
+        for cache in (
+            self._lists_cache, self._indexes_cache, self._regexes_cache,
+            self._units_cache, self._failures_cache
+        ):
+            for key in [key for key in cache if key[1] in cache_keys]:
+                del cache[key]
+        # Keys for these caches are (setting_name, ...) tuples
+        for key in [key for key in self._paths_cache if key[0] in setting_names]:
+            del self._paths_cache[key]
+        with self._instances_lock:
+            for key in [key for key in self._instances_cache if key[0] in setting_names]:
+                del self._instances_cache[key]
+
+        for setting_name in setting_names:
+            self._compiled_values.pop(setting_name, None)
+
+        self._discard_derived_values(setting_names)
+        self._discard_value_digests(setting_names)
+        if setting_names:
+            self._snapshot = None
+        if self._change_callbacks:
+            self._dispatch_change_callbacks(setting_names)
+
+    def _discard_value_digests(self, setting_names):
+        """
+        Discards digests for the settings named in ``setting_names`` (and
+        the fingerprint made from them), so that they are recalculated by the
+        next call to ``fingerprint()``.
+        """
+        for setting_name in setting_names:
+            if self._value_digests.pop(setting_name, None) is not None:
+                self._discard_fingerprint()
+
+    def _discard_fingerprint(self):
+        """
+        Discards the memoized result of ``fingerprint()``, and lets the
+        registry know that its own memoized fingerprint is out of date.
+        """
+        if self._fingerprint is not None:
+            self._fingerprint = None
+            registry.discard_fingerprint()
+
+    def _dispatch_change_callbacks(self, setting_names):
+        """
+        Calls the callbacks registered with ``on_change()`` for any of the
+        settings named in ``setting_names`` whose value has changed since
+        they were last called.
+
+        Errors are logged rather than raised, so that they do not interrupt
+        the code that changed the settings, or prevent other callbacks from
+        being called. If the new value of a setting cannot be resolved, its
+        callbacks are skipped, and will be called with the last valid value
+        as ``old_value`` once the value can be resolved again.
+        """
+        for setting_name in list(setting_names):
+            callbacks = self._change_callbacks.get(setting_name)
+            if not callbacks:
+                continue
+            old_value = self._last_values[setting_name]
+            try:
+                new_value = self.get(setting_name, suppress_warnings=True)
+            except Exception:
+                logger.exception(
+                    "The new value for '%s' could not be resolved, so "
+                    "on_change() callbacks were not called.",
+                    self.get_prefixed_setting_name(setting_name))
+                continue
+            if new_value == old_value:
+                continue
+            self._last_values[setting_name] = new_value
+            for callback in list(callbacks):
+                try:
+                    callback(old_value, new_value)
+                except Exception:
+                    logger.exception(
+                        "Error in on_change() callback %r for '%s'.",
+                        callback, self.get_prefixed_setting_name(setting_name))
+
+    def _get_affected_setting_names(self, django_setting_name):
+        """
+        Returns a set of names of the app settings whose values might be
+        affected by a change to the Django setting named by
+        ``django_setting_name``. For example, a change to
+        ``YOURAPP_OLD_SETTING`` affects the value of ``OLD_SETTING`` and any
+        setting that replaces it (as overrides for the deprecated setting are
+        used as values for the new one).
+        """
+        prefix = self.get_prefix()
+        if not django_setting_name.startswith(prefix):
+            return set()
+        setting_name = django_setting_name[len(prefix):]
+        if not self.in_defaults(setting_name):
+            return set()
+        return self._get_dependent_setting_names((setting_name,))
+
+    def _get_dependent_setting_names(self, setting_names):
+        """
+        Returns a set of names of the app settings whose values might be
+        affected by a change to the value of any of the settings named in
+        ``setting_names`` (including those settings themselves).
+        """
+        affected_names = set(setting_names)
+        for setting_name in setting_names:
+            if setting_name in self._deprecated_settings:
+                replacement_name = self._deprecated_settings[setting_name].replacement_name
+                if replacement_name:
+                    affected_names.add(replacement_name)
+
+        # Include derived settings that depend on affected settings
+        to_check = list(affected_names)
+        while to_check:
+            for dependent in self._setting_dependents.get(to_check.pop(), ()):
+                if dependent not in affected_names:
+                    affected_names.add(dependent)
+                    to_check.append(dependent)
+        return affected_names
 
     def in_defaults(self, setting_name):
         return setting_name in self._defaults
 
     def get_default_value(self, setting_name):
+        if setting_name in self._derived_settings:
+            return self._get_derived_value(setting_name)
         return self._defaults[setting_name]
 
+    def _get_derived_value(self, setting_name):
+        """
+        Returns the computed value for the derived setting named by
+        ``setting_name``, which is cached until a setting it depends on is
+        changed.
+        """
+        try:
+            return self._derived_cache[setting_name]
+        except KeyError:
+            pass
+        generation = self._derived_generation
+        result = self._derived_settings[setting_name].compute(self)
+        # Only cache the value if no changes were made while computing it
+        if generation == self._derived_generation:
+            self._derived_cache[setting_name] = result
+        return result
+
     def get_prefix(self):
         return self._prefix + '_'
 
     def get_prefixed_setting_name(self, setting_name):
-        return self.get_prefix() + setting_name
+        try:
+            return self._prefixed_names[setting_name]
+        except KeyError:
+            return self.get_prefix() + setting_name
 
     def get_user_defined_value(self, setting_name):
+        if setting_name in self._test_overrides:
+            return self._test_overrides[setting_name]
         attr_name = self.get_prefixed_setting_name(setting_name)
         return getattr(django_settings, attr_name)
 
     def is_overridden(self, setting_name):
+        if setting_name in self._test_overrides:
+            return True
         attr_name = self.get_prefixed_setting_name(setting_name)
         return hasattr(django_settings, attr_name)
 
@@ -269,10 +724,40 @@ class BaseAppSettingsHelper:
         )
 
     def _raise_setting_value_error(
+        self, setting_name, additional_text,
+        user_value_error_class=None, default_value_error_class=None,
+        failure_cache_key=None, **text_format_kwargs
+    ):
+        """
+        Raises an error to indicate a problem with the value of the setting
+        named by ``setting_name`` (see ``_make_setting_value_error()``).
+
+        If ``failure_cache_key`` is provided, the error is also saved to the
+        'failures' cache using that key, so that future requests for the same
+        value can be failed without repeating any costly work (see
+        ``_raise_cached_failure()``).
+        """
+        error = self._make_setting_value_error(
+            setting_name, additional_text,
+            user_value_error_class=user_value_error_class,
+            default_value_error_class=default_value_error_class,
+            **text_format_kwargs
+        )
+        if failure_cache_key is not None:
+            self._failures_cache[failure_cache_key] = error
+        raise error
+
+    def _make_setting_value_error(
         self, setting_name, additional_text,
         user_value_error_class=None, default_value_error_class=None,
         **text_format_kwargs
     ):
+        """
+        Returns an error to indicate a problem with the value of the setting
+        named by ``setting_name``, choosing an error class (and message
+        introduction) depending on whether the value is an override or a
+        default.
+        """
         if self.is_overridden(setting_name):
             error_class = user_value_error_class or OverrideValueError
             message = (
@@ -289,8 +774,48 @@ class BaseAppSettingsHelper:
                 defaults_module=self._defaults_module_path,
             )
 
-        message += ' ' + additional_text.format(**text_format_kwargs)
-        raise error_class(message)
+        detail = additional_text.format(**text_format_kwargs)
+        error = error_class(message + ' ' + detail)
+        # Allows errors for individual list items to be combined
+        error.detail = detail
+        return error
+
+    def _raise_cached_failure(self, failure_cache_key):
+        """
+        Raises a new instance of an error previously saved to the 'failures'
+        cache by ``_raise_setting_value_error()``. A new instance is raised
+        each time to avoid tracebacks from previous failures accumulating on
+        the saved error.
+        """
+        error = self._failures_cache[failure_cache_key]
+        raise error.__class__(*error.args)
+
+    def clear_failures_cache(self, **kwargs):
+        """
+        Discards all errors saved to the 'failures' cache, so that subsequent
+        requests for models, modules or objects that previously failed to
+        import will be attempted again. This is called automatically by
+        ``reset_caches()``, and by ``importlib.invalidate_caches()`` for
+        helpers with ``clear_failures_on_invalidate_caches`` set to ``True``.
+
+        Import failures shared by all helpers in the process are also
+        discarded, so that other helpers will attempt those imports again.
+        """
+        self._failures_cache = {}
+        imports.clear_failures()
+
+    def _record_resolution(self, kind, setting_name):
+        """
+        Adds an entry to every active resolution log, to indicate that a
+        value of ``kind`` (``'value'``, ``'model'``, ``'module'``,
+        ``'object'`` or ``'instance'``) had to be resolved for the setting
+        named by ``setting_name``, because it could not be found in the
+        caches. Only called when ``_resolution_logs`` is not empty (see
+        ``assert_num_resolutions()``).
+        """
+        entry = (kind, self.get_prefixed_setting_name(setting_name))
+        for log in self._resolution_logs:
+            log.append(entry)
 
     def _warn_if_deprecated_setting_value_requested(
         self, setting_name, warn_only_if_overridden, suppress_warnings,
@@ -307,7 +832,35 @@ class BaseAppSettingsHelper:
             setting_name in self._deprecated_settings
         ):
             depr = self._deprecated_settings[setting_name]
-            depr.warn_if_deprecated_setting_value_requested(warning_stacklevel + 1)
+            depr.warn_if_deprecated_setting_value_requested(
+                warning_stacklevel + 1, registry=self._warning_registry,
+                collector=self.deprecation_usage_collector)
+
+    def _warn_if_deprecated_source(
+        self, setting_name, source, warn_only_if_overridden,
+        warning_stacklevel,
+    ):
+        """
+        Used by ``SettingsSnapshot.get()`` to raise the deprecation warnings
+        that ``_get_raw_value()`` raises when resolving a value, for a value
+        that came from ``source``: for override values defined using the
+        name of a deprecated setting, and (where ``warn_only_if_overridden``
+        is ``True``) for overridden deprecated settings.
+        """
+        if source.setting_name != setting_name:
+            if source.setting_name in self._deprecated_settings:
+                depr = self._deprecated_settings[source.setting_name]
+                depr.warn_if_user_using_old_setting_name(
+                    warning_stacklevel + 1, registry=self._warning_registry,
+                    collector=self.deprecation_usage_collector)
+        elif (
+            warn_only_if_overridden and source.is_overridden and
+            setting_name in self._deprecated_settings
+        ):
+            depr = self._deprecated_settings[setting_name]
+            depr.warn_if_overridden(
+                warning_stacklevel + 1, registry=self._warning_registry,
+                collector=self.deprecation_usage_collector)
 
     def _get_raw_value(self, setting_name, accept_deprecated='',
                        warn_if_overridden=False, suppress_warnings=False,
@@ -335,6 +888,7 @@ class BaseAppSettingsHelper:
         """
         if not self.in_defaults(setting_name):
             self._raise_invalid_setting_name_error(setting_name)
+        cache_key = self._make_cache_key(setting_name, accept_deprecated)
 
         if self.is_overridden(setting_name):
             if(
@@ -342,7 +896,11 @@ class BaseAppSettingsHelper:
                 setting_name in self._deprecated_settings
             ):
                 depr = self._deprecated_settings[setting_name]
-                depr.warn_if_overridden(warning_stacklevel)
+                depr.warn_if_overridden(
+                    warning_stacklevel, registry=self._warning_registry,
+                    collector=self.deprecation_usage_collector)
+            self._sources_cache[cache_key] = self._make_override_source(
+                setting_name, OVERRIDE)
             return self.get_user_defined_value(setting_name)
 
         if setting_name in self._replacement_settings:
@@ -353,10 +911,54 @@ class BaseAppSettingsHelper:
                     self.is_overridden(item.setting_name)
                 ):
                     if not suppress_warnings:
-                        item.warn_if_user_using_old_setting_name(warning_stacklevel)
+                        item.warn_if_user_using_old_setting_name(
+                            warning_stacklevel, registry=self._warning_registry,
+                            collector=self.deprecation_usage_collector)
+                    self._sources_cache[cache_key] = self._make_override_source(
+                        item.setting_name, DEPRECATED_OVERRIDE)
                     return self.get_user_defined_value(item.setting_name)
+        self._sources_cache[cache_key] = SettingValueSource(
+            DERIVED if setting_name in self._derived_settings else DEFAULT,
+            setting_name, None)
         return self.get_default_value(setting_name)
 
+    def _make_override_source(self, setting_name, kind):
+        """
+        Returns a ``SettingValueSource`` to indicate that the value was taken
+        from the override value for the setting named by ``setting_name``.
+        """
+        if setting_name in self._test_overrides:
+            return SettingValueSource(TEST_OVERRIDE, setting_name, None)
+        return SettingValueSource(
+            kind, setting_name, self.get_prefixed_setting_name(setting_name))
+
+    def get_source(self, setting_name, accept_deprecated=''):
+        """
+        Returns a ``SettingValueSource`` describing where the value for the
+        setting named by ``setting_name`` comes from: the defaults module, the
+        project's Django settings (using the setting's own name, or the name
+        of a deprecated setting it replaces), or elsewhere.
+
+        Sources are recorded whenever values are looked up, so this usually
+        costs a single dictionary lookup. No deprecation warnings are raised.
+
+        :param accept_deprecated:
+            Behaves as it does for ``get()``.
+        :type accept_deprecated: str (e.g. "DEPRECATED_SETTING_NAME")
+        :raises: UnknownSettingNameError
+        """
+        cache_key = self._make_cache_key(setting_name, accept_deprecated)
+        try:
+            return self._sources_cache[cache_key]
+        except KeyError:
+            pass
+        # The raw value is not cached, so that any warnings are still raised
+        # when the value is requested
+        self._get_raw_value(
+            setting_name, accept_deprecated=accept_deprecated,
+            suppress_warnings=True)
+        return self._sources_cache[cache_key]
+
     def get(self, setting_name, warn_only_if_overridden=False,
             accept_deprecated='', suppress_warnings=False,
             enforce_type=None, check_if_setting_deprecated=True,
@@ -433,6 +1035,8 @@ class BaseAppSettingsHelper:
         if cache_key in self._raw_cache:
             return self._raw_cache[cache_key]
 
+        if self._resolution_logs:
+            self._record_resolution('value', setting_name)
         result = self._get_raw_value(
             setting_name,
             accept_deprecated=accept_deprecated,
@@ -468,12 +1072,110 @@ class BaseAppSettingsHelper:
                 additional_text=msg,
                 **text_format_kwargs
             )
+        result = self._prepare_value(setting_name, result, cache_key)
         self._raw_cache[cache_key] = result
         return result
 
+    def _prepare_value(self, setting_name, value, cache_key):
+        """
+        Used by ``get()`` (and ``_load_compiled_values()``) to make any
+        changes to a raw setting value that are required before it is cached
+        (see ``deep_merge_settings`` and ``freeze_values``).
+        """
+        if setting_name in self.deep_merge_settings:
+            value = self._merge_with_default(setting_name, value, cache_key)
+        if self.freeze_values:
+            value = deep_freeze(value)
+        return value
+
+    def _merge_with_default(self, setting_name, value, cache_key):
+        """
+        Used by ``get()`` to prepare values for settings named in
+        ``deep_merge_settings``. Override values are merged with the default
+        value (see ``utils.deep_merge()``), and the result is returned as a
+        read-only mapping, which is cached in place of the raw value.
+        """
+        if not isinstance(value, Mapping):
+            self._raise_setting_value_error(
+                setting_name=setting_name,
+                user_value_error_class=OverrideValueTypeInvalid,
+                default_value_error_class=DefaultValueTypeInvalid,
+                additional_text=(
+                    "The value is merged with the default value, so is "
+                    "expected to be a 'dict', but a value of type "
+                    "'{current_type}' was found."
+                ),
+                current_type=type(value).__name__,
+            )
+        if self._sources_cache[cache_key].is_overridden:
+            default_value = self.get_default_value(setting_name)
+            if isinstance(default_value, Mapping):
+                value = deep_merge(default_value, value)
+        return make_read_only(value)
+
+    def get_path(self, setting_name, path, default=NOT_FOUND,
+                 warn_only_if_overridden=False, suppress_warnings=False,
+                 warning_stacklevel=3):
+        """
+        Returns an item from within the value of an app setting, where the
+        value is a dictionary (or list/tuple), identified by a dot-separated
+        ``path``. For example, the following are equivalent (aside from the
+        lookup being cached by ``get_path()``)::
+
+            appsettingshelper.get_path('CONFIG', 'backends.default.timeout')
+            appsettingshelper.CONFIG['backends']['default']['timeout']
+
+        Numeric path segments can be used to look up items in lists and
+        tuples. If nothing can be found at ``path``, ``default`` is returned
+        (if provided), otherwise a ``KeyError`` is raised.
+
+        ``warn_only_if_overridden``, ``suppress_warnings`` and
+        ``warning_stacklevel`` behave as they do for ``get()``.
+
+        :raises: UnknownSettingNameError, KeyError
+        """
+        self._warn_if_deprecated_setting_value_requested(
+            setting_name, warn_only_if_overridden, suppress_warnings,
+            warning_stacklevel)
+
+        path_key = (setting_name, path)
+        result = self._paths_cache.get(path_key, NOT_FOUND)
+        if result is not NOT_FOUND:
+            return result
+
+        value = self.get(
+            setting_name,
+            check_if_setting_deprecated=False,
+            warn_only_if_overridden=warn_only_if_overridden,
+            suppress_warnings=suppress_warnings,
+            warning_stacklevel=warning_stacklevel + 1,
+        )
+        for segment in path.split('.'):
+            try:
+                if isinstance(value, Mapping):
+                    value = value[segment]
+                elif isinstance(value, (list, tuple)):
+                    value = value[int(segment)]
+                else:
+                    raise KeyError(segment)
+            except (KeyError, IndexError, ValueError):
+                if default is not NOT_FOUND:
+                    return default
+                raise KeyError(
+                    "'{path}' could not be found in the value of "
+                    "{setting_name}, as there is no item matching "
+                    "'{segment}'.".format(
+                        path=path,
+                        setting_name=setting_name,
+                        segment=segment,
+                    )
+                )
+        self._paths_cache[path_key] = value
+        return value
+
     def get_model(self, setting_name, warn_only_if_overridden=False,
                   accept_deprecated='', suppress_warnings=False,
-                  warning_stacklevel=3):
+                  check_if_setting_deprecated=True, warning_stacklevel=3):
         """
         Returns a Django model referenced by an app setting where the value is
         expected to be a valid 'model string' in the format:
@@ -504,6 +1206,13 @@ class BaseAppSettingsHelper:
             might otherwise be raised. It may be more useful to use
             ``warn_only_if_overridden`` instead.
         :type suppress_warnings: bool
+        :param check_if_setting_deprecated:
+            Can be used to disable the check that usually happens at the
+            beginning of the method to identify whether the setting named by
+            ``setting_name`` is deprecated, and conditionally raise a warning.
+            This can help to improve efficiency where the same check has
+            already been made.
+        :type check_if_setting_deprecated: bool
         :param warning_stacklevel:
             When raising deprecation warnings related to the request, this
             value is passed on as ``stacklevel`` to Python's
@@ -523,13 +1232,17 @@ class BaseAppSettingsHelper:
             appsettingshelper.get_model('SETTING_NAME')
 
         """
-        self._warn_if_deprecated_setting_value_requested(
-            setting_name, warn_only_if_overridden, suppress_warnings,
-            warning_stacklevel)
+        if check_if_setting_deprecated:
+            self._warn_if_deprecated_setting_value_requested(
+                setting_name, warn_only_if_overridden, suppress_warnings,
+                warning_stacklevel)
 
         cache_key = self._make_cache_key(setting_name, accept_deprecated)
         if cache_key in self._models_cache:
             return self._models_cache[cache_key]
+        failure_cache_key = ('model', cache_key)
+        if failure_cache_key in self._failures_cache:
+            self._raise_cached_failure(failure_cache_key)
 
         raw_value = self.get(
             setting_name,
@@ -540,37 +1253,49 @@ class BaseAppSettingsHelper:
             suppress_warnings=suppress_warnings,
             warning_stacklevel=warning_stacklevel + 1,
         )
+        result = self._import_model(setting_name, raw_value, failure_cache_key)
+        self._models_cache[cache_key] = result
+        return result
 
+    def _import_model(self, setting_name, value, failure_cache_key=None):
+        """
+        Returns the Django model identified by the 'model string' ``value``
+        (which should be the value of the setting named by ``setting_name``),
+        raising a suitable error if it is incorrectly formatted or the model
+        is not installed.
+        """
+        if self._resolution_logs:
+            self._record_resolution('model', setting_name)
         try:
             from django.apps import apps  # delay import until needed
-            result = apps.get_model(raw_value)
-            self._models_cache[cache_key] = result
-            return result
+            return apps.get_model(value)
         except ValueError:
             self._raise_setting_value_error(
                 setting_name=setting_name,
+                failure_cache_key=failure_cache_key,
                 user_value_error_class=OverrideValueFormatInvalid,
                 default_value_error_class=DefaultValueFormatInvalid,
                 additional_text=(
                     "Model strings should match the format 'app_label.Model', "
                     "which '{value}' does not adhere to."
                 ),
-                value=raw_value,
+                value=value,
             )
         except LookupError:
             self._raise_setting_value_error(
                 setting_name=setting_name,
+                failure_cache_key=failure_cache_key,
                 user_value_error_class=OverrideValueNotImportable,
                 default_value_error_class=DefaultValueNotImportable,
                 additional_text=(
                     "The model '{value}' does not appear to be installed."
                 ),
-                value=raw_value
+                value=value
             )
 
     def get_module(self, setting_name, warn_only_if_overridden=False,
                    accept_deprecated='', suppress_warnings=False,
-                   warning_stacklevel=3):
+                   check_if_setting_deprecated=True, warning_stacklevel=3):
         """
         Returns a Python module referenced by an app setting where the value is
         expected to be a valid, absolute Python import path, defined as a
@@ -601,6 +1326,13 @@ class BaseAppSettingsHelper:
             might otherwise be raised. It may be more useful to use
             ``warn_only_if_overridden`` instead.
         :type suppress_warnings: bool
+        :param check_if_setting_deprecated:
+            Can be used to disable the check that usually happens at the
+            beginning of the method to identify whether the setting named by
+            ``setting_name`` is deprecated, and conditionally raise a warning.
+            This can help to improve efficiency where the same check has
+            already been made.
+        :type check_if_setting_deprecated: bool
         :param warning_stacklevel:
             When raising deprecation warnings related to the request, this
             value is passed on as ``stacklevel`` to Python's
@@ -620,13 +1352,17 @@ class BaseAppSettingsHelper:
             appsettingshelper.get_module('SETTING_NAME')
 
         """
-        self._warn_if_deprecated_setting_value_requested(
-            setting_name, warn_only_if_overridden, suppress_warnings,
-            warning_stacklevel)
+        if check_if_setting_deprecated:
+            self._warn_if_deprecated_setting_value_requested(
+                setting_name, warn_only_if_overridden, suppress_warnings,
+                warning_stacklevel)
 
         cache_key = self._make_cache_key(setting_name, accept_deprecated)
         if cache_key in self._modules_cache:
             return self._modules_cache[cache_key]
+        failure_cache_key = ('module', cache_key)
+        if failure_cache_key in self._failures_cache:
+            self._raise_cached_failure(failure_cache_key)
 
         raw_value = self.get(
             setting_name,
@@ -638,13 +1374,24 @@ class BaseAppSettingsHelper:
             warning_stacklevel=warning_stacklevel + 1,
         )
 
+        result = self._import_module(setting_name, raw_value, failure_cache_key)
+        self._modules_cache[cache_key] = result
+        return result
+
+    def _import_module(self, setting_name, value, failure_cache_key=None):
+        """
+        Returns the Python module identified by the import path ``value``
+        (which should be the value of the setting named by ``setting_name``),
+        raising a suitable error if it cannot be imported.
+        """
+        if self._resolution_logs:
+            self._record_resolution('module', setting_name)
         try:
-            result = self._do_import(raw_value)
-            self._modules_cache[cache_key] = result
-            return result
+            return self._do_import(value)
         except ImportError:
             self._raise_setting_value_error(
                 setting_name=setting_name,
+                failure_cache_key=failure_cache_key,
                 user_value_error_class=OverrideValueNotImportable,
                 default_value_error_class=DefaultValueNotImportable,
                 additional_text=(
@@ -652,12 +1399,12 @@ class BaseAppSettingsHelper:
                     "Please use a full (not relative) import path in the "
                     "format: 'project.app.module'."
                 ),
-                value=raw_value
+                value=value
             )
 
     def get_object(self, setting_name, warn_only_if_overridden=False,
                    accept_deprecated='', suppress_warnings=False,
-                   warning_stacklevel=3):
+                   check_if_setting_deprecated=True, warning_stacklevel=3):
         """
         Returns a python class, method, or other object referenced by an app
         setting where the value is expected to be a valid, absolute Python
@@ -688,6 +1435,13 @@ class BaseAppSettingsHelper:
             might otherwise be raised. It may be more useful to use
             ``warn_only_if_overridden`` instead.
         :type suppress_warnings: bool
+        :param check_if_setting_deprecated:
+            Can be used to disable the check that usually happens at the
+            beginning of the method to identify whether the setting named by
+            ``setting_name`` is deprecated, and conditionally raise a warning.
+            This can help to improve efficiency where the same check has
+            already been made.
+        :type check_if_setting_deprecated: bool
         :param warning_stacklevel:
             When raising deprecation warnings related to the request, this
             value is passed on as ``stacklevel`` to Python's
@@ -707,13 +1461,17 @@ class BaseAppSettingsHelper:
             appsettingshelper.get_object('SETTING_NAME')
 
         """
-        self._warn_if_deprecated_setting_value_requested(
-            setting_name, warn_only_if_overridden, suppress_warnings,
-            warning_stacklevel)
+        if check_if_setting_deprecated:
+            self._warn_if_deprecated_setting_value_requested(
+                setting_name, warn_only_if_overridden, suppress_warnings,
+                warning_stacklevel)
 
         cache_key = self._make_cache_key(setting_name, accept_deprecated)
         if cache_key in self._objects_cache:
             return self._objects_cache[cache_key]
+        failure_cache_key = ('object', cache_key)
+        if failure_cache_key in self._failures_cache:
+            self._raise_cached_failure(failure_cache_key)
 
         raw_value = self.get(
             setting_name,
@@ -724,11 +1482,25 @@ class BaseAppSettingsHelper:
             suppress_warnings=suppress_warnings,
             warning_stacklevel=warning_stacklevel + 1,
         )
+        result = self._import_object(setting_name, raw_value, failure_cache_key)
+        self._objects_cache[cache_key] = result
+        return result
+
+    def _import_object(self, setting_name, value, failure_cache_key=None):
+        """
+        Returns the object identified by the 'object import path' ``value``
+        (which should be the value of the setting named by ``setting_name``),
+        raising a suitable error if it is incorrectly formatted or cannot be
+        imported.
+        """
+        if self._resolution_logs:
+            self._record_resolution('object', setting_name)
         try:
-            module_path, object_name = raw_value.rsplit(".", 1)
+            module_path, object_name = value.rsplit(".", 1)
         except ValueError:
             self._raise_setting_value_error(
                 setting_name=setting_name,
+                failure_cache_key=failure_cache_key,
                 user_value_error_class=OverrideValueFormatInvalid,
                 default_value_error_class=DefaultValueFormatInvalid,
                 additional_text=(
@@ -736,15 +1508,14 @@ class BaseAppSettingsHelper:
                     "a full (not relative) import path with the object name "
                     "at the end, for example: 'project.app.module.object'."
                 ),
-                value=raw_value
+                value=value
             )
         try:
-            result = getattr(self._do_import(module_path), object_name)
-            self._objects_cache[cache_key] = result
-            return result
+            return getattr(self._do_import(module_path), object_name)
         except ImportError:
             self._raise_setting_value_error(
                 setting_name=setting_name,
+                failure_cache_key=failure_cache_key,
                 user_value_error_class=OverrideValueNotImportable,
                 default_value_error_class=DefaultValueNotImportable,
                 additional_text=(
@@ -758,6 +1529,7 @@ class BaseAppSettingsHelper:
         except AttributeError:
             self._raise_setting_value_error(
                 setting_name=setting_name,
+                failure_cache_key=failure_cache_key,
                 user_value_error_class=OverrideValueNotImportable,
                 default_value_error_class=DefaultValueNotImportable,
                 additional_text=(
@@ -768,36 +1540,1299 @@ class BaseAppSettingsHelper:
                 object_name=object_name,
             )
 
-    def is_value_from_deprecated_setting(self, setting_name, deprecated_setting_name):
+    def get_callable(self, setting_name, warn_only_if_overridden=False,
+                     accept_deprecated='', suppress_warnings=False,
+                     warning_stacklevel=3):
         """
-        Helps developers to determine where the settings helper got it's value
-        from when dealing with settings that replace deprecated settings.
+        Returns a ``CallableInfo`` (from ``cogwheels.utils.inspection``) for
+        a function, class or other callable referenced by an app setting (see
+        ``get_object()``), which can be called in the same way as the
+        original object. The object's signature is analysed once, and the
+        results are cached along with it, so that apps can cheaply check
+        which arguments are supported before each call. For example::
+
+            handler = appsettingshelper.get_callable('HANDLER_FUNCTION')
+            if handler.accepts_kwarg('request'):
+                handler(value, request=request)
+            else:
+                handler(value)
 
-        Returns ``True`` when the new setting (with the name ``setting_name``)
-        is a replacement for a deprecated setting (with the name
-        ``deprecated_setting_name``) and the user is using the deprecated
-        setting in their Django settings to override behaviour.
+            # Or, to simply ignore unsupported keyword arguments
+            handler.call_with_supported_kwargs(value, request=request)
+
+        The remaining arguments behave as they do for ``get_object()``.
+
+        :raises:
+            UnknownSettingNameError, SettingValueTypeInvalid,
+            SettingValueFormatInvalid, SettingValueNotImportable
         """
-        if not self.in_defaults(setting_name):
-            self._raise_invalid_setting_name_error(setting_name)
-        if not self.in_defaults(deprecated_setting_name):
-            self._raise_invalid_setting_name_error(deprecated_setting_name)
-        if deprecated_setting_name not in self._deprecated_settings:
-            raise ValueError(
-                "The '%s' setting is not deprecated. When using "
-                "settings.is_value_from_deprecated_setting(), the deprecated "
-                "setting name should be supplied as the second argument." %
-                deprecated_setting_name
+        self._warn_if_deprecated_setting_value_requested(
+            setting_name, warn_only_if_overridden, suppress_warnings,
+            warning_stacklevel)
+
+        cache_key = self._make_cache_key(setting_name, accept_deprecated)
+        try:
+            return self._callables_cache[cache_key]
+        except KeyError:
+            pass
+
+        obj = self.get_object(
+            setting_name,
+            accept_deprecated=accept_deprecated,
+            check_if_setting_deprecated=False,
+            warn_only_if_overridden=warn_only_if_overridden,
+            suppress_warnings=suppress_warnings,
+            warning_stacklevel=warning_stacklevel + 1,
+        )
+        if not callable(obj):
+            self._raise_setting_value_error(
+                setting_name=setting_name,
+                user_value_error_class=OverrideValueTypeInvalid,
+                default_value_error_class=DefaultValueTypeInvalid,
+                additional_text=(
+                    "The value is expected to reference a callable object, "
+                    "but an object of type '{current_type}' was found."
+                ),
+                current_type=type(obj).__name__,
             )
-        if(
-            not self.is_overridden(setting_name) and
-            setting_name in self._replacement_settings
-        ):
-            deprecations = self._replacement_settings[setting_name]
-            for item in deprecations:
-                if(
-                    item.setting_name == deprecated_setting_name and
-                    self.is_overridden(item.setting_name)
-                ):
-                    return True
-        return False
+        result = CallableInfo(obj)
+        self._callables_cache[cache_key] = result
+        return result
+
+    def get_regex(self, setting_name, flags=0, warn_only_if_overridden=False,
+                  accept_deprecated='', suppress_warnings=False,
+                  warning_stacklevel=3):
+        """
+        Returns a compiled regular expression for an app setting where the
+        value is expected to be a regular expression pattern string. Patterns
+        are compiled once for each unique combination of setting and
+        ``flags``, and cached, so there is no reliance on the ``re`` module's
+        own (limited) cache.
+
+        Values that are already compiled regular expressions are returned
+        as they are (provided no ``flags`` are specified).
+
+        :param flags:
+            Passed to ``re.compile()`` when compiling the pattern.
+        :type flags: int (e.g. ``re.IGNORECASE``)
+        :raises:
+            UnknownSettingNameError, SettingValueTypeInvalid,
+            SettingValueFormatInvalid
+
+        The remaining arguments behave as they do for ``get()``. Instead of
+        calling this method directly, developers can use the ``regexes``
+        attribute shortcut to request values with the default options. For
+        example, the following lines are equivalent::
+
+            appsettingshelper.regexes.SETTING_NAME
+            appsettingshelper.get_regex('SETTING_NAME')
+        """
+        self._warn_if_deprecated_setting_value_requested(
+            setting_name, warn_only_if_overridden, suppress_warnings,
+            warning_stacklevel)
+
+        regex_cache_key = (flags, self._make_cache_key(setting_name, accept_deprecated))
+        try:
+            return self._regexes_cache[regex_cache_key]
+        except KeyError:
+            pass
+
+        raw_value = self.get(
+            setting_name,
+            enforce_type=(str, PATTERN_TYPE),
+            accept_deprecated=accept_deprecated,
+            check_if_setting_deprecated=False,
+            warn_only_if_overridden=warn_only_if_overridden,
+            suppress_warnings=suppress_warnings,
+            warning_stacklevel=warning_stacklevel + 1,
+        )
+        try:
+            result = re.compile(raw_value, flags)
+        except (re.error, ValueError) as e:
+            # ValueError is raised when combining flags with compiled patterns
+            self._raise_setting_value_error(
+                setting_name=setting_name,
+                user_value_error_class=OverrideValueFormatInvalid,
+                default_value_error_class=DefaultValueFormatInvalid,
+                additional_text=(
+                    "{value!r} is not a valid regular expression: {error}."
+                ),
+                value=raw_value,
+                error=e,
+            )
+        self._regexes_cache[regex_cache_key] = result
+        return result
+
+    def get_instance(self, setting_name, *args, warn_only_if_overridden=False,
+                     suppress_warnings=False, warning_stacklevel=3, **kwargs):
+        """
+        Returns an instance of the class (or the result of calling the
+        function) referenced by an app setting, created by passing ``args``
+        and ``kwargs``. The instance is only created once for each unique
+        combination of ``args`` and ``kwargs`` (which must be hashable), and
+        shared by subsequent calls, until the caches are reset.
+
+        The setting value can be an 'object import path' string (see
+        ``get_object()``), or a dictionary with a ``'path'`` key for the
+        import path, and an optional ``'options'`` dictionary of keyword
+        arguments to use when creating the instance. For example::
+
+            BACKEND = {
+                'path': 'yourproject.backends.DefaultBackend',
+                'options': {'timeout': 10},
+            }
+
+        Any ``kwargs`` take precedence over values in ``'options'``.
+        ``warn_only_if_overridden``, ``suppress_warnings`` and
+        ``warning_stacklevel`` behave as they do for ``get()`` (so cannot be
+        used as keyword arguments for the instance).
+
+        :raises:
+            UnknownSettingNameError, SettingValueTypeInvalid,
+            SettingValueFormatInvalid, SettingValueNotImportable
+        """
+        self._warn_if_deprecated_setting_value_requested(
+            setting_name,
+            warn_only_if_overridden=warn_only_if_overridden,
+            suppress_warnings=suppress_warnings,
+            warning_stacklevel=warning_stacklevel,
+        )
+
+        instance_key = (setting_name, args, tuple(sorted(kwargs.items())))
+        try:
+            return self._instances_cache[instance_key]
+        except KeyError:
+            pass
+
+        with self._instances_lock:
+            # Another thread may have created the instance while waiting
+            instances_cache = self._instances_cache
+            if instance_key in instances_cache:
+                return instances_cache[instance_key]
+            factory, options = self._get_instance_factory(
+                setting_name,
+                warn_only_if_overridden=warn_only_if_overridden,
+                suppress_warnings=suppress_warnings,
+                warning_stacklevel=warning_stacklevel + 2,
+            )
+            if options:
+                kwargs = dict(options, **kwargs)
+            if self._resolution_logs:
+                self._record_resolution('instance', setting_name)
+            result = factory(*args, **kwargs)
+            instances_cache[instance_key] = result
+            return result
+
+    def _get_instance_factory(self, setting_name, warn_only_if_overridden=False,
+                              suppress_warnings=False, warning_stacklevel=5):
+        """
+        Used by ``get_instance()`` to return the class or function referenced
+        by the setting named by ``setting_name``, along with any 'options'
+        specified in the setting value.
+        """
+        raw_value = self.get(
+            setting_name,
+            enforce_type=(str, dict),
+            check_if_setting_deprecated=False,
+            warn_only_if_overridden=warn_only_if_overridden,
+            suppress_warnings=suppress_warnings,
+            warning_stacklevel=warning_stacklevel,
+        )
+        if isinstance(raw_value, str):
+            return self.get_object(
+                setting_name, check_if_setting_deprecated=False,
+                warn_only_if_overridden=warn_only_if_overridden,
+                suppress_warnings=suppress_warnings,
+                warning_stacklevel=warning_stacklevel,
+            ), {}
+        path = raw_value.get('path')
+        options = raw_value.get('options', {})
+        if not isinstance(path, str) or not isinstance(options, Mapping):
+            self._raise_setting_value_error(
+                setting_name=setting_name,
+                user_value_error_class=OverrideValueFormatInvalid,
+                default_value_error_class=DefaultValueFormatInvalid,
+                additional_text=(
+                    "Dictionary values should include a 'path' string, and "
+                    "may include an 'options' dictionary, which {value} does "
+                    "not adhere to."
+                ),
+                value=raw_value,
+            )
+        return self._import_object(setting_name, path), options
+
+    def _get_list(self, kind, importer, setting_name, max_workers=None,
+                  warn_only_if_overridden=False, accept_deprecated='',
+                  suppress_warnings=False, warning_stacklevel=4):
+        """
+        get_models(), get_modules() and get_objects() must all resolve every
+        item in a list or tuple of import paths. This method allows the helper
+        to do that in a DRY/consistent way, using ``importer`` to resolve each
+        item.
+
+        Every item is attempted, and any problems found are reported together
+        in a single error (which is also saved to the 'failures' cache), so
+        that all of them can be fixed at once. If ``max_workers`` is greater
+        than ``1``, items are resolved in parallel, using a thread pool of
+        that size.
+        """
+        cache_key = self._make_cache_key(setting_name, accept_deprecated)
+        list_cache_key = (kind, cache_key)
+        if list_cache_key in self._lists_cache:
+            return self._lists_cache[list_cache_key]
+        if list_cache_key in self._failures_cache:
+            self._raise_cached_failure(list_cache_key)
+
+        raw_value = self.get(
+            setting_name,
+            enforce_type=(list, tuple),
+            accept_deprecated=accept_deprecated,
+            check_if_setting_deprecated=False,
+            warn_only_if_overridden=warn_only_if_overridden,
+            suppress_warnings=suppress_warnings,
+            warning_stacklevel=warning_stacklevel + 1,
+        )
+
+        def resolve(value):
+            try:
+                if not isinstance(value, str):
+                    raise self._make_setting_value_error(
+                        setting_name,
+                        user_value_error_class=OverrideValueTypeInvalid,
+                        default_value_error_class=DefaultValueTypeInvalid,
+                        additional_text=(
+                            "Items are expected to be a 'str', but a value of "
+                            "type '{current_type}' was found."
+                        ),
+                        current_type=type(value).__name__,
+                    )
+                return importer(setting_name, value), None
+            except SettingValueError as e:
+                return None, e
+
+        if max_workers and max_workers > 1 and len(raw_value) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(resolve, raw_value))
+        else:
+            outcomes = [resolve(value) for value in raw_value]
+
+        errors = [
+            (index, error) for index, (result, error) in enumerate(outcomes)
+            if error is not None
+        ]
+        if errors:
+            self._raise_list_items_error(
+                setting_name, raw_value, errors, list_cache_key)
+
+        result = tuple(result for result, error in outcomes)
+        self._lists_cache[list_cache_key] = result
+        return result
+
+    def _raise_list_items_error(self, setting_name, raw_value, errors,
+                                failure_cache_key):
+        """
+        Raises a single error to report all of the problems found by
+        ``_get_list()`` with the items in ``raw_value``. Where all of the
+        items failed for the same reason, an error of the same class is
+        raised. Otherwise, a more general ``OverrideValueError`` or
+        ``DefaultValueError`` is raised.
+        """
+        error_classes = set(type(error) for index, error in errors)
+        if len(error_classes) == 1:
+            user_value_error_class = default_value_error_class = error_classes.pop()
+        else:
+            user_value_error_class = OverrideValueError
+            default_value_error_class = DefaultValueError
+        self._raise_setting_value_error(
+            setting_name=setting_name,
+            failure_cache_key=failure_cache_key,
+            user_value_error_class=user_value_error_class,
+            default_value_error_class=default_value_error_class,
+            additional_text="{count} of the {total} items could not be used. {details}",
+            count=len(errors),
+            total=len(raw_value),
+            details=' '.join(
+                'Item {index} ({value!r}): {detail}'.format(
+                    index=index, value=raw_value[index], detail=error.detail)
+                for index, error in errors
+            ),
+        )
+
+    def _get_converted_value(self, cache, kind, converter, setting_name,
+                             warn_only_if_overridden=False,
+                             accept_deprecated='', suppress_warnings=False,
+                             warning_stacklevel=4):
+        """
+        get_choices_map(), get_timedelta() and other similar methods must all
+        convert a setting value into something else, which is then saved to
+        ``cache`` until the setting is changed. This method allows the helper
+        to do that in a DRY/consistent way, using ``converter`` to convert the
+        setting value.
+        """
+        cache_key = self._make_cache_key(setting_name, accept_deprecated)
+        converted_cache_key = (kind, cache_key)
+        try:
+            return cache[converted_cache_key]
+        except KeyError:
+            pass
+
+        raw_value = self.get(
+            setting_name,
+            accept_deprecated=accept_deprecated,
+            check_if_setting_deprecated=False,
+            warn_only_if_overridden=warn_only_if_overridden,
+            suppress_warnings=suppress_warnings,
+            warning_stacklevel=warning_stacklevel + 1,
+        )
+        result = converter(setting_name, raw_value)
+        cache[converted_cache_key] = result
+        return result
+
+    def _build_choices_map(self, setting_name, value):
+        """
+        Used by ``get_choices_map()`` to create a read-only mapping of values
+        to labels from ``value``, which should be a sequence of
+        ``(value, label)`` pairs (or named groups of pairs, as supported by
+        the ``choices`` option for Django model fields).
+        """
+        choices = {}
+        try:
+            for item_value, label in value:
+                if isinstance(label, (list, tuple)):
+                    # Choices are grouped under a heading
+                    for group_value, group_label in label:
+                        choices[group_value] = group_label
+                else:
+                    choices[item_value] = label
+        except (TypeError, ValueError):
+            self._raise_setting_value_error(
+                setting_name=setting_name,
+                user_value_error_class=OverrideValueFormatInvalid,
+                default_value_error_class=DefaultValueFormatInvalid,
+                additional_text=(
+                    "The value is expected to be a sequence of "
+                    "(value, label) pairs, which {value!r} does not adhere "
+                    "to."
+                ),
+                value=value,
+            )
+        return MappingProxyType(choices)
+
+    def _build_reverse_choices_map(self, setting_name, value):
+        """
+        Used by ``get_reverse_choices_map()`` to create a read-only mapping
+        of labels to values from ``value``.
+        """
+        choices_map = self._build_choices_map(setting_name, value)
+        return MappingProxyType({
+            label: item_value for item_value, label in choices_map.items()
+        })
+
+    def _build_frozenset(self, setting_name, value):
+        """
+        Used by ``get_frozenset()`` to create a ``frozenset`` of the items in
+        ``value``. Strings are rejected, rather than being split into a set
+        of characters.
+        """
+        try:
+            if isinstance(value, (str, bytes)):
+                raise TypeError
+            return frozenset(value)
+        except TypeError:
+            self._raise_setting_value_error(
+                setting_name=setting_name,
+                user_value_error_class=OverrideValueTypeInvalid,
+                default_value_error_class=DefaultValueTypeInvalid,
+                additional_text=(
+                    "The value is expected to be a sequence of hashable "
+                    "items, which {value!r} is not."
+                ),
+                value=value,
+            )
+
+    def get_choices_map(self, setting_name, warn_only_if_overridden=False,
+                        accept_deprecated='', suppress_warnings=False,
+                        warning_stacklevel=3):
+        """
+        Returns a read-only mapping of values to labels for an app setting
+        where the value is a sequence of ``(value, label)`` pairs, like the
+        ``choices`` option for Django model fields (named groups of choices
+        are also supported). For example::
+
+            label = appsettingshelper.get_choices_map('STATUS_CHOICES')[value]
+
+        The mapping is created once and cached, making lookups much quicker
+        than scanning the sequence each time. The remaining arguments behave
+        as they do for ``get()``.
+
+        :raises: UnknownSettingNameError, SettingValueFormatInvalid
+        """
+        self._warn_if_deprecated_setting_value_requested(
+            setting_name, warn_only_if_overridden, suppress_warnings,
+            warning_stacklevel)
+        return self._get_converted_value(
+            self._indexes_cache, 'choices_map', self._build_choices_map, setting_name,
+            warn_only_if_overridden=warn_only_if_overridden,
+            accept_deprecated=accept_deprecated,
+            suppress_warnings=suppress_warnings,
+            warning_stacklevel=warning_stacklevel + 1,
+        )
+
+    def get_reverse_choices_map(self, setting_name,
+                                warn_only_if_overridden=False,
+                                accept_deprecated='', suppress_warnings=False,
+                                warning_stacklevel=3):
+        """
+        As ``get_choices_map()``, but returns a read-only mapping of labels
+        to values.
+        """
+        self._warn_if_deprecated_setting_value_requested(
+            setting_name, warn_only_if_overridden, suppress_warnings,
+            warning_stacklevel)
+        return self._get_converted_value(
+            self._indexes_cache, 'reverse_choices_map',
+            self._build_reverse_choices_map, setting_name,
+            warn_only_if_overridden=warn_only_if_overridden,
+            accept_deprecated=accept_deprecated,
+            suppress_warnings=suppress_warnings,
+            warning_stacklevel=warning_stacklevel + 1,
+        )
+
+    def get_frozenset(self, setting_name, warn_only_if_overridden=False,
+                      accept_deprecated='', suppress_warnings=False,
+                      warning_stacklevel=3):
+        """
+        Returns a ``frozenset`` of the items in an app setting value (e.g. a
+        list or tuple), which is created once and cached, making membership
+        checks much quicker than scanning the sequence each time. The
+        remaining arguments behave as they do for ``get()``.
+
+        :raises: UnknownSettingNameError, SettingValueTypeInvalid
+        """
+        self._warn_if_deprecated_setting_value_requested(
+            setting_name, warn_only_if_overridden, suppress_warnings,
+            warning_stacklevel)
+        return self._get_converted_value(
+            self._indexes_cache, 'frozenset', self._build_frozenset, setting_name,
+            warn_only_if_overridden=warn_only_if_overridden,
+            accept_deprecated=accept_deprecated,
+            suppress_warnings=suppress_warnings,
+            warning_stacklevel=warning_stacklevel + 1,
+        )
+
+    def _parse_units(self, parser, setting_name, value):
+        """
+        Returns the result of parsing ``value`` (the value of the setting
+        named by ``setting_name``) with ``parser`` (one of the functions from
+        ``cogwheels.helpers.units``), raising suitable errors for values that
+        cannot be parsed.
+        """
+        try:
+            return parser(value)
+        except TypeError as e:
+            self._raise_setting_value_error(
+                setting_name=setting_name,
+                user_value_error_class=OverrideValueTypeInvalid,
+                default_value_error_class=DefaultValueTypeInvalid,
+                additional_text="{error}",
+                error=e,
+            )
+        except ValueError as e:
+            self._raise_setting_value_error(
+                setting_name=setting_name,
+                user_value_error_class=OverrideValueFormatInvalid,
+                default_value_error_class=DefaultValueFormatInvalid,
+                additional_text="{error}",
+                error=e,
+            )
+
+    def _convert_to_timedelta(self, setting_name, value):
+        return self._parse_units(parse_duration, setting_name, value)
+
+    def _convert_to_seconds(self, setting_name, value):
+        return self._parse_units(parse_duration, setting_name, value).total_seconds()
+
+    def _convert_to_bytes(self, setting_name, value):
+        return self._parse_units(parse_bytes, setting_name, value)
+
+    def _convert_to_rate(self, setting_name, value):
+        return self._parse_units(parse_rate, setting_name, value)
+
+    def get_timedelta(self, setting_name, warn_only_if_overridden=False,
+                      accept_deprecated='', suppress_warnings=False,
+                      warning_stacklevel=3):
+        """
+        Returns a ``timedelta`` for an app setting where the value is a
+        duration, specified as a number of seconds, or a string made up of
+        numbers with units (e.g. ``"30s"``, ``"5m"`` or ``"1h 30m"``). See
+        ``units.parse_duration()`` for further details.
+
+        Values are parsed once and cached until the setting is changed. The
+        remaining arguments behave as they do for ``get()``.
+
+        :raises:
+            UnknownSettingNameError, SettingValueTypeInvalid,
+            SettingValueFormatInvalid
+        """
+        self._warn_if_deprecated_setting_value_requested(
+            setting_name, warn_only_if_overridden, suppress_warnings,
+            warning_stacklevel)
+        return self._get_converted_value(
+            self._units_cache, 'timedelta', self._convert_to_timedelta,
+            setting_name,
+            warn_only_if_overridden=warn_only_if_overridden,
+            accept_deprecated=accept_deprecated,
+            suppress_warnings=suppress_warnings,
+            warning_stacklevel=warning_stacklevel + 1,
+        )
+
+    def get_seconds(self, setting_name, warn_only_if_overridden=False,
+                    accept_deprecated='', suppress_warnings=False,
+                    warning_stacklevel=3):
+        """
+        As ``get_timedelta()``, but returns the duration as a number of
+        seconds (a ``float``).
+        """
+        self._warn_if_deprecated_setting_value_requested(
+            setting_name, warn_only_if_overridden, suppress_warnings,
+            warning_stacklevel)
+        return self._get_converted_value(
+            self._units_cache, 'seconds', self._convert_to_seconds,
+            setting_name,
+            warn_only_if_overridden=warn_only_if_overridden,
+            accept_deprecated=accept_deprecated,
+            suppress_warnings=suppress_warnings,
+            warning_stacklevel=warning_stacklevel + 1,
+        )
+
+    def get_bytes(self, setting_name, warn_only_if_overridden=False,
+                  accept_deprecated='', suppress_warnings=False,
+                  warning_stacklevel=3):
+        """
+        Returns a whole number of bytes for an app setting where the value is
+        a size, specified as a number, or a string made up of a number and a
+        unit (e.g. ``"10MB"`` or ``"1.5GiB"``). See ``units.parse_bytes()``
+        for further details.
+
+        Values are parsed once and cached until the setting is changed. The
+        remaining arguments behave as they do for ``get()``.
+
+        :raises:
+            UnknownSettingNameError, SettingValueTypeInvalid,
+            SettingValueFormatInvalid
+        """
+        self._warn_if_deprecated_setting_value_requested(
+            setting_name, warn_only_if_overridden, suppress_warnings,
+            warning_stacklevel)
+        return self._get_converted_value(
+            self._units_cache, 'bytes', self._convert_to_bytes,
+            setting_name,
+            warn_only_if_overridden=warn_only_if_overridden,
+            accept_deprecated=accept_deprecated,
+            suppress_warnings=suppress_warnings,
+            warning_stacklevel=warning_stacklevel + 1,
+        )
+
+    def get_rate(self, setting_name, warn_only_if_overridden=False,
+                 accept_deprecated='', suppress_warnings=False,
+                 warning_stacklevel=3):
+        """
+        Returns a ``units.Rate`` (a named tuple of ``count`` and ``seconds``)
+        for an app setting where the value is a string made up of a number of
+        events and a period of time, separated by a slash (e.g.
+        ``"100/min"`` or ``"1000/5m"``). See ``units.parse_rate()`` for
+        further details.
+
+        Values are parsed once and cached until the setting is changed. The
+        remaining arguments behave as they do for ``get()``.
+
+        :raises:
+            UnknownSettingNameError, SettingValueTypeInvalid,
+            SettingValueFormatInvalid
+        """
+        self._warn_if_deprecated_setting_value_requested(
+            setting_name, warn_only_if_overridden, suppress_warnings,
+            warning_stacklevel)
+        return self._get_converted_value(
+            self._units_cache, 'rate', self._convert_to_rate,
+            setting_name,
+            warn_only_if_overridden=warn_only_if_overridden,
+            accept_deprecated=accept_deprecated,
+            suppress_warnings=suppress_warnings,
+            warning_stacklevel=warning_stacklevel + 1,
+        )
+
+    def get_models(self, setting_name, max_workers=None,
+                   warn_only_if_overridden=False, accept_deprecated='',
+                   suppress_warnings=False, warning_stacklevel=3):
+        """
+        Returns a tuple of Django models referenced by an app setting where
+        the value is expected to be a list or tuple of 'model strings' (see
+        ``get_model()`` for further details). The tuple is cached, so the
+        models are only looked up once.
+
+        :param max_workers:
+            If greater than ``1``, items are resolved in parallel, using a
+            thread pool of this size.
+        :type max_workers: int
+        :raises:
+            UnknownSettingNameError, SettingValueTypeInvalid,
+            SettingValueFormatInvalid, SettingValueNotImportable
+
+        Problems with individual items are reported together in a single
+        error. The remaining arguments behave as they do for ``get_model()``.
+        """
+        self._warn_if_deprecated_setting_value_requested(
+            setting_name, warn_only_if_overridden, suppress_warnings,
+            warning_stacklevel)
+        return self._get_list(
+            'models', self._import_model, setting_name,
+            max_workers=max_workers,
+            warn_only_if_overridden=warn_only_if_overridden,
+            accept_deprecated=accept_deprecated,
+            suppress_warnings=suppress_warnings,
+            warning_stacklevel=warning_stacklevel + 1,
+        )
+
+    def get_modules(self, setting_name, max_workers=None,
+                    warn_only_if_overridden=False, accept_deprecated='',
+                    suppress_warnings=False, warning_stacklevel=3):
+        """
+        As ``get_models()``, but returns a tuple of Python modules referenced
+        by a list or tuple of import paths (see ``get_module()`` for further
+        details).
+        """
+        self._warn_if_deprecated_setting_value_requested(
+            setting_name, warn_only_if_overridden, suppress_warnings,
+            warning_stacklevel)
+        return self._get_list(
+            'modules', self._import_module, setting_name,
+            max_workers=max_workers,
+            warn_only_if_overridden=warn_only_if_overridden,
+            accept_deprecated=accept_deprecated,
+            suppress_warnings=suppress_warnings,
+            warning_stacklevel=warning_stacklevel + 1,
+        )
+
+    def get_objects(self, setting_name, max_workers=None,
+                    warn_only_if_overridden=False, accept_deprecated='',
+                    suppress_warnings=False, warning_stacklevel=3):
+        """
+        As ``get_models()``, but returns a tuple of Python classes, methods or
+        other objects referenced by a list or tuple of 'object import paths'
+        (see ``get_object()`` for further details). For example::
+
+            PIPELINE = (
+                'yourproject.pipeline.clean',
+                'yourproject.pipeline.save',
+            )
+        """
+        self._warn_if_deprecated_setting_value_requested(
+            setting_name, warn_only_if_overridden, suppress_warnings,
+            warning_stacklevel)
+        return self._get_list(
+            'objects', self._import_object, setting_name,
+            max_workers=max_workers,
+            warn_only_if_overridden=warn_only_if_overridden,
+            accept_deprecated=accept_deprecated,
+            suppress_warnings=suppress_warnings,
+            warning_stacklevel=warning_stacklevel + 1,
+        )
+
+    def _get_many(self, getter, setting_names, as_tuple=False,
+                  warn_only_if_overridden=False, accept_deprecated=None,
+                  suppress_warnings=False, warning_stacklevel=4,
+                  **getter_kwargs):
+        """
+        get_many(), get_many_models(), get_many_modules() and
+        get_many_objects() must all resolve several values in one pass. This
+        method allows the helper to do that in a DRY/consistent way.
+
+        Setting names are validated and checked for deprecation up front (once
+        for each unique name), before any values are resolved. If the caches
+        are reset part way through resolving values (e.g. by a
+        ``setting_changed`` signal), the batch is resolved again, so that all
+        returned values are from the same cache generation.
+        """
+        setting_names = tuple(setting_names)
+        unique_names = tuple(OrderedDict.fromkeys(setting_names))
+        accept_deprecated = accept_deprecated or {}
+
+        for setting_name in unique_names:
+            if not self.in_defaults(setting_name):
+                self._raise_invalid_setting_name_error(setting_name)
+
+        for setting_name in unique_names:
+            self._warn_if_deprecated_setting_value_requested(
+                setting_name, warn_only_if_overridden, suppress_warnings,
+                warning_stacklevel)
+
+        while True:
+            generation = self._cache_generation
+            values = {}
+            for setting_name in unique_names:
+                values[setting_name] = getter(
+                    setting_name,
+                    warn_only_if_overridden=warn_only_if_overridden,
+                    accept_deprecated=accept_deprecated.get(setting_name, ''),
+                    suppress_warnings=suppress_warnings,
+                    check_if_setting_deprecated=False,
+                    warning_stacklevel=warning_stacklevel + 1,
+                    **getter_kwargs
+                )
+            if generation == self._cache_generation:
+                break
+
+        if as_tuple:
+            return tuple(values[setting_name] for setting_name in setting_names)
+        return values
+
+    def get_many(self, setting_names, as_tuple=False,
+                 warn_only_if_overridden=False, accept_deprecated=None,
+                 suppress_warnings=False, enforce_type=None,
+                 warning_stacklevel=3):
+        """
+        Returns values for several settings in a single call, as a dictionary
+        keyed by setting name (or as a tuple, in the same order as
+        ``setting_names``, if ``as_tuple`` is ``True``).
+
+        Equivalent to calling ``get()`` for each setting name, except that
+        deprecation warnings are raised once for each deprecated setting in
+        the batch, and all values are resolved within a single cache
+        generation.
+
+        :param setting_names:
+            The names of the app settings for which values are required.
+        :type setting_names: iterable of str
+        :param as_tuple:
+            Return a tuple of values instead of a dictionary. Handy for
+            unpacking values straight into variables.
+        :type as_tuple: bool
+        :param accept_deprecated:
+            An optional dictionary mapping setting names to the name of the
+            deprecated setting that should be accepted as an override value
+            for each (see ``get()`` for further details).
+        :type accept_deprecated: dict
+        :raises: UnknownSettingNameError, SettingValueTypeInvalid
+
+        ``warn_only_if_overridden``, ``suppress_warnings``, ``enforce_type``
+        and ``warning_stacklevel`` are applied to every requested setting, and
+        behave as they do for ``get()``.
+        """
+        return self._get_many(
+            self.get, setting_names,
+            as_tuple=as_tuple,
+            warn_only_if_overridden=warn_only_if_overridden,
+            accept_deprecated=accept_deprecated,
+            suppress_warnings=suppress_warnings,
+            enforce_type=enforce_type,
+            warning_stacklevel=warning_stacklevel + 1,
+        )
+
+    def get_many_models(self, setting_names, as_tuple=False,
+                        warn_only_if_overridden=False, accept_deprecated=None,
+                        suppress_warnings=False, warning_stacklevel=3):
+        """
+        As ``get_many()``, but returns Django models referenced by the
+        requested settings (see ``get_model()`` for further details).
+        """
+        return self._get_many(
+            self.get_model, setting_names,
+            as_tuple=as_tuple,
+            warn_only_if_overridden=warn_only_if_overridden,
+            accept_deprecated=accept_deprecated,
+            suppress_warnings=suppress_warnings,
+            warning_stacklevel=warning_stacklevel + 1,
+        )
+
+    def get_many_modules(self, setting_names, as_tuple=False,
+                         warn_only_if_overridden=False, accept_deprecated=None,
+                         suppress_warnings=False, warning_stacklevel=3):
+        """
+        As ``get_many()``, but returns Python modules referenced by the
+        requested settings (see ``get_module()`` for further details).
+        """
+        return self._get_many(
+            self.get_module, setting_names,
+            as_tuple=as_tuple,
+            warn_only_if_overridden=warn_only_if_overridden,
+            accept_deprecated=accept_deprecated,
+            suppress_warnings=suppress_warnings,
+            warning_stacklevel=warning_stacklevel + 1,
+        )
+
+    def get_many_objects(self, setting_names, as_tuple=False,
+                         warn_only_if_overridden=False, accept_deprecated=None,
+                         suppress_warnings=False, warning_stacklevel=3):
+        """
+        As ``get_many()``, but returns Python classes, methods or other objects
+        referenced by the requested settings (see ``get_object()`` for further
+        details).
+        """
+        return self._get_many(
+            self.get_object, setting_names,
+            as_tuple=as_tuple,
+            warn_only_if_overridden=warn_only_if_overridden,
+            accept_deprecated=accept_deprecated,
+            suppress_warnings=suppress_warnings,
+            warning_stacklevel=warning_stacklevel + 1,
+        )
+
+    def override_for_tests(self, **values):
+        """
+        Returns an object that can be used as a context manager or decorator
+        (for test functions or ``TestCase`` classes) to override setting
+        values for this helper only. For example::
+
+            with appsettingshelper.override_for_tests(SETTING_NAME='value'):
+                ...
+
+            @appsettingshelper.override_for_tests(SETTING_NAME='value')
+            def test_something(self):
+                ...
+
+        Unlike Django's ``override_settings()``, ``django.conf.settings`` is
+        left untouched, and no ``setting_changed`` signal is sent. Only the
+        cached values for the overridden settings (and any settings derived
+        from them) are discarded, both when the override is applied and when
+        it is removed, so values for all other settings remain cached
+        between tests.
+
+        Keyword argument names should be unprefixed setting names. Values are
+        treated exactly as override values from Django settings would be.
+        """
+        from .testing import override_for_tests  # delay import until needed
+        return override_for_tests(self, **values)
+
+    def assert_num_resolutions(self, num):
+        """
+        Returns a context manager for use in tests, which raises an
+        ``AssertionError`` if the code within the block does not resolve
+        exactly ``num`` values for this helper (in a similar way to Django's
+        ``assertNumQueries()``). For example::
+
+            with appsettingshelper.assert_num_resolutions(2):
+                response = self.client.get('/')
+
+        Each cache miss that results in a raw setting value being looked up,
+        or a model, module, object or instance being imported or created,
+        counts as one resolution. The error message lists each of them. See
+        ``cogwheels.helpers.testing.assert_num_resolutions()`` for counting
+        resolutions for all settings helpers at once.
+        """
+        from .testing import assert_num_resolutions  # delay import until needed
+        return assert_num_resolutions(num, helpers=(self,))
+
+    def depends_on(self, *setting_names):
+        """
+        Returns a decorator that caches the return value of a function (for
+        each unique set of arguments), for use when creating expensive objects
+        from setting values. For example::
+
+            @appsettingshelper.depends_on('PATTERN', 'FLAGS')
+            def get_compiled_pattern():
+                return re.compile(appsettingshelper.PATTERN, appsettingshelper.FLAGS)
+
+        Cached results are discarded automatically when Django's
+        ``setting_changed`` signal indicates a change to one of the named
+        settings (or a deprecated setting they replace). They can also be
+        discarded manually by calling the decorated function's
+        ``cache_clear()`` method.
+
+        Arguments passed to the decorated function must be hashable.
+
+        :raises: UnknownSettingNameError
+        """
+        for setting_name in setting_names:
+            if not self.in_defaults(setting_name):
+                self._raise_invalid_setting_name_error(setting_name)
+
+        def decorator(func):
+            cache = {}
+            # Incremented each time the cache is cleared, so that results
+            # computed during the same period can be discarded
+            generation = [0]
+
+            def wrapper(*args, **kwargs):
+                key = args
+                if kwargs:
+                    key += (KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+                try:
+                    return cache[key]
+                except KeyError:
+                    pass
+                started_at = generation[0]
+                result = func(*args, **kwargs)
+                if generation[0] == started_at:
+                    cache[key] = result
+                return result
+
+            def cache_clear():
+                generation[0] += 1
+                cache.clear()
+
+            wrapper.cache_clear = cache_clear
+            update_wrapper(wrapper, func)
+            for setting_name in setting_names:
+                self._dependent_functions.setdefault(setting_name, []).append(wrapper)
+            return wrapper
+        return decorator
+
+    def on_change(self, setting_name, callback):
+        """
+        Registers ``callback`` to be called whenever the value of the setting
+        named by ``setting_name`` changes (including when the value of a
+        deprecated setting it replaces changes), with the old and new values
+        as arguments. For example::
+
+            def clear_template_cache(old_value, new_value):
+                template_cache.clear()
+
+            appsettingshelper.on_change('TEMPLATE_DIRS', clear_template_cache)
+
+        Changes are detected when Django's ``setting_changed`` signal is sent
+        (e.g. by ``override_settings()``), when ``reset_caches()`` is called,
+        and when ``override_for_tests()`` is used. Only the callbacks for
+        affected settings are considered, and callbacks are not called if the
+        new value is equal to the old one. No deprecation warnings are
+        raised, and errors raised by callbacks (or when resolving new values)
+        are logged to the ``'cogwheels'`` logger instead of being raised.
+
+        Returns a function that can be called to unregister ``callback``.
+
+        :raises: UnknownSettingNameError
+        """
+        if not self.in_defaults(setting_name):
+            self._raise_invalid_setting_name_error(setting_name)
+        if setting_name not in self._change_callbacks:
+            self._last_values[setting_name] = self.get(
+                setting_name, suppress_warnings=True)
+        callbacks = self._change_callbacks.setdefault(setting_name, [])
+        callbacks.append(callback)
+
+        def remove():
+            if callback in callbacks:
+                callbacks.remove(callback)
+            if not callbacks and self._change_callbacks.get(setting_name) is callbacks:
+                del self._change_callbacks[setting_name]
+                del self._last_values[setting_name]
+        return remove
+
+    def check_import_paths(self, parse_source=True):
+        """
+        Validates the values of settings named in ``module_settings`` and
+        ``object_settings`` without importing anything, and returns a list of
+        errors (``SettingValueError`` instances) for any found to be invalid.
+
+        Module paths are checked by locating the module (but not executing
+        it, or any of its parent packages). If ``parse_source`` is ``True``,
+        the source code of the module identified by each object path is also
+        parsed, to check that the object name is defined there. Where that
+        cannot be determined reliably (e.g. because the module uses
+        ``import *``), the path is assumed to be valid.
+        """
+        errors = []
+        for setting_name in self.module_settings:
+            value = self._get_import_path_value(setting_name, errors)
+            if value is not None and find_module_spec(value) is None:
+                errors.append(self._make_setting_value_error(
+                    setting_name=setting_name,
+                    user_value_error_class=OverrideValueNotImportable,
+                    default_value_error_class=DefaultValueNotImportable,
+                    additional_text=(
+                        "No module could be found matching the path '{value}'. "
+                        "Please use a full (not relative) import path in the "
+                        "format: 'project.app.module'."
+                    ),
+                    value=value,
+                ))
+
+        for setting_name in self.object_settings:
+            value = self._get_import_path_value(setting_name, errors)
+            if value is None:
+                continue
+            try:
+                module_path, object_name = value.rsplit(".", 1)
+            except ValueError:
+                errors.append(self._make_setting_value_error(
+                    setting_name=setting_name,
+                    user_value_error_class=OverrideValueFormatInvalid,
+                    default_value_error_class=DefaultValueFormatInvalid,
+                    additional_text=(
+                        "'{value}' is not a valid object import path. Please use "
+                        "a full (not relative) import path with the object name "
+                        "at the end, for example: 'project.app.module.object'."
+                    ),
+                    value=value,
+                ))
+                continue
+            spec = find_module_spec(module_path)
+            if spec is None:
+                errors.append(self._make_setting_value_error(
+                    setting_name=setting_name,
+                    user_value_error_class=OverrideValueNotImportable,
+                    default_value_error_class=DefaultValueNotImportable,
+                    additional_text=(
+                        "No module could be found matching the path "
+                        "'{module_path}'. Please use a full (not relative) import "
+                        "path with the object name at the end, for example: "
+                        "'project.app.module.object'."
+                    ),
+                    module_path=module_path,
+                ))
+                continue
+            if not parse_source or find_module_spec(value) is not None:
+                # Submodules are valid objects too
+                continue
+            defined_names = get_defined_names(spec)
+            if defined_names is not None and object_name not in defined_names:
+                errors.append(self._make_setting_value_error(
+                    setting_name=setting_name,
+                    user_value_error_class=OverrideValueNotImportable,
+                    default_value_error_class=DefaultValueNotImportable,
+                    additional_text=(
+                        "No object could be found in {module_path} matching the "
+                        "name '{object_name}'."
+                    ),
+                    module_path=module_path,
+                    object_name=object_name,
+                ))
+        return errors
+
+    def _get_import_path_value(self, setting_name, errors):
+        """
+        Used by ``check_import_paths()`` to fetch the raw value for
+        ``setting_name``. Returns ``None`` (after adding an error to
+        ``errors``) if the value is not a string.
+        """
+        try:
+            return self.get(setting_name, enforce_type=str, suppress_warnings=True)
+        except (OverrideValueTypeInvalid, DefaultValueTypeInvalid) as e:
+            errors.append(e)
+
+    def fingerprint(self):
+        """
+        Returns a hash of the values of all settings, which changes whenever
+        any of those values change. This is useful for including in cache
+        keys for data that depends on setting values, so that changes to
+        settings invalidate those caches.
+
+        The result is memoized, so repeated calls are very cheap. When
+        settings change, only the values of the affected settings are
+        hashed again. No deprecation warnings are raised.
+
+        Values are encoded with ``stable_repr()``, so the result is the same
+        in every process. The exception is values for which ``repr()``
+        includes memory addresses (e.g. objects without a custom
+        ``__repr__()``), which will give different results in other
+        processes. Use the import paths of such objects as setting values
+        instead, where possible.
+        """
+        result = self._fingerprint
+        if result is None:
+            digests = self._value_digests
+            for setting_name in self._defaults:
+                if setting_name not in digests:
+                    digests[setting_name] = make_digest(
+                        self.get(setting_name, suppress_warnings=True))
+            result = self._fingerprint = make_digest(sorted(digests.items()))
+        return result
+
+    def snapshot(self):
+        """
+        Returns a ``SettingsSnapshot``: an immutable view of the current
+        values of all settings, which does not change when settings do. The
+        result is reused until settings change, so that values only need to
+        be resolved once for each set of changes.
+
+        ``cogwheels.middleware.SettingsSnapshotMiddleware`` pins snapshots
+        for the duration of each request, so that helper attributes (e.g.
+        ``appsettings.SETTING_NAME``) return consistent values throughout.
+        Values requested using helper methods (e.g. ``get()``,
+        ``get_object()`` or ``get_path()``) are always resolved from the
+        current settings, even while a snapshot is pinned.
+        """
+        result = self._snapshot
+        if result is None:
+            result = self._snapshot = SettingsSnapshot(self)
+        return result
+
+    def _get_class_path(self):
+        cls = self.__class__
+        return '{}.{}'.format(cls.__module__, cls.__qualname__)
+
+    def _get_compiled_fingerprint(self):
+        """
+        Returns a hash of everything that compiled values for this helper
+        depend on: the default values and derived setting definitions from
+        the defaults module, and any override values currently defined for
+        the helper's settings (including deprecated ones). This is used to
+        check that compiled values are still valid (see
+        ``cogwheels_compile``).
+
+        :raises: ValueError if any of those values has no stable
+            representation (see ``stable_repr()``), in which case values
+            cannot be compiled for the helper.
+        """
+        items = []
+        for setting_name in sorted(self._defaults):
+            default = self._defaults[setting_name]
+            if isinstance(default, DerivedAppSetting):
+                default = ('derived', default.func, default.depends_on)
+            item = [setting_name, default]
+            if self.is_overridden(setting_name):
+                item.append(self.get_user_defined_value(setting_name))
+            items.append(item)
+        return make_digest(items, strict=True)
+
+    def _get_compiled_data(self):
+        """
+        Used by the ``cogwheels_compile`` management command to gather the
+        data written to a compiled settings module for this helper.
+
+        Values are resolved for all settings, except for deprecated settings,
+        settings whose value would be taken from a deprecated setting (so that
+        the appropriate deprecation warnings are still raised), and those
+        with values that cannot be represented as Python literals. The values
+        of settings named in ``module_settings`` and ``object_settings`` are
+        included as import paths to be imported in advance.
+
+        :raises: ValueError (see ``_get_compiled_fingerprint()``)
+        """
+        fingerprint = self._get_compiled_fingerprint()
+        values = {}
+        for setting_name in sorted(self._defaults):
+            if setting_name in self._deprecated_settings:
+                continue
+            value = self._get_raw_value(setting_name, suppress_warnings=True)
+            source = self._sources_cache[setting_name]
+            if source.kind == DEPRECATED_OVERRIDE:
+                continue
+            try:
+                evaluated = ast.literal_eval(repr(value))
+                is_literal = type(evaluated) is type(value) and evaluated == value
+            except (ValueError, SyntaxError, TypeError, MemoryError, RuntimeError):
+                is_literal = False
+            if is_literal:
+                values[setting_name] = (source.kind, value)
+        import_paths = {}
+        for kind, setting_names in (
+            ('module', self.module_settings), ('object', self.object_settings)
+        ):
+            for setting_name in setting_names:
+                value = values.get(setting_name, (None, None))[1]
+                if isinstance(value, str):
+                    import_paths[setting_name] = (kind, value)
+        return {
+            'fingerprint': fingerprint,
+            'values': values,
+            'import_paths': import_paths,
+        }
+
+    def _load_compiled_values(self):
+        """
+        Called by ``reset_caches()`` for helpers with a
+        ``compiled_settings_module``, to add the values compiled for this
+        helper (by the ``cogwheels_compile`` management command) to the
+        caches. Nothing is loaded if the module cannot be imported, or if
+        the defaults module or override values in the project's Django
+        settings have changed since the values were compiled (see
+        ``_get_compiled_fingerprint()``), in which case values are resolved
+        as usual.
+
+        Once Django's app registry is ready, modules and objects for the
+        compiled import paths are also imported, so that requests for them
+        are served from the caches too (see ``bind_compiled_imports()``).
+        """
+        self._using_compiled_values = False
+        self._compiled_values = {}
+        try:
+            module = self._do_import(self.compiled_settings_module)
+        except ImportError:
+            return
+        data = getattr(module, 'HELPERS', {}).get(self._get_class_path())
+        if not data:
+            return
+        try:
+            if data['fingerprint'] != self._get_compiled_fingerprint():
+                return
+        except ValueError:
+            return
+        for setting_name, (kind, value) in data['values'].items():
+            if not self.in_defaults(setting_name):
+                continue
+            if kind in (OVERRIDE, TEST_OVERRIDE):
+                source = self._make_override_source(setting_name, OVERRIDE)
+            else:
+                source = SettingValueSource(kind, setting_name, None)
+            # Preparing values for deep_merge_settings requires the source
+            self._sources_cache[setting_name] = source
+            try:
+                value = self._prepare_value(setting_name, value, setting_name)
+            except SettingValueError:
+                # Leave the error to be raised when the value is requested
+                del self._sources_cache[setting_name]
+                continue
+            self._compiled_values[setting_name] = (source, value)
+        self._compiled_import_paths = data['import_paths']
+        self._using_compiled_values = True
+        self._add_compiled_values_to_caches()
+        from django.apps import apps  # delay import until needed
+        if apps.ready:
+            self.bind_compiled_imports()
+
+    def _add_compiled_values_to_caches(self):
+        """
+        Adds the values loaded by ``_load_compiled_values()`` to the caches.
+        Called by ``reset_caches()`` when settings that do not affect this
+        helper change, to avoid checking the compiled values again.
+        """
+        for setting_name, (source, value) in self._compiled_values.items():
+            self._sources_cache[setting_name] = source
+            self._raw_cache[setting_name] = value
+
+    def bind_compiled_imports(self):
+        """
+        Imports the modules and objects for import paths compiled by the
+        ``cogwheels_compile`` management command, and adds them to the
+        caches. This is called automatically by ``_load_compiled_values()``
+        (or by the ``ready()`` method of cogwheels' ``AppConfig`` for helpers
+        created before Django's app registry is ready). Import failures are
+        not raised here, but will be raised when the values are requested.
+        """
+        if not self._using_compiled_values:
+            return
+        getters = {'module': self.get_module, 'object': self.get_object}
+        for setting_name, (kind, value) in self._compiled_import_paths.items():
+            if self._raw_cache.get(setting_name) != value:
+                continue
+            try:
+                getters[kind](setting_name, suppress_warnings=True)
+            except SettingValueError:
+                pass
+
+    def is_value_from_deprecated_setting(self, setting_name, deprecated_setting_name):
+        """
+        Helps developers to determine where the settings helper got it's value
+        from when dealing with settings that replace deprecated settings.
+
+        Returns ``True`` when the new setting (with the name ``setting_name``)
+        is a replacement for a deprecated setting (with the name
+        ``deprecated_setting_name``) and the user is using the deprecated
+        setting in their Django settings to override behaviour.
+        """
+        if not self.in_defaults(setting_name):
+            self._raise_invalid_setting_name_error(setting_name)
+        if not self.in_defaults(deprecated_setting_name):
+            self._raise_invalid_setting_name_error(deprecated_setting_name)
+        if deprecated_setting_name not in self._deprecated_settings:
+            raise ValueError(
+                "The '%s' setting is not deprecated. When using "
+                "settings.is_value_from_deprecated_setting(), the deprecated "
+                "setting name should be supplied as the second argument." %
+                deprecated_setting_name
+            )
+        if setting_name == deprecated_setting_name:
+            return False
+        source = self.get_source(setting_name, accept_deprecated=deprecated_setting_name)
+        return source.setting_name == deprecated_setting_name
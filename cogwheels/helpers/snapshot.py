@@ -0,0 +1,170 @@
+import copy
+import threading
+
+from . import registry
+
+try:
+    from contextvars import ContextVar
+except ImportError:  # Python < 3.7
+    ContextVar = None
+
+
+class LocalVar(threading.local):
+    """
+    A minimal stand-in for ``contextvars.ContextVar`` for Python versions
+    where it is unavailable, which stores values per thread.
+    """
+    value = None
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        previous = self.value
+        self.value = value
+        return previous
+
+    def reset(self, token):
+        self.value = token
+
+
+# Snapshots pinned by pin_snapshots(), keyed by settings helper
+if ContextVar is not None:
+    current_snapshots = ContextVar('cogwheels_snapshots', default=None)
+else:
+    current_snapshots = LocalVar()
+
+
+class SettingValueFailure:
+    """
+    Stands in for the value of a setting in a ``SettingsSnapshot`` where
+    resolving the value raised an error, so that the error can be raised
+    when the value is requested, rather than when the snapshot is created.
+    """
+    __slots__ = ('error', 'traceback')
+
+    def __init__(self, error):
+        self.error = error
+        self.traceback = error.__traceback__
+
+    def reraise(self):
+        """
+        Raises a copy of the saved error, with the traceback from when the
+        value was resolved. A new instance is raised each time, so that
+        requests in different threads do not modify the same error.
+        """
+        raise copy.copy(self.error).with_traceback(self.traceback)
+
+
+class SettingsSnapshot:
+    """
+    An immutable view of the values of all settings for a settings helper,
+    as they were when the snapshot was created (see
+    ``BaseAppSettingsHelper.snapshot()``). Values are requested in the same
+    way as they are from the helper itself (``snapshot.SETTING_NAME`` or
+    ``snapshot.get('SETTING_NAME')``), and the same deprecation warnings
+    are raised (including those for override values that use deprecated
+    setting names).
+
+    The values themselves are those returned by the helper's ``get()``
+    method, so are only frozen if the helper's ``freeze_values`` attribute
+    is ``True``. Errors raised when resolving a value are raised each time
+    the value is requested.
+    """
+    __slots__ = ('settings_helper', '_values')
+
+    def __init__(self, settings_helper):
+        values = {}
+        sources = settings_helper._sources_cache
+        for setting_name in settings_helper._defaults:
+            try:
+                value = settings_helper.get(setting_name, suppress_warnings=True)
+            except Exception as e:
+                value = SettingValueFailure(e)
+            values[setting_name] = (value, sources.get(setting_name))
+        object.__setattr__(self, 'settings_helper', settings_helper)
+        object.__setattr__(self, '_values', values)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("{} objects are immutable".format(
+            self.__class__.__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError("{} objects are immutable".format(
+            self.__class__.__name__))
+
+    def __getattr__(self, name):
+        if not name.isupper():
+            raise AttributeError("{} object has no attribute '{}'".format(
+                self.__class__.__name__, name))
+        return self.get(name, warning_stacklevel=4)
+
+    def get(self, setting_name, warn_only_if_overridden=False,
+            suppress_warnings=False, warning_stacklevel=3):
+        """
+        Returns the value of the setting named by ``setting_name``.
+        ``warn_only_if_overridden``, ``suppress_warnings`` and
+        ``warning_stacklevel`` behave as they do for
+        ``BaseAppSettingsHelper.get()``.
+
+        :raises: UnknownSettingNameError, and any error raised when
+            resolving the value for the snapshot
+        """
+        settings_helper = self.settings_helper
+        try:
+            value, source = self._values[setting_name]
+        except KeyError:
+            settings_helper._raise_invalid_setting_name_error(setting_name)
+        if not suppress_warnings:
+            settings_helper._warn_if_deprecated_setting_value_requested(
+                setting_name, warn_only_if_overridden, suppress_warnings,
+                warning_stacklevel)
+            if source is not None:
+                settings_helper._warn_if_deprecated_source(
+                    setting_name, source, warn_only_if_overridden,
+                    warning_stacklevel)
+        if isinstance(value, SettingValueFailure):
+            value.reraise()
+        return value
+
+
+# Guards changes to the 'pinned_snapshots' count of settings helpers
+_pins_lock = threading.Lock()
+
+
+def pin_snapshots(helpers=None):
+    """
+    Pins a snapshot of the values for each registered settings helper (or
+    just those in ``helpers``, if provided) to the current context (or the
+    current thread, for Python versions earlier than 3.7), so that setting
+    values requested as helper attributes (e.g. ``appsettings.SETTING_NAME``)
+    are taken from the snapshot, even if settings change. Values requested
+    using helper methods (e.g. ``get()`` or ``get_object()``) are not taken
+    from the snapshot.
+
+    Returns a token to pass to ``unpin_snapshots()`` to restore the previous
+    state.
+    """
+    if helpers is None:
+        helpers = registry.get_helpers()
+    snapshots = {
+        settings_helper: settings_helper.snapshot() for settings_helper in helpers
+    }
+    # Helpers only look for pinned snapshots while this is more than zero,
+    # so that attribute requests are not slowed down when nothing is pinned
+    with _pins_lock:
+        for settings_helper in snapshots:
+            settings_helper._pinned_snapshots += 1
+    return (current_snapshots.set(snapshots), snapshots)
+
+
+def unpin_snapshots(token):
+    """
+    Restores the snapshots that were pinned before the call to
+    ``pin_snapshots()`` that returned ``token``.
+    """
+    context_token, snapshots = token
+    current_snapshots.reset(context_token)
+    with _pins_lock:
+        for settings_helper in snapshots:
+            settings_helper._pinned_snapshots -= 1
@@ -0,0 +1,39 @@
+from collections import namedtuple
+
+
+# Identify the different places a setting value can come from
+DEFAULT = 'default'
+DERIVED = 'derived'
+OVERRIDE = 'override'
+DEPRECATED_OVERRIDE = 'deprecated_override'
+TEST_OVERRIDE = 'test_override'
+
+
+class SettingValueSource(
+    namedtuple('SettingValueSource', ('kind', 'setting_name', 'django_setting_name'))
+):
+    """
+    Describes where the value for an app setting came from, as returned by
+    ``BaseAppSettingsHelper.get_source()``.
+
+    ``kind`` is one of:
+
+    - ``'default'``: The value defined in the defaults module.
+    - ``'derived'``: A value computed from other settings (see ``derived()``).
+    - ``'override'``: An override value from the project's Django settings.
+    - ``'deprecated_override'``: An override value from the project's Django
+      settings, using the name of a deprecated setting that the requested
+      setting replaces.
+    - ``'test_override'``: A value applied by ``override_for_tests()``.
+
+    ``setting_name`` is the (unprefixed) name of the setting the value was
+    taken from, which differs from the requested setting name when a
+    deprecated setting's value is used. ``django_setting_name`` is the
+    prefixed name of the Django setting the value was taken from, or
+    ``None`` if the value did not come from Django settings.
+    """
+    __slots__ = ()
+
+    @property
+    def is_overridden(self):
+        return self.kind in (OVERRIDE, DEPRECATED_OVERRIDE, TEST_OVERRIDE)
@@ -0,0 +1,132 @@
+import atexit
+import json
+import logging
+import os
+import threading
+from collections import defaultdict
+
+
+class DeprecationUsageCollector:
+    """
+    Collects counts of deprecated setting usage, so that the information is
+    not lost in environments where deprecation warnings are silenced (e.g.
+    in production).
+
+    To use, set the ``deprecation_usage_collector`` attribute on a settings
+    helper class to an instance of this class. Instead of raising deprecation
+    warnings, the helper will then increment a counter for each combination
+    of setting name, 'kind' of use (``'requested'``, ``'overridden'`` or
+    ``'old_name_used'``) and call site (file and line number). For example::
+
+        collector = DeprecationUsageCollector(json_path='/tmp/deprecations.json')
+        collector.start(interval=300)
+
+        class MyAppSettingsHelper(BaseAppSettingsHelper):
+            deprecation_usage_collector = collector
+
+    Counts are written to the ``cogwheels.deprecations`` logger (or the
+    ``logger`` provided) and, if ``json_path`` is provided, added to any
+    totals already saved in that file, whenever ``flush()`` is called.
+    ``start()`` can be used to have this happen periodically (and when the
+    process exits).
+    """
+
+    def __init__(self, json_path=None, logger=None):
+        self.json_path = json_path
+        self.logger = logger or logging.getLogger('cogwheels.deprecations')
+        self.counts = defaultdict(int)
+        # Guards 'counts', which is swapped out by each flush
+        self._counts_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._timer_lock = threading.Lock()
+        self._timer = None
+        self._interval = None
+        self._registered_atexit = False
+
+    def record(self, key):
+        """
+        Increments the count for ``key``, which should be a
+        ``(setting_name, kind, filename, lineno)`` tuple.
+        """
+        with self._counts_lock:
+            self.counts[key] += 1
+
+    def flush(self):
+        """
+        Writes the counts collected since the last flush to the logger (and
+        JSON file, if ``json_path`` was provided), then starts counting from
+        zero again.
+        """
+        with self._flush_lock:
+            with self._counts_lock:
+                counts, self.counts = self.counts, defaultdict(int)
+            if not counts:
+                return
+            for (setting_name, kind, filename, lineno), count in sorted(counts.items(), key=str):
+                self.logger.warning(
+                    "Deprecated setting %s (%s) used %s time(s) at %s:%s",
+                    setting_name, kind, count, filename, lineno,
+                )
+            if self.json_path:
+                self._write_json(counts)
+
+    def _write_json(self, counts):
+        totals = defaultdict(int)
+        if os.path.exists(self.json_path):
+            with open(self.json_path, 'r') as f:
+                for item in json.load(f):
+                    key = (item['setting_name'], item['kind'], item['filename'], item['lineno'])
+                    totals[key] += item['count']
+        for key, count in counts.items():
+            totals[key] += count
+        with open(self.json_path, 'w') as f:
+            json.dump(
+                [
+                    dict(setting_name=setting_name, kind=kind, filename=filename,
+                         lineno=lineno, count=count)
+                    for (setting_name, kind, filename, lineno), count
+                    in sorted(totals.items(), key=str)
+                ],
+                f, indent=2
+            )
+
+    def start(self, interval=60):
+        """
+        Start flushing counts every ``interval`` seconds (in a background
+        thread), and when the process exits. If already started, the previous
+        schedule is replaced.
+        """
+        with self._timer_lock:
+            if not self._registered_atexit:
+                atexit.register(self.flush)
+                self._registered_atexit = True
+            self._interval = interval
+            self._schedule()
+
+    def stop(self):
+        """Stop flushing counts periodically."""
+        with self._timer_lock:
+            self._interval = None
+            self._cancel_timer()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _schedule(self):
+        # Only one timer should ever be active
+        self._cancel_timer()
+        self._timer = threading.Timer(self._interval, self._run)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _run(self):
+        try:
+            self.flush()
+        finally:
+            with self._timer_lock:
+                # Timers replaced by start() or stop() while flushing must
+                # not schedule another
+                if self._interval is not None and self._timer is threading.current_thread():
+                    self._schedule()
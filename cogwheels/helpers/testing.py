@@ -0,0 +1,99 @@
+from django.test.utils import TestContextDecorator
+
+from . import registry
+
+
+class override_for_tests(TestContextDecorator):
+    """
+    Temporarily overrides setting values for a single settings helper, for
+    use in tests. Instances are usually created by calling the helper's
+    ``override_for_tests()`` method, and can be used as a context manager, or
+    to decorate test functions or ``TestCase`` classes (in the same way as
+    Django's ``override_settings``).
+
+    Rather than changing ``django.conf.settings`` (which would cause every
+    settings helper to reset all of its caches), values are applied to the
+    helper directly, and only cached values for the affected settings are
+    discarded. Overrides can be nested, with inner values taking precedence.
+    """
+
+    def __init__(self, helper, **values):
+        self.helper = helper
+        self.values = values
+        self._previous_overrides = None
+        super().__init__()
+
+    def enable(self):
+        helper = self.helper
+        for setting_name in self.values:
+            if not helper.in_defaults(setting_name):
+                helper._raise_invalid_setting_name_error(setting_name)
+        self._previous_overrides = helper._test_overrides
+        overrides = dict(self._previous_overrides)
+        overrides.update(self.values)
+        helper._test_overrides = overrides
+        helper._discard_cached_values(
+            helper._get_dependent_setting_names(self.values.keys()))
+
+    def disable(self):
+        helper = self.helper
+        helper._test_overrides = self._previous_overrides
+        self._previous_overrides = None
+        helper._discard_cached_values(
+            helper._get_dependent_setting_names(self.values.keys()))
+
+
+class assert_num_resolutions:
+    """
+    A context manager that raises an ``AssertionError`` if the code within
+    the block does not resolve exactly ``num`` setting values. Useful for
+    catching performance regressions, where changes result in values being
+    resolved again, instead of being fetched from the caches. For example::
+
+        with assert_num_resolutions(3):
+            response = self.client.get('/')
+
+    Resolutions are counted for all registered settings helpers, or for
+    just those in ``helpers``, if provided (see ``_record_resolution()`` on
+    ``BaseAppSettingsHelper`` for what counts as a resolution). The list of
+    resolutions made is available as ``resolutions`` after the block exits.
+    """
+
+    def __init__(self, num, helpers=None):
+        self.num = num
+        self.helpers = helpers
+        self.resolutions = []
+        self._active_helpers = ()
+
+    def __enter__(self):
+        self._active_helpers = tuple(
+            registry.get_helpers() if self.helpers is None else self.helpers
+        )
+        self.resolutions = []
+        for helper in self._active_helpers:
+            helper._resolution_logs.append(self.resolutions)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        for helper in self._active_helpers:
+            # Compare by identity, as other (equal) logs may be active
+            helper._resolution_logs = [
+                log for log in helper._resolution_logs
+                if log is not self.resolutions
+            ]
+        self._active_helpers = ()
+        if exc_type is not None:
+            return
+        if len(self.resolutions) != self.num:
+            raise AssertionError(
+                "{count} app setting resolutions were made, but {num} were "
+                "expected:\n{details}".format(
+                    count=len(self.resolutions),
+                    num=self.num,
+                    details='\n'.join(
+                        '{}. {}: {}'.format(i, kind, setting_name)
+                        for i, (kind, setting_name)
+                        in enumerate(self.resolutions, start=1)
+                    )
+                )
+            )
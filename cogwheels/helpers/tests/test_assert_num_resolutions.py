@@ -0,0 +1,54 @@
+from cogwheels.helpers.testing import assert_num_resolutions
+from cogwheels.tests.base import AppSettingTestCase
+
+
+class TestAssertNumResolutions(AppSettingTestCase):
+
+    def test_cache_misses_counted(self):
+        helper = self.appsettingshelper
+        with helper.assert_num_resolutions(3) as context:
+            helper.get('STRING_SETTING')
+            helper.get('STRING_SETTING')
+            helper.get_object('VALID_OBJECT')
+            helper.get_object('VALID_OBJECT')
+        self.assertEqual(context.resolutions, [
+            ('value', 'COGWHEELS_TESTS_STRING_SETTING'),
+            ('value', 'COGWHEELS_TESTS_VALID_OBJECT'),
+            ('object', 'COGWHEELS_TESTS_VALID_OBJECT'),
+        ])
+
+    def test_cached_values_not_counted(self):
+        helper = self.appsettingshelper
+        helper.get_model('VALID_MODEL')
+        helper.get_module('VALID_MODULE')
+        with helper.assert_num_resolutions(0):
+            helper.get_model('VALID_MODEL')
+            helper.get_module('VALID_MODULE')
+
+    def test_error_lists_resolutions(self):
+        helper = self.appsettingshelper
+        with self.assertRaises(AssertionError) as cm:
+            with helper.assert_num_resolutions(1):
+                helper.get('STRING_SETTING')
+                helper.get('INTEGER_SETTING')
+        self.assertEqual(
+            str(cm.exception),
+            "2 app setting resolutions were made, but 1 were expected:\n"
+            "1. value: COGWHEELS_TESTS_STRING_SETTING\n"
+            "2. value: COGWHEELS_TESTS_INTEGER_SETTING"
+        )
+
+    def test_nested_blocks_both_count_resolutions(self):
+        helper = self.appsettingshelper
+        with helper.assert_num_resolutions(2):
+            helper.get('STRING_SETTING')
+            with helper.assert_num_resolutions(1):
+                helper.get('INTEGER_SETTING')
+        self.assertEqual(helper._resolution_logs, [])
+
+    def test_counts_resolutions_for_all_registered_helpers(self):
+        helper = self.appsettingshelper
+        with assert_num_resolutions(1) as context:
+            helper.get('STRING_SETTING')
+        self.assertEqual(context.resolutions, [('value', 'COGWHEELS_TESTS_STRING_SETTING')])
+        self.assertEqual(helper._resolution_logs, [])
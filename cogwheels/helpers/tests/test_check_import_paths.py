@@ -0,0 +1,75 @@
+import gc
+import sys
+
+from django.test import TestCase, override_settings
+
+from cogwheels import (
+    BaseAppSettingsHelper, DefaultValueFormatInvalid, DefaultValueNotImportable,
+    OverrideValueNotImportable, OverrideValueTypeInvalid,
+)
+from cogwheels.checks import check_import_path_settings
+
+
+class ImportPathSettingsHelper(BaseAppSettingsHelper):
+    prefix = 'COGWHEELS_TESTS'
+    defaults_path = 'cogwheels.tests.conf.defaults'
+    module_settings = ('VALID_MODULE', 'UNAVAILABLE_MODULE')
+    object_settings = (
+        'VALID_OBJECT', 'INCORRECT_FORMAT_OBJECT', 'MODULE_UNAVAILABLE_OBJECT',
+        'OBJECT_UNAVAILABLE_OBJECT',
+    )
+
+
+class TestCheckImportPaths(TestCase):
+
+    def setUp(self):
+        self.appsettingshelper = ImportPathSettingsHelper()
+
+    def assertErrorTypes(self, errors, expected_types):
+        self.assertEqual([type(e) for e in errors], expected_types)
+
+    def test_errors_returned_for_invalid_default_values(self):
+        errors = self.appsettingshelper.check_import_paths()
+        self.assertErrorTypes(errors, [
+            DefaultValueNotImportable,  # UNAVAILABLE_MODULE
+            DefaultValueFormatInvalid,  # INCORRECT_FORMAT_OBJECT
+            DefaultValueNotImportable,  # MODULE_UNAVAILABLE_OBJECT
+            DefaultValueNotImportable,  # OBJECT_UNAVAILABLE_OBJECT
+        ])
+        self.assertIn("matching the name 'NonExistent'", str(errors[3]))
+
+    def test_object_names_not_checked_if_parse_source_is_false(self):
+        errors = self.appsettingshelper.check_import_paths(parse_source=False)
+        self.assertEqual(len(errors), 3)
+
+    @override_settings(
+        COGWHEELS_TESTS_VALID_MODULE='cogwheels.tests.modules.unexecutable_module',
+        COGWHEELS_TESTS_UNAVAILABLE_MODULE=1,
+        COGWHEELS_TESTS_VALID_OBJECT='cogwheels.tests.modules.unexecutable_module.DefinedClass',
+        COGWHEELS_TESTS_INCORRECT_FORMAT_OBJECT='cogwheels.tests.modules.unexecutable_module.CONSTANT',
+        COGWHEELS_TESTS_MODULE_UNAVAILABLE_OBJECT='cogwheels.tests.modules.unexecutable_star_module.Anything',
+        COGWHEELS_TESTS_OBJECT_UNAVAILABLE_OBJECT='cogwheels.tests.modules.unexecutable_module.Undefined',
+    )
+    def test_override_values_checked_without_executing_modules(self):
+        errors = self.appsettingshelper.check_import_paths()
+        self.assertErrorTypes(errors, [OverrideValueTypeInvalid, OverrideValueNotImportable])
+        self.assertIn("matching the name 'Undefined'", str(errors[1]))
+        self.assertNotIn('cogwheels.tests.modules.unexecutable_module', sys.modules)
+        self.assertNotIn('cogwheels.tests.modules.unexecutable_star_module', sys.modules)
+
+    @override_settings(COGWHEELS_TESTS_VALID_OBJECT='cogwheels.tests.modules.default_module')
+    def test_submodules_are_valid_objects(self):
+        errors = self.appsettingshelper.check_import_paths()
+        self.assertEqual(len(errors), 4)
+
+    def test_system_check_reports_errors_for_registered_helpers(self):
+        # Ensure instances created by other tests are removed from the registry
+        gc.collect()
+        messages = [
+            m for m in check_import_path_settings()
+            if m.obj is ImportPathSettingsHelper
+        ]
+        self.assertEqual(
+            [m.id for m in messages],
+            ['cogwheels.E003', 'cogwheels.E002', 'cogwheels.E003', 'cogwheels.E003'],
+        )
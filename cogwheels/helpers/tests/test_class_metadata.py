@@ -0,0 +1,49 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from cogwheels import BaseAppSettingsHelper, DeprecatedAppSetting
+
+
+class TestSettingsHelper(BaseAppSettingsHelper):
+    prefix = 'COGWHEELS_TESTS'
+    defaults_path = 'cogwheels.tests.conf.defaults'
+    deprecations = (
+        DeprecatedAppSetting('RENAMED_SETTING_OLD', renamed_to='RENAMED_SETTING_NEW'),
+    )
+
+
+class TestClassMetadata(TestCase):
+
+    def setUp(self):
+        TestSettingsHelper.prefix = 'COGWHEELS_TESTS'
+        self.first = TestSettingsHelper()
+
+    def test_metadata_shared_by_subsequent_instances(self):
+        with patch.object(TestSettingsHelper, '_load_defaults') as mocked_load_defaults:
+            with patch.object(TestSettingsHelper, '_prepare_deprecation_data') as mocked_prepare:
+                second = TestSettingsHelper()
+        mocked_load_defaults.assert_not_called()
+        mocked_prepare.assert_not_called()
+        self.assertIs(second._defaults, self.first._defaults)
+        self.assertIs(second._replacement_settings, self.first._replacement_settings)
+        self.assertEqual(second.get_prefixed_setting_name('STRING_SETTING'), 'COGWHEELS_TESTS_STRING_SETTING')
+
+    def test_caches_not_shared(self):
+        second = TestSettingsHelper()
+        self.first.get('STRING_SETTING')
+        self.assertNotIn('STRING_SETTING', second._raw_cache)
+        self.assertIsNot(second._derived_cache, self.first._derived_cache)
+
+    def test_metadata_prepared_again_if_class_attributes_change(self):
+        TestSettingsHelper.prefix = 'OTHER'
+        second = TestSettingsHelper()
+        self.assertEqual(second._prefix, 'OTHER')
+        self.assertEqual(second.get_prefixed_setting_name('STRING_SETTING'), 'OTHER_STRING_SETTING')
+
+    def test_metadata_not_shared_with_subclasses(self):
+        class SubclassSettingsHelper(TestSettingsHelper):
+            prefix = 'SUBCLASS'
+
+        self.assertEqual(SubclassSettingsHelper()._prefix, 'SUBCLASS')
+        self.assertEqual(TestSettingsHelper()._prefix, 'COGWHEELS_TESTS')
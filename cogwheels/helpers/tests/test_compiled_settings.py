@@ -0,0 +1,180 @@
+import os
+import shutil
+import sys
+import tempfile
+from collections import OrderedDict
+from io import StringIO
+from types import MappingProxyType
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from cogwheels import BaseAppSettingsHelper, DeprecatedAppSetting, derived
+from cogwheels.helpers import imports
+from cogwheels.helpers.utils import stable_repr
+from cogwheels.tests.modules import default_module
+
+COMPILED_MODULE_NAME = 'cogwheels_compiled_settings'
+
+
+class CompiledSettingsHelper(BaseAppSettingsHelper):
+    defaults_path = 'cogwheels.tests.conf.defaults'
+    prefix = 'COMPILED'
+    deprecations = (
+        DeprecatedAppSetting('DEPRECATED_SETTING', warning_category=DeprecationWarning),
+    )
+    module_settings = ('VALID_MODULE',)
+    object_settings = ('VALID_OBJECT',)
+    compiled_settings_module = COMPILED_MODULE_NAME
+
+
+class MergingCompiledSettingsHelper(BaseAppSettingsHelper):
+    defaults_path = 'cogwheels.tests.conf.defaults'
+    prefix = 'COMPILED'
+    deep_merge_settings = ('DICT_SETTING',)
+    compiled_settings_module = COMPILED_MODULE_NAME
+
+
+class TestCompiledSettings(TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, COMPILED_MODULE_NAME + '.py')
+        sys.path.insert(0, self.temp_dir)
+
+    def tearDown(self):
+        sys.path.remove(self.temp_dir)
+        sys.modules.pop(COMPILED_MODULE_NAME, None)
+        imports._modules.pop(COMPILED_MODULE_NAME, None)
+        imports.clear_failures()
+        shutil.rmtree(self.temp_dir)
+        self.helper = None
+
+    def compile(self, helper_class=CompiledSettingsHelper):
+        # Ensure there is a registered instance to compile values for
+        self.helper = helper_class()
+        call_command('cogwheels_compile', self.path, verbosity=0)
+        imports.clear_failures()
+        self.helper.reset_caches()
+
+    def get_compiled_data(self):
+        namespace = {}
+        with open(self.path) as f:
+            exec(f.read(), namespace)
+        return namespace['HELPERS'][self.helper._get_class_path()]
+
+    def test_command_writes_values_and_import_paths(self):
+        with override_settings(COMPILED_STRING_SETTING='compiled'):
+            self.compile()
+            data = self.get_compiled_data()
+        self.assertEqual(data['values']['INTEGER_SETTING'], ('default', 1))
+        self.assertEqual(data['values']['STRING_SETTING'], ('override', 'compiled'))
+        self.assertEqual(data['values']['DERIVED_SETTING'], ('derived', 1000))
+        self.assertEqual(data['import_paths']['VALID_MODULE'], (
+            'module', 'cogwheels.tests.modules.default_module'))
+        # Deprecated settings are resolved as usual, so warnings are raised
+        self.assertNotIn('DEPRECATED_SETTING', data['values'])
+
+    def test_values_served_without_resolution(self):
+        self.compile()
+        helper = self.helper
+        self.assertTrue(helper._using_compiled_values)
+        with helper.assert_num_resolutions(0):
+            self.assertEqual(helper.INTEGER_SETTING, 1)
+            self.assertEqual(helper.DERIVED_SETTING, 1000)
+            self.assertIs(helper.get_module('VALID_MODULE'), default_module)
+        self.assertEqual(helper.get_source('INTEGER_SETTING').kind, 'default')
+
+    def test_override_values_served_with_correct_source(self):
+        with override_settings(COMPILED_STRING_SETTING='compiled'):
+            self.compile()
+            helper = self.helper
+            self.assertTrue(helper._using_compiled_values)
+            self.assertEqual(helper.STRING_SETTING, 'compiled')
+            self.assertEqual(
+                helper.get_source('STRING_SETTING').django_setting_name,
+                'COMPILED_STRING_SETTING')
+
+    def test_falls_back_when_overrides_differ(self):
+        self.compile()
+        helper = self.helper
+        with override_settings(COMPILED_INTEGER_SETTING=5):
+            self.assertFalse(helper._using_compiled_values)
+            self.assertEqual(helper.INTEGER_SETTING, 5)
+            self.assertEqual(helper.DERIVED_SETTING, 5000)
+        self.assertTrue(helper._using_compiled_values)
+
+    def test_deep_merged_values(self):
+        with override_settings(COMPILED_DICT_SETTING={'debug': True}):
+            self.compile(MergingCompiledSettingsHelper)
+            helper = self.helper
+            self.assertTrue(helper._using_compiled_values)
+            with helper.assert_num_resolutions(0):
+                value = helper.DICT_SETTING
+            self.assertIs(value['debug'], True)
+            self.assertEqual(value['handlers'], ['console', 'file'])
+            self.assertTrue(helper.get_source('DICT_SETTING').is_overridden)
+
+    def test_falls_back_when_module_missing(self):
+        self.helper = CompiledSettingsHelper()
+        self.assertFalse(self.helper._using_compiled_values)
+        self.assertEqual(self.helper.INTEGER_SETTING, 1)
+
+    def test_falls_back_when_defaults_differ(self):
+        self.compile()
+        helper = self.helper
+        with patch.dict(helper._defaults, INTEGER_SETTING=2):
+            helper.reset_caches()
+            self.assertFalse(helper._using_compiled_values)
+            self.assertEqual(helper.INTEGER_SETTING, 2)
+        helper.reset_caches()
+        self.assertTrue(helper._using_compiled_values)
+
+    def test_falls_back_when_derived_definitions_differ(self):
+        self.compile()
+        helper = self.helper
+        with patch.dict(helper._defaults, DERIVED_SETTING=derived(
+            lambda s: s.INTEGER_SETTING * 2000
+        )):
+            helper.reset_caches()
+            self.assertFalse(helper._using_compiled_values)
+
+    def test_unrelated_setting_changes_do_not_reload_values(self):
+        self.compile()
+        helper = self.helper
+        with patch.object(helper, '_load_compiled_values') as mocked_method:
+            with override_settings(UNRELATED_SETTING=True):
+                with helper.assert_num_resolutions(0):
+                    self.assertEqual(helper.INTEGER_SETTING, 1)
+        mocked_method.assert_not_called()
+
+    def test_values_without_stable_representation_not_compiled(self):
+        self.helper = CompiledSettingsHelper()
+        stderr = StringIO()
+        with override_settings(COMPILED_DICT_SETTING={'key': object()}):
+            call_command('cogwheels_compile', self.path, verbosity=0, stderr=stderr)
+        self.assertIn(self.helper._get_class_path(), stderr.getvalue())
+        namespace = {}
+        with open(self.path) as f:
+            exec(f.read(), namespace)
+        self.assertNotIn(self.helper._get_class_path(), namespace['HELPERS'])
+
+
+class TestStableRepr(SimpleTestCase):
+
+    def test_ordering_ignored(self):
+        self.assertEqual(
+            stable_repr(OrderedDict([('a', 1), ('b', {2, 3})])),
+            stable_repr(MappingProxyType({'b': frozenset({3, 2}), 'a': 1})),
+        )
+
+    def test_functions_include_code(self):
+        self.assertNotEqual(
+            stable_repr(lambda s: s.INTEGER_SETTING),
+            stable_repr(lambda s: s.STRING_SETTING),
+        )
+
+    def test_memory_addresses_rejected(self):
+        with self.assertRaises(ValueError):
+            stable_repr({'key': [object()]})
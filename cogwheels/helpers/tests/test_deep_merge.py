@@ -0,0 +1,83 @@
+from django.test import TestCase, override_settings
+
+from cogwheels import BaseAppSettingsHelper, OverrideValueTypeInvalid
+from cogwheels.tests.base import AppSettingTestCase
+from cogwheels.tests.conf import settings
+
+
+class MergingSettingsHelper(BaseAppSettingsHelper):
+    prefix = 'COGWHEELS_TESTS'
+    defaults_path = 'cogwheels.tests.conf.defaults'
+    deep_merge_settings = ('DICT_SETTING',)
+
+
+class TestDeepMerge(TestCase):
+
+    def setUp(self):
+        self.appsettingshelper = MergingSettingsHelper()
+
+    def test_default_value_returned_as_read_only_mapping(self):
+        value = self.appsettingshelper.DICT_SETTING
+        self.assertEqual(value['backends']['default']['timeout'], 10)
+        with self.assertRaises(TypeError):
+            value['debug'] = True
+        with self.assertRaises(TypeError):
+            value['backends']['default']['timeout'] = 1
+
+    @override_settings(COGWHEELS_TESTS_DICT_SETTING={
+        'backends': {'default': {'timeout': 5}, 'other': {'timeout': 1}},
+        'debug': True,
+    })
+    def test_override_merged_with_default(self):
+        value = self.appsettingshelper.DICT_SETTING
+        self.assertEqual(dict(value['backends']['default']), {'timeout': 5, 'retries': 1})
+        self.assertEqual(dict(value['backends']['other']), {'timeout': 1})
+        self.assertEqual(value['handlers'], ['console', 'file'])
+        self.assertIs(value['debug'], True)
+
+    @override_settings(COGWHEELS_TESTS_DICT_SETTING={'debug': True})
+    def test_merged_value_is_cached(self):
+        self.assertIs(self.appsettingshelper.DICT_SETTING, self.appsettingshelper.DICT_SETTING)
+
+    @override_settings(COGWHEELS_TESTS_DICT_SETTING=['debug'])
+    def test_raises_error_if_override_is_not_a_dict(self):
+        with self.assertRaises(OverrideValueTypeInvalid):
+            self.appsettingshelper.get('DICT_SETTING')
+
+    def test_settings_not_listed_are_not_merged(self):
+        with override_settings(COGWHEELS_TESTS_DICT_SETTING={'debug': True}):
+            self.assertEqual(settings.DICT_SETTING, {'debug': True})
+
+
+class TestGetPath(AppSettingTestCase):
+
+    def test_returns_nested_item(self):
+        helper = self.appsettingshelper
+        self.assertEqual(helper.get_path('DICT_SETTING', 'backends.default.timeout'), 10)
+        self.assertEqual(helper.get_path('DICT_SETTING', 'handlers.1'), 'file')
+        self.assertEqual(helper.get_path('TUPLES_SETTING', '2.1'), 'Three')
+
+    def test_result_is_cached(self):
+        helper = self.appsettingshelper
+        helper.get_path('DICT_SETTING', 'backends.default')
+        self.assertIn(('DICT_SETTING', 'backends.default'), helper._paths_cache)
+        with helper.assert_num_resolutions(0):
+            helper.get_path('DICT_SETTING', 'backends.default')
+
+    def test_cache_cleared_when_settings_change(self):
+        helper = self.appsettingshelper
+        self.assertEqual(helper.get_path('DICT_SETTING', 'debug'), False)
+        with override_settings(COGWHEELS_TESTS_DICT_SETTING={'debug': True}):
+            self.assertEqual(helper.get_path('DICT_SETTING', 'debug'), True)
+        with helper.override_for_tests(DICT_SETTING={'debug': None}):
+            self.assertIsNone(helper.get_path('DICT_SETTING', 'debug'))
+
+    def test_missing_path_returns_default_if_provided(self):
+        helper = self.appsettingshelper
+        self.assertIsNone(helper.get_path('DICT_SETTING', 'backends.other', default=None))
+        self.assertIsNone(helper.get_path('DICT_SETTING', 'handlers.5', default=None))
+        self.assertIsNone(helper.get_path('DICT_SETTING', 'debug.value', default=None))
+
+    def test_missing_path_raises_keyerror(self):
+        with self.assertRaisesRegex(KeyError, "there is no item matching 'other'"):
+            self.appsettingshelper.get_path('DICT_SETTING', 'backends.other.timeout')
@@ -0,0 +1,67 @@
+from django.test import override_settings
+
+from cogwheels import UnknownSettingNameError
+from cogwheels.tests.base import AppSettingTestCase
+
+
+class TestDependsOnDecorator(AppSettingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.calls = []
+
+        @self.appsettingshelper.depends_on('STRING_SETTING', 'RENAMED_SETTING_NEW')
+        def combine(separator='-'):
+            self.calls.append(separator)
+            return separator.join((
+                self.appsettingshelper.STRING_SETTING,
+                self.appsettingshelper.RENAMED_SETTING_NEW,
+            ))
+
+        self.combine = combine
+
+    def tearDown(self):
+        self.appsettingshelper._dependent_functions.clear()
+
+    def test_raises_unknownsettingnameerror_for_invalid_setting_names(self):
+        with self.assertRaises(UnknownSettingNameError):
+            self.appsettingshelper.depends_on('STRING_SETTING', 'NOT_REAL_SETTING')
+
+    def test_result_cached_for_each_set_of_arguments(self):
+        self.assertEqual(self.combine(), 'stringy-renamed_new')
+        self.assertEqual(self.combine(), 'stringy-renamed_new')
+        self.assertEqual(self.combine(separator='+'), 'stringy+renamed_new')
+        self.assertEqual(self.combine(separator='+'), 'stringy+renamed_new')
+        self.assertEqual(self.calls, ['-', '+'])
+
+    def test_cache_cleared_when_dependency_changes(self):
+        self.combine()
+        with override_settings(COGWHEELS_TESTS_STRING_SETTING='abc'):
+            self.assertEqual(self.combine(), 'abc-renamed_new')
+        self.assertEqual(self.combine(), 'stringy-renamed_new')
+        self.assertEqual(len(self.calls), 3)
+
+    def test_cache_cleared_when_deprecated_predecessor_changes(self):
+        self.combine()
+        with override_settings(COGWHEELS_TESTS_RENAMED_SETTING_OLD='old'):
+            self.assertEqual(self.combine(), 'stringy-old')
+        self.assertEqual(len(self.calls), 2)
+
+    def test_cache_not_cleared_when_unrelated_setting_changes(self):
+        self.combine()
+        with override_settings(COGWHEELS_TESTS_INTEGER_SETTING=5, SOME_OTHER_SETTING=True):
+            self.combine()
+        self.combine()
+        self.assertEqual(len(self.calls), 1)
+
+    def test_cache_cleared_when_reset_caches_called_directly(self):
+        self.combine()
+        self.appsettingshelper.reset_caches()
+        self.combine()
+        self.assertEqual(len(self.calls), 2)
+
+    def test_cache_clear(self):
+        self.combine()
+        self.combine.cache_clear()
+        self.combine()
+        self.assertEqual(len(self.calls), 2)
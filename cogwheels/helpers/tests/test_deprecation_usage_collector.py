@@ -0,0 +1,112 @@
+import json
+import os
+import tempfile
+import threading
+import warnings
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from cogwheels import BaseAppSettingsHelper, DeprecatedAppSetting, DeprecationUsageCollector
+
+
+class CollectingSettingsHelper(BaseAppSettingsHelper):
+    prefix = 'COGWHEELS_TESTS'
+    defaults_path = 'cogwheels.tests.conf.defaults'
+    deprecations = (
+        DeprecatedAppSetting('DEPRECATED_SETTING'),
+        DeprecatedAppSetting('RENAMED_SETTING_OLD', renamed_to='RENAMED_SETTING_NEW'),
+    )
+
+
+class TestDeprecationUsageCollector(TestCase):
+
+    def setUp(self):
+        self.collector = DeprecationUsageCollector()
+        CollectingSettingsHelper.deprecation_usage_collector = self.collector
+        self.appsettingshelper = CollectingSettingsHelper()
+
+    def tearDown(self):
+        CollectingSettingsHelper.deprecation_usage_collector = None
+
+    def test_usage_is_counted_instead_of_raising_warnings(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            for i in range(3):
+                self.appsettingshelper.get('DEPRECATED_SETTING')
+        self.assertEqual(len(w), 0)
+        self.assertEqual(len(self.collector.counts), 1)
+        (setting_name, kind, filename, lineno), count = next(iter(self.collector.counts.items()))
+        self.assertEqual(setting_name, 'COGWHEELS_TESTS_DEPRECATED_SETTING')
+        self.assertEqual(kind, 'requested')
+        self.assertTrue(filename.endswith('/cogwheels/helpers/tests/test_deprecation_usage_collector.py'))
+        self.assertEqual(count, 3)
+
+    @override_settings(
+        COGWHEELS_TESTS_DEPRECATED_SETTING='overridden',
+        COGWHEELS_TESTS_RENAMED_SETTING_OLD='old',
+    )
+    def test_each_kind_of_use_is_counted_separately(self):
+        self.appsettingshelper.get('DEPRECATED_SETTING', warn_only_if_overridden=True)
+        self.appsettingshelper.get('RENAMED_SETTING_NEW')
+        self.assertEqual(
+            sorted((key[0], key[1]) for key in self.collector.counts),
+            [
+                ('COGWHEELS_TESTS_DEPRECATED_SETTING', 'overridden'),
+                ('COGWHEELS_TESTS_RENAMED_SETTING_OLD', 'old_name_used'),
+            ]
+        )
+
+    def test_flush_writes_to_logger_and_resets_counts(self):
+        self.appsettingshelper.get('DEPRECATED_SETTING')
+        with self.assertLogs('cogwheels.deprecations') as cm:
+            self.collector.flush()
+        self.assertEqual(len(cm.output), 1)
+        self.assertIn('COGWHEELS_TESTS_DEPRECATED_SETTING (requested) used 1 time(s)', cm.output[0])
+        self.assertEqual(len(self.collector.counts), 0)
+
+    def test_flush_adds_counts_to_json_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.collector.json_path = os.path.join(tmpdir, 'usage.json')
+            with self.assertLogs('cogwheels.deprecations'):
+                for i in range(2):
+                    self.appsettingshelper.get('DEPRECATED_SETTING')
+                    self.collector.flush()
+            with open(self.collector.json_path) as f:
+                data = json.load(f)
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]['setting_name'], 'COGWHEELS_TESTS_DEPRECATED_SETTING')
+        self.assertEqual(data[0]['count'], 2)
+
+    def test_counts_not_lost_when_flushed_concurrently(self):
+        key = ('COGWHEELS_TESTS_DEPRECATED_SETTING', 'requested', None, None)
+        flushed = []
+
+        def record():
+            for i in range(2000):
+                self.collector.record(key)
+
+        with patch.object(self.collector, 'logger') as logger:
+            logger.warning.side_effect = lambda *args: flushed.append(args[3])
+            threads = [threading.Thread(target=record) for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for i in range(20):
+                self.collector.flush()
+            for thread in threads:
+                thread.join()
+            self.collector.flush()
+        self.assertEqual(sum(flushed), 8000)
+
+    def test_start_replaces_existing_timer(self):
+        with patch('atexit.register') as register:
+            self.collector.start(interval=60)
+            first_timer = self.collector._timer
+            self.collector.start(interval=60)
+            try:
+                self.assertIsNot(self.collector._timer, first_timer)
+                self.assertTrue(first_timer.finished.is_set())
+                self.assertEqual(register.call_count, 1)
+            finally:
+                self.collector.stop()
+        self.assertIsNone(self.collector._timer)
@@ -0,0 +1,76 @@
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from cogwheels import BaseAppSettingsHelper, derived
+from cogwheels.exceptions import CircularDependencyError, UnknownDependencyError
+from cogwheels.tests.base import AppSettingTestCase
+from cogwheels.tests.conf import defaults
+
+
+class TestDerivedSettings(AppSettingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.appsettingshelper._derived_cache.clear()
+
+    def test_value_is_computed_from_other_settings(self):
+        self.assertEqual(self.appsettingshelper.DERIVED_SETTING, 1000)
+        self.assertEqual(self.appsettingshelper.get('DERIVED_FROM_DERIVED_SETTING'), 1001)
+        self.assertEqual(self.appsettingshelper.EXPLICIT_DEPENDENCY_DERIVED_SETTING, 'STRINGY')
+
+    def test_dependencies_identified(self):
+        self.assertEqual(
+            self.appsettingshelper._setting_dependents['INTEGER_SETTING'], {'DERIVED_SETTING'}
+        )
+        self.assertEqual(
+            self.appsettingshelper._setting_dependents['DERIVED_SETTING'],
+            {'DERIVED_FROM_DERIVED_SETTING'}
+        )
+        self.assertEqual(
+            self.appsettingshelper._setting_dependents['STRING_SETTING'],
+            {'EXPLICIT_DEPENDENCY_DERIVED_SETTING'}
+        )
+
+    def test_value_only_computed_once(self):
+        item = defaults.DERIVED_SETTING
+        with patch.object(item, 'compute', wraps=item.compute) as mocked_method:
+            self.appsettingshelper.DERIVED_SETTING
+            self.appsettingshelper.reset_caches(setting='UNRELATED_SETTING')
+            self.appsettingshelper.DERIVED_SETTING
+        self.assertEqual(mocked_method.call_count, 1)
+
+    @override_settings(COGWHEELS_TESTS_DERIVED_SETTING=5)
+    def test_override_value_used_instead_of_computed_value(self):
+        self.assertEqual(self.appsettingshelper.DERIVED_SETTING, 5)
+        self.assertEqual(self.appsettingshelper.DERIVED_FROM_DERIVED_SETTING, 6)
+
+    def test_change_to_dependency_invalidates_transitive_dependents_only(self):
+        self.appsettingshelper.DERIVED_FROM_DERIVED_SETTING
+        self.appsettingshelper.EXPLICIT_DEPENDENCY_DERIVED_SETTING
+        with override_settings(COGWHEELS_TESTS_INTEGER_SETTING=2):
+            self.assertNotIn('DERIVED_SETTING', self.appsettingshelper._derived_cache)
+            self.assertNotIn('DERIVED_FROM_DERIVED_SETTING', self.appsettingshelper._derived_cache)
+            self.assertIn('EXPLICIT_DEPENDENCY_DERIVED_SETTING', self.appsettingshelper._derived_cache)
+            self.assertEqual(self.appsettingshelper.DERIVED_FROM_DERIVED_SETTING, 2001)
+        self.assertEqual(self.appsettingshelper.DERIVED_FROM_DERIVED_SETTING, 1001)
+
+
+class CircularDependencySettingsHelper(BaseAppSettingsHelper):
+    defaults_path = 'cogwheels.tests.conf.circular_defaults'
+
+
+class UnknownDependencySettingsHelper(BaseAppSettingsHelper):
+    defaults_path = 'cogwheels.tests.conf.defaults'
+
+
+class TestInvalidDerivedSettings(TestCase):
+
+    def test_circular_dependencies_detected_on_init(self):
+        with self.assertRaisesRegex(CircularDependencyError, 'DERIVED_(ONE|TWO|THREE) -> '):
+            CircularDependencySettingsHelper()
+
+    @patch.dict(defaults.__dict__, {'BAD_DERIVED': derived(len, depends_on=['NOPE'])})
+    def test_unknown_dependency_raises_error_on_init(self):
+        with self.assertRaisesRegex(UnknownDependencyError, "It depends on 'NOPE'"):
+            UnknownDependencySettingsHelper()
@@ -0,0 +1,74 @@
+import importlib
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from cogwheels import (
+    BaseAppSettingsHelper, DefaultValueFormatInvalid, DefaultValueNotImportable,
+    OverrideValueNotImportable,
+)
+from cogwheels.tests.base import AppSettingTestCase
+
+
+class TestFailuresCache(AppSettingTestCase):
+
+    def test_module_import_failure_is_cached(self):
+        with patch.object(self.appsettingshelper, '_do_import', side_effect=ImportError) as mocked_method:
+            for i in range(3):
+                with self.assertRaises(DefaultValueNotImportable):
+                    self.appsettingshelper.get_module('UNAVAILABLE_MODULE')
+        self.assertEqual(mocked_method.call_count, 1)
+
+    def test_object_import_failure_is_cached(self):
+        with patch.object(self.appsettingshelper, '_do_import', side_effect=ImportError) as mocked_method:
+            for i in range(3):
+                with self.assertRaises(DefaultValueNotImportable):
+                    self.appsettingshelper.objects.MODULE_UNAVAILABLE_OBJECT
+        self.assertEqual(mocked_method.call_count, 1)
+
+    def test_model_format_failure_is_cached(self):
+        with patch('django.apps.apps.get_model', side_effect=ValueError) as mocked_method:
+            for i in range(3):
+                with self.assertRaises(DefaultValueFormatInvalid):
+                    self.appsettingshelper.get_model('INCORRECT_FORMAT_MODEL')
+        self.assertEqual(mocked_method.call_count, 1)
+
+    def test_cached_failure_reraised_with_same_message(self):
+        with self.assertRaises(DefaultValueNotImportable) as first:
+            self.appsettingshelper.get_object('OBJECT_UNAVAILABLE_OBJECT')
+        with self.assertRaises(DefaultValueNotImportable) as second:
+            self.appsettingshelper.get_object('OBJECT_UNAVAILABLE_OBJECT')
+        self.assertIsNot(first.exception, second.exception)
+        self.assertEqual(str(first.exception), str(second.exception))
+
+    def test_failures_cleared_by_reset_caches(self):
+        with patch.object(self.appsettingshelper, '_do_import', side_effect=ImportError) as mocked_method:
+            with self.assertRaises(DefaultValueNotImportable):
+                self.appsettingshelper.get_module('UNAVAILABLE_MODULE')
+            self.appsettingshelper.reset_caches()
+            with self.assertRaises(DefaultValueNotImportable):
+                self.appsettingshelper.get_module('UNAVAILABLE_MODULE')
+        self.assertEqual(mocked_method.call_count, 2)
+
+    def test_override_value_failure_not_reused_after_setting_changed(self):
+        with self.assertRaises(DefaultValueNotImportable):
+            self.appsettingshelper.get_module('UNAVAILABLE_MODULE')
+        with override_settings(COGWHEELS_TESTS_UNAVAILABLE_MODULE='cogwheels.tests.modules.nope'):
+            with self.assertRaises(OverrideValueNotImportable):
+                self.appsettingshelper.get_module('UNAVAILABLE_MODULE')
+
+
+class InvalidatableSettingsHelper(BaseAppSettingsHelper):
+    defaults_path = 'cogwheels.tests.conf.defaults'
+    clear_failures_on_invalidate_caches = True
+
+
+class TestClearFailuresOnInvalidateCaches(TestCase):
+
+    def test_failures_cleared_by_importlib_invalidate_caches(self):
+        helper = InvalidatableSettingsHelper()
+        with self.assertRaises(DefaultValueNotImportable):
+            helper.get_module('UNAVAILABLE_MODULE')
+        self.assertEqual(len(helper._failures_cache), 1)
+        importlib.invalidate_caches()
+        self.assertEqual(len(helper._failures_cache), 0)
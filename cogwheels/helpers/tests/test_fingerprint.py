@@ -0,0 +1,95 @@
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from cogwheels.helpers import registry
+from cogwheels.tests.base import AppSettingTestCase
+
+
+class TestFingerprint(AppSettingTestCase):
+
+    def test_fingerprint_is_stable(self):
+        helper = self.appsettingshelper
+        first = helper.fingerprint()
+        helper.reset_caches()
+        self.assertEqual(helper.fingerprint(), first)
+        self.assertEqual(len(first), 40)
+
+    def test_fingerprint_memoized(self):
+        helper = self.appsettingshelper
+        helper.fingerprint()
+        with helper.assert_num_resolutions(0):
+            with patch.object(helper, '_value_digests') as mocked_digests:
+                helper.fingerprint()
+        self.assertFalse(mocked_digests.mock_calls)
+
+    def test_fingerprint_changes_with_override_values(self):
+        helper = self.appsettingshelper
+        original = helper.fingerprint()
+        with override_settings(COGWHEELS_TESTS_INTEGER_SETTING=2):
+            changed = helper.fingerprint()
+        self.assertNotEqual(changed, original)
+        self.assertEqual(helper.fingerprint(), original)
+
+    def test_only_affected_values_hashed_again(self):
+        helper = self.appsettingshelper
+        original = helper.fingerprint()
+        with override_settings(COGWHEELS_TESTS_INTEGER_SETTING=2):
+            # Derived settings that depend on the changed setting are affected
+            with helper.assert_num_resolutions(3) as context:
+                changed = helper.fingerprint()
+        self.assertEqual(sorted(name for kind, name in context.resolutions), [
+            'COGWHEELS_TESTS_DERIVED_FROM_DERIVED_SETTING',
+            'COGWHEELS_TESTS_DERIVED_SETTING',
+            'COGWHEELS_TESTS_INTEGER_SETTING',
+        ])
+        self.assertNotEqual(changed, original)
+
+    def test_unrelated_setting_changes_do_not_discard_fingerprint(self):
+        helper = self.appsettingshelper
+        original = helper.fingerprint()
+        with override_settings(UNRELATED_SETTING=True):
+            self.assertIsNotNone(helper._fingerprint)
+            self.assertEqual(helper.fingerprint(), original)
+
+    def test_fingerprint_changes_with_test_overrides(self):
+        helper = self.appsettingshelper
+        original = helper.fingerprint()
+        with helper.override_for_tests(STRING_SETTING='overridden'):
+            self.assertNotEqual(helper.fingerprint(), original)
+        self.assertEqual(helper.fingerprint(), original)
+
+    def test_fingerprint_ignores_ordering(self):
+        helper = self.appsettingshelper
+        with override_settings(COGWHEELS_TESTS_DICT_SETTING={'a': 1, 'b': {2, 3}}):
+            first = helper.fingerprint()
+        with override_settings(COGWHEELS_TESTS_DICT_SETTING={'b': {3, 2}, 'a': 1}):
+            self.assertEqual(helper.fingerprint(), first)
+
+
+class TestRegistryFingerprint(AppSettingTestCase):
+
+    def test_memoized_until_a_helper_changes(self):
+        original = registry.fingerprint()
+        helper = self.appsettingshelper
+        with patch.object(registry, 'get_helpers') as mocked_method:
+            self.assertEqual(registry.fingerprint(), original)
+            mocked_method.assert_not_called()
+        with helper.override_for_tests(INTEGER_SETTING=5):
+            self.assertNotEqual(registry.fingerprint(), original)
+        self.assertEqual(registry.fingerprint(), original)
+
+    def test_changes_when_any_helper_changes(self):
+        helpers = [self.appsettingshelper]
+        original = registry.fingerprint(helpers)
+        self.assertEqual(registry.fingerprint(helpers), original)
+        with self.appsettingshelper.override_for_tests(INTEGER_SETTING=5):
+            self.assertNotEqual(registry.fingerprint(helpers), original)
+        self.assertEqual(registry.fingerprint(helpers), original)
+
+    def test_uses_all_registered_helpers_by_default(self):
+        self.assertEqual(
+            registry.fingerprint(), registry.fingerprint(registry.get_helpers()))
+
+    def test_no_helpers(self):
+        self.assertIsNotNone(registry.fingerprint([]))
@@ -0,0 +1,78 @@
+import threading
+from collections import namedtuple
+from types import MappingProxyType
+
+from django.test import TestCase, override_settings
+
+from cogwheels import BaseAppSettingsHelper
+from cogwheels.tests.classes import ConfigurableClass
+
+
+class FreezingSettingsHelper(BaseAppSettingsHelper):
+    prefix = 'COGWHEELS_TESTS'
+    defaults_path = 'cogwheels.tests.conf.defaults'
+    freeze_values = True
+
+
+class TestFreezeValues(TestCase):
+
+    def setUp(self):
+        self.appsettingshelper = FreezingSettingsHelper()
+
+    def test_values_are_frozen_recursively(self):
+        value = self.appsettingshelper.DICT_SETTING
+        self.assertIsInstance(value, MappingProxyType)
+        self.assertIsInstance(value['backends']['default'], MappingProxyType)
+        self.assertEqual(value['handlers'], ('console', 'file'))
+        with self.assertRaises(TypeError):
+            value['backends']['default']['timeout'] = 1
+
+    @override_settings(COGWHEELS_TESTS_TUPLES_SETTING=[[1, 'One'], {2, 3}])
+    def test_lists_and_sets_are_frozen(self):
+        self.assertEqual(
+            self.appsettingshelper.TUPLES_SETTING, ((1, 'One'), frozenset({2, 3}))
+        )
+
+    def test_namedtuples_keep_their_type(self):
+        Point = namedtuple('Point', ('x', 'y'))
+        with override_settings(COGWHEELS_TESTS_TUPLES_SETTING=(Point(1, [2, 3]), Point(4, 5))):
+            first, second = self.appsettingshelper.TUPLES_SETTING
+        self.assertIsInstance(first, Point)
+        self.assertEqual(first.y, (2, 3))
+        self.assertIsInstance(second, Point)
+        self.assertEqual(second.x, 4)
+
+    def test_frozen_value_is_shared_from_cache(self):
+        self.assertIs(self.appsettingshelper.DICT_SETTING, self.appsettingshelper.DICT_SETTING)
+
+    def test_default_value_left_unchanged(self):
+        self.appsettingshelper.DICT_SETTING
+        self.assertIsInstance(self.appsettingshelper.get_default_value('DICT_SETTING'), dict)
+
+    def test_type_enforced_before_freezing(self):
+        value = self.appsettingshelper.get('DICT_SETTING', enforce_type=dict)
+        self.assertIsInstance(value, MappingProxyType)
+
+    @override_settings(COGWHEELS_TESTS_VALID_OBJECT={
+        'path': 'cogwheels.tests.classes.ConfigurableClass',
+        'options': {'timeout': 10},
+    })
+    def test_frozen_instance_options_accepted(self):
+        helper = self.appsettingshelper
+        helper.get('VALID_OBJECT')
+        instance = helper.get_instance('VALID_OBJECT')
+        self.assertIsInstance(instance, ConfigurableClass)
+        self.assertEqual(instance.kwargs, {'timeout': 10})
+
+    def test_frozen_value_shared_between_threads(self):
+        values = []
+        threads = [
+            threading.Thread(target=lambda: values.append(self.appsettingshelper.DICT_SETTING))
+            for i in range(2)
+        ]
+        self.appsettingshelper.DICT_SETTING
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertIs(values[0], values[1])
@@ -0,0 +1,61 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from cogwheels import DefaultValueTypeInvalid
+from cogwheels.tests.base import AppSettingTestCase
+from cogwheels.tests.classes import ConfigurableClass, handle_value
+from cogwheels.utils.inspection import CallableInfo
+
+
+class TestCallableInfo(SimpleTestCase):
+
+    def test_function_signature_flags(self):
+        info = CallableInfo(handle_value)
+        self.assertEqual(info.keyword_names, {'value', 'request'})
+        self.assertFalse(info.accepts_var_args)
+        self.assertFalse(info.accepts_var_kwargs)
+        self.assertTrue(info.accepts_kwarg('request'))
+        self.assertFalse(info.accepts_kwarg('user'))
+
+    def test_class_signature_flags(self):
+        info = CallableInfo(ConfigurableClass)
+        self.assertTrue(info.accepts_var_args)
+        self.assertTrue(info.accepts_var_kwargs)
+        self.assertTrue(info.accepts_kwarg('anything'))
+
+    def test_call_with_supported_kwargs(self):
+        info = CallableInfo(handle_value)
+        self.assertEqual(info.call_with_supported_kwargs(1, request='r', user='u'), (1, 'r'))
+        self.assertEqual(info(1, request='r'), (1, 'r'))
+
+    def test_signature_analysed_once(self):
+        with patch('cogwheels.utils.inspection.inspect.signature') as mocked_signature:
+            info = CallableInfo(handle_value)
+            info.accepts_kwarg('request')
+            info.call_with_supported_kwargs(1, request='r')
+        self.assertEqual(mocked_signature.call_count, 1)
+
+
+class TestGetCallable(AppSettingTestCase):
+
+    def test_returns_callable_info(self):
+        handler = self.appsettingshelper.get_callable('CALLABLE_OBJECT')
+        self.assertIs(handler.func, handle_value)
+        self.assertTrue(handler.accepts_kwarg('request'))
+        self.assertEqual(handler('value'), ('value', None))
+
+    def test_result_is_cached(self):
+        helper = self.appsettingshelper
+        self.assertIs(helper.get_callable('CALLABLE_OBJECT'), helper.get_callable('CALLABLE_OBJECT'))
+
+    def test_cache_cleared_with_object_cache(self):
+        helper = self.appsettingshelper
+        helper.get_callable('CALLABLE_OBJECT')
+        with override_settings(COGWHEELS_TESTS_CALLABLE_OBJECT='cogwheels.tests.classes.ConfigurableClass'):
+            self.assertIs(helper.get_callable('CALLABLE_OBJECT').func, ConfigurableClass)
+        self.assertIs(helper.get_callable('CALLABLE_OBJECT').func, handle_value)
+
+    def test_raises_error_if_object_not_callable(self):
+        with self.assertRaisesRegex(DefaultValueTypeInvalid, "an object of type 'str' was found"):
+            self.appsettingshelper.get_callable('NOT_CALLABLE_OBJECT')
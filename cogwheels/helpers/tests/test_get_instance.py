@@ -0,0 +1,106 @@
+import threading
+import time
+import warnings
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from cogwheels import OverrideValueFormatInvalid, OverrideValueTypeInvalid
+from cogwheels.tests.base import AppSettingTestCase
+from cogwheels.tests.classes import ConfigurableClass, DefaultClass
+
+
+class TestGetInstance(AppSettingTestCase):
+
+    def test_returns_instance_of_referenced_class(self):
+        self.assertIsInstance(self.appsettingshelper.get_instance('VALID_OBJECT'), DefaultClass)
+
+    def test_same_instance_returned_for_same_arguments(self):
+        helper = self.appsettingshelper
+        self.assertIs(helper.get_instance('VALID_OBJECT'), helper.get_instance('VALID_OBJECT'))
+
+    @override_settings(COGWHEELS_TESTS_VALID_OBJECT='cogwheels.tests.classes.ConfigurableClass')
+    def test_different_instance_created_for_different_arguments(self):
+        helper = self.appsettingshelper
+        first = helper.get_instance('VALID_OBJECT', 1, option='a')
+        self.assertIs(first, helper.get_instance('VALID_OBJECT', 1, option='a'))
+        self.assertIsNot(first, helper.get_instance('VALID_OBJECT', 2, option='a'))
+        self.assertIsNot(first, helper.get_instance('VALID_OBJECT', 1, option='b'))
+        self.assertEqual(first.args, (1,))
+        self.assertEqual(first.kwargs, {'option': 'a'})
+
+    def test_instances_discarded_by_reset_caches(self):
+        helper = self.appsettingshelper
+        first = helper.get_instance('VALID_OBJECT')
+        helper.reset_caches()
+        self.assertIsNot(first, helper.get_instance('VALID_OBJECT'))
+
+    @override_settings(COGWHEELS_TESTS_VALID_OBJECT={
+        'path': 'cogwheels.tests.classes.ConfigurableClass',
+        'options': {'timeout': 10, 'retries': 1},
+    })
+    def test_dictionary_value_with_options(self):
+        result = self.appsettingshelper.get_instance('VALID_OBJECT', retries=3)
+        self.assertIsInstance(result, ConfigurableClass)
+        self.assertEqual(result.kwargs, {'timeout': 10, 'retries': 3})
+
+    @override_settings(COGWHEELS_TESTS_VALID_OBJECT={'options': {}})
+    def test_dictionary_value_without_path_raises_error(self):
+        with self.assertRaises(OverrideValueFormatInvalid):
+            self.appsettingshelper.get_instance('VALID_OBJECT')
+
+    @override_settings(COGWHEELS_TESTS_VALID_OBJECT=1)
+    def test_raises_error_if_value_is_not_string_or_dictionary(self):
+        with self.assertRaises(OverrideValueTypeInvalid):
+            self.appsettingshelper.get_instance('VALID_OBJECT')
+
+    def test_deprecated_setting_raises_warning(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            self.appsettingshelper.get_instance('REPLACED_OBJECT_SETTING')
+        self.assertEqual(len(w), 1)
+        self.assertIn('/cogwheels/helpers/tests/test_get_instance.py', str(w[0]))
+
+    def test_deprecation_warning_options(self):
+        helper = self.appsettingshelper
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            helper.get_instance('REPLACED_OBJECT_SETTING', suppress_warnings=True)
+            helper.get_instance('REPLACED_OBJECT_SETTING', warn_only_if_overridden=True)
+        self.assertEqual(len(w), 0)
+
+        def request_instance():
+            return helper.get_instance('REPLACED_OBJECT_SETTING', warning_stacklevel=4)
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            request_instance()  # The warning should point to this line
+        self.assertEqual(w[0].lineno, request_instance.__code__.co_firstlineno + 5)
+
+    @override_settings(COGWHEELS_TESTS_REPLACED_OBJECT_SETTING='cogwheels.tests.classes.DefaultClass')
+    def test_replacement_setting_passes_warning_options(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            self.appsettingshelper.get_instance(
+                'REPLACEMENT_OBJECT_SETTING', suppress_warnings=True)
+        self.assertEqual(len(w), 0)
+
+    def test_instance_only_created_once_when_requested_by_multiple_threads(self):
+        helper = self.appsettingshelper
+        created = []
+
+        def slow_factory():
+            time.sleep(0.01)
+            created.append(object())
+            return created[-1]
+
+        with patch.object(helper, 'get_object', return_value=slow_factory):
+            threads = [
+                threading.Thread(target=helper.get_instance, args=('VALID_OBJECT',))
+                for i in range(5)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(len(created), 1)
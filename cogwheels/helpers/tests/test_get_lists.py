@@ -0,0 +1,87 @@
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from cogwheels import (
+    DefaultValueError, OverrideValueNotImportable, OverrideValueTypeInvalid
+)
+from cogwheels.tests.base import AppSettingTestCase
+from cogwheels.tests.classes import DefaultClass, ReplacementClass
+from cogwheels.tests.models import DefaultModel, ReplacementModel
+from cogwheels.tests.modules import default_module, replacement_module
+
+
+class TestGetLists(AppSettingTestCase):
+
+    def test_get_models(self):
+        self.assertEqual(
+            self.appsettingshelper.get_models('VALID_MODEL_LIST'),
+            (DefaultModel, ReplacementModel)
+        )
+
+    def test_get_modules(self):
+        self.assertEqual(
+            self.appsettingshelper.get_modules('VALID_MODULE_LIST'),
+            (default_module, replacement_module)
+        )
+
+    def test_get_objects(self):
+        self.assertEqual(
+            self.appsettingshelper.get_objects('VALID_OBJECT_LIST'),
+            (DefaultClass, ReplacementClass)
+        )
+
+    def test_get_objects_in_parallel(self):
+        self.assertEqual(
+            self.appsettingshelper.get_objects('VALID_OBJECT_LIST', max_workers=2),
+            (DefaultClass, ReplacementClass)
+        )
+
+    def test_result_is_cached(self):
+        helper = self.appsettingshelper
+        first = helper.get_objects('VALID_OBJECT_LIST')
+        with patch.object(helper, '_import_object') as mocked_method:
+            self.assertIs(helper.get_objects('VALID_OBJECT_LIST'), first)
+            mocked_method.assert_not_called()
+
+    def test_cache_cleared_by_reset_caches(self):
+        helper = self.appsettingshelper
+        first = helper.get_objects('VALID_OBJECT_LIST')
+        helper.reset_caches()
+        self.assertIsNot(helper.get_objects('VALID_OBJECT_LIST'), first)
+
+    def test_all_invalid_items_reported_together(self):
+        with self.assertRaises(DefaultValueError) as cm:
+            self.appsettingshelper.get_objects('INVALID_OBJECT_LIST')
+        message = str(cm.exception)
+        self.assertIn('3 of the 4 items could not be used.', message)
+        self.assertNotIn('Item 0', message)
+        self.assertIn("Item 1 ('DefaultClass'): 'DefaultClass' is not a valid object import path.", message)
+        self.assertIn("Item 2 ('cogwheels.tests.classes.NonExistent'): No object could be found", message)
+        self.assertIn("Item 3 (1): Items are expected to be a 'str'", message)
+
+    def test_invalid_items_reported_in_parallel(self):
+        with self.assertRaises(DefaultValueError) as cm:
+            self.appsettingshelper.get_objects('INVALID_OBJECT_LIST', max_workers=4)
+        self.assertIn('3 of the 4 items could not be used.', str(cm.exception))
+
+    @override_settings(COGWHEELS_TESTS_VALID_OBJECT_LIST=(
+        'cogwheels.tests.classes.NonExistent', 'cogwheels.tests.classes.Missing'
+    ))
+    def test_error_class_matches_items_if_all_failed_for_same_reason(self):
+        with self.assertRaises(OverrideValueNotImportable):
+            self.appsettingshelper.get_objects('VALID_OBJECT_LIST')
+
+    @override_settings(COGWHEELS_TESTS_VALID_OBJECT_LIST='cogwheels.tests.classes.DefaultClass')
+    def test_raises_error_if_value_not_list_or_tuple(self):
+        with self.assertRaises(OverrideValueTypeInvalid):
+            self.appsettingshelper.get_objects('VALID_OBJECT_LIST')
+
+    def test_failure_is_cached(self):
+        helper = self.appsettingshelper
+        with self.assertRaises(DefaultValueError):
+            helper.get_objects('INVALID_OBJECT_LIST')
+        with patch.object(helper, '_import_object') as mocked_method:
+            with self.assertRaises(DefaultValueError):
+                helper.get_objects('INVALID_OBJECT_LIST')
+            mocked_method.assert_not_called()
@@ -0,0 +1,106 @@
+import warnings
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from cogwheels import DefaultValueTypeInvalid, UnknownSettingNameError
+from cogwheels.tests.base import AppSettingTestCase
+from cogwheels.tests.classes import DefaultClass, ReplacementClass
+from cogwheels.tests.conf import defaults
+from cogwheels.tests.models import DefaultModel
+from cogwheels.tests.modules import default_module
+
+
+class TestGetManyMethod(AppSettingTestCase):
+
+    def test_returns_dictionary_of_values_by_default(self):
+        self.assertEqual(
+            self.appsettingshelper.get_many(['INTEGER_SETTING', 'STRING_SETTING']),
+            {
+                'INTEGER_SETTING': defaults.INTEGER_SETTING,
+                'STRING_SETTING': defaults.STRING_SETTING,
+            }
+        )
+
+    @override_settings(COGWHEELS_TESTS_STRING_SETTING='abc')
+    def test_returns_tuple_in_requested_order_if_as_tuple_is_true(self):
+        self.assertEqual(
+            self.appsettingshelper.get_many(
+                ('STRING_SETTING', 'INTEGER_SETTING', 'STRING_SETTING'), as_tuple=True
+            ),
+            ('abc', defaults.INTEGER_SETTING, 'abc')
+        )
+
+    def test_raises_error_if_any_setting_name_is_invalid(self):
+        with patch.object(self.appsettingshelper, 'get') as mocked_method:
+            with self.assertRaises(UnknownSettingNameError):
+                self.appsettingshelper.get_many(['INTEGER_SETTING', 'NOT_REAL_SETTING'])
+            mocked_method.assert_not_called()
+
+    def test_enforce_type_applies_to_each_setting(self):
+        with self.assertRaises(DefaultValueTypeInvalid):
+            self.appsettingshelper.get_many(
+                ['STRING_SETTING', 'INTEGER_SETTING'], enforce_type=str
+            )
+
+    @override_settings(COGWHEELS_TESTS_REPLACED_SETTING_TWO='two')
+    def test_accept_deprecated_is_applied_per_setting(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            result = self.appsettingshelper.get_many(
+                ['REPLACES_MULTIPLE'],
+                accept_deprecated={'REPLACES_MULTIPLE': 'REPLACED_SETTING_TWO'},
+            )
+        self.assertEqual(result, {'REPLACES_MULTIPLE': 'two'})
+
+    def test_deprecation_warning_raised_once_per_batch(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            self.appsettingshelper.get_many(
+                ['DEPRECATED_SETTING', 'INTEGER_SETTING', 'DEPRECATED_SETTING']
+            )
+        self.assertEqual(len(w), 1)
+        self.assertIn('/cogwheels/helpers/tests/test_get_many.py', str(w[0]))
+
+    def test_values_resolved_again_if_caches_reset_during_batch(self):
+        helper = self.appsettingshelper
+        original_get = helper.get
+        calls = []
+
+        def get_and_reset_once(setting_name, **kwargs):
+            calls.append(setting_name)
+            if len(calls) == 1:
+                helper.reset_caches()
+            return original_get(setting_name, **kwargs)
+
+        with patch.object(helper, 'get', side_effect=get_and_reset_once):
+            helper._get_many(helper.get, ['INTEGER_SETTING', 'STRING_SETTING'])
+        self.assertEqual(len(calls), 4)
+
+
+class TestTypedGetManyMethods(AppSettingTestCase):
+
+    def test_get_many_models(self):
+        self.assertEqual(
+            self.appsettingshelper.get_many_models(['VALID_MODEL'], as_tuple=True),
+            (DefaultModel,)
+        )
+
+    def test_get_many_modules(self):
+        self.assertEqual(
+            self.appsettingshelper.get_many_modules(['VALID_MODULE']),
+            {'VALID_MODULE': default_module}
+        )
+
+    @override_settings(
+        COGWHEELS_TESTS_REPLACED_OBJECT_SETTING='cogwheels.tests.classes.ReplacementClass'
+    )
+    def test_get_many_objects(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            result = self.appsettingshelper.get_many_objects(
+                ['VALID_OBJECT', 'REPLACEMENT_OBJECT_SETTING'], as_tuple=True
+            )
+        self.assertEqual(result, (DefaultClass, ReplacementClass))
+        self.assertEqual(len(w), 1)
+        self.assertIn('/cogwheels/helpers/tests/test_get_many.py', str(w[0]))
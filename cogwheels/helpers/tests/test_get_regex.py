@@ -0,0 +1,57 @@
+import re
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from cogwheels import DefaultValueFormatInvalid, OverrideValueFormatInvalid, OverrideValueTypeInvalid
+from cogwheels.tests.base import AppSettingTestCase
+
+
+class TestGetRegex(AppSettingTestCase):
+
+    def test_returns_compiled_pattern(self):
+        regex = self.appsettingshelper.get_regex('REGEX_SETTING')
+        self.assertEqual(regex.match('/some-slug/').group('slug'), 'some-slug')
+
+    def test_shortcut(self):
+        self.assertIs(
+            self.appsettingshelper.regexes.REGEX_SETTING,
+            self.appsettingshelper.get_regex('REGEX_SETTING')
+        )
+
+    def test_compiled_once_for_each_combination_of_flags(self):
+        helper = self.appsettingshelper
+        with patch('cogwheels.helpers.settings.re.compile', wraps=re.compile) as mocked_compile:
+            first = helper.get_regex('REGEX_SETTING')
+            self.assertIs(helper.get_regex('REGEX_SETTING'), first)
+            ignorecase = helper.get_regex('REGEX_SETTING', flags=re.IGNORECASE)
+            self.assertIs(helper.get_regex('REGEX_SETTING', flags=re.IGNORECASE), ignorecase)
+        self.assertEqual(mocked_compile.call_count, 2)
+        self.assertIsNot(first, ignorecase)
+        self.assertTrue(ignorecase.flags & re.IGNORECASE)
+
+    def test_cache_cleared_when_setting_changes(self):
+        helper = self.appsettingshelper
+        helper.get_regex('REGEX_SETTING')
+        with override_settings(COGWHEELS_TESTS_REGEX_SETTING=r'^\d+$'):
+            self.assertTrue(helper.get_regex('REGEX_SETTING').match('123'))
+
+    @override_settings(COGWHEELS_TESTS_REGEX_SETTING=re.compile(r'^\d+$'))
+    def test_compiled_pattern_values_accepted(self):
+        self.assertTrue(self.appsettingshelper.get_regex('REGEX_SETTING').match('123'))
+        with self.assertRaises(OverrideValueFormatInvalid):
+            self.appsettingshelper.get_regex('REGEX_SETTING', flags=re.IGNORECASE)
+
+    def test_invalid_default_pattern_raises_error(self):
+        with self.assertRaisesRegex(DefaultValueFormatInvalid, 'is not a valid regular expression: missing \\)'):
+            self.appsettingshelper.get_regex('INVALID_REGEX_SETTING')
+
+    @override_settings(COGWHEELS_TESTS_REGEX_SETTING='[')
+    def test_invalid_override_pattern_raises_error(self):
+        with self.assertRaises(OverrideValueFormatInvalid):
+            self.appsettingshelper.regexes.REGEX_SETTING
+
+    @override_settings(COGWHEELS_TESTS_REGEX_SETTING=1)
+    def test_invalid_type_raises_error(self):
+        with self.assertRaises(OverrideValueTypeInvalid):
+            self.appsettingshelper.get_regex('REGEX_SETTING')
@@ -0,0 +1,64 @@
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from cogwheels import SettingValueSource, UnknownSettingNameError
+from cogwheels.tests.base import AppSettingTestCase
+
+
+class TestGetSource(AppSettingTestCase):
+
+    def test_default_value(self):
+        self.assertEqual(
+            self.appsettingshelper.get_source('STRING_SETTING'),
+            SettingValueSource('default', 'STRING_SETTING', None)
+        )
+
+    def test_derived_value(self):
+        self.assertEqual(self.appsettingshelper.get_source('DERIVED_SETTING').kind, 'derived')
+
+    @override_settings(COGWHEELS_TESTS_STRING_SETTING='overridden')
+    def test_override_value(self):
+        source = self.appsettingshelper.get_source('STRING_SETTING')
+        self.assertEqual(
+            source,
+            SettingValueSource('override', 'STRING_SETTING', 'COGWHEELS_TESTS_STRING_SETTING')
+        )
+        self.assertTrue(source.is_overridden)
+
+    @override_settings(COGWHEELS_TESTS_REPLACED_SETTING_TWO='old')
+    def test_deprecated_override_value(self):
+        helper = self.appsettingshelper
+        self.assertEqual(helper.get_source('REPLACES_MULTIPLE').kind, 'default')
+        self.assertEqual(
+            helper.get_source('REPLACES_MULTIPLE', accept_deprecated='REPLACED_SETTING_TWO'),
+            SettingValueSource(
+                'deprecated_override', 'REPLACED_SETTING_TWO',
+                'COGWHEELS_TESTS_REPLACED_SETTING_TWO'
+            )
+        )
+
+    def test_test_override_value(self):
+        with self.appsettingshelper.override_for_tests(STRING_SETTING='overridden'):
+            self.assertEqual(
+                self.appsettingshelper.get_source('STRING_SETTING'),
+                SettingValueSource('test_override', 'STRING_SETTING', None)
+            )
+        self.assertEqual(self.appsettingshelper.get_source('STRING_SETTING').kind, 'default')
+
+    def test_source_recorded_when_value_requested(self):
+        helper = self.appsettingshelper
+        helper.get('STRING_SETTING')
+        with patch.object(helper, 'is_overridden') as mocked_method:
+            self.assertEqual(helper.get_source('STRING_SETTING').kind, 'default')
+            mocked_method.assert_not_called()
+
+    def test_source_updated_when_settings_change(self):
+        helper = self.appsettingshelper
+        self.assertEqual(helper.get_source('STRING_SETTING').kind, 'default')
+        with override_settings(COGWHEELS_TESTS_STRING_SETTING='overridden'):
+            self.assertEqual(helper.get_source('STRING_SETTING').kind, 'override')
+
+    def test_unknown_setting_name_raises_error(self):
+        with self.assertRaises(UnknownSettingNameError):
+            self.appsettingshelper.get_source('NOT_A_SETTING')
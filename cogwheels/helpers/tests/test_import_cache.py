@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from cogwheels import BaseAppSettingsHelper, DefaultValueNotImportable
+from cogwheels.helpers import imports
+from cogwheels.tests.modules import default_module
+
+
+class SettingsHelperOne(BaseAppSettingsHelper):
+    defaults_path = 'cogwheels.tests.conf.defaults'
+    prefix = 'ONE'
+
+
+class SettingsHelperTwo(BaseAppSettingsHelper):
+    defaults_path = 'cogwheels.tests.conf.defaults'
+    prefix = 'TWO'
+
+
+class TestImportModuleCached(TestCase):
+
+    def setUp(self):
+        imports.clear()
+
+    def tearDown(self):
+        imports.clear()
+
+    def test_module_only_imported_once(self):
+        with patch.object(imports, 'import_module', return_value=default_module) as mocked_method:
+            for i in range(3):
+                self.assertIs(imports.import_module_cached('some.module'), default_module)
+        self.assertEqual(mocked_method.call_count, 1)
+
+    def test_failure_cached_and_reraised_as_new_error(self):
+        with patch.object(imports, 'import_module', side_effect=ImportError('Nope')) as mocked_method:
+            with self.assertRaises(ImportError) as first:
+                imports.import_module_cached('some.module')
+            with self.assertRaises(ImportError) as second:
+                imports.import_module_cached('some.module')
+        self.assertEqual(mocked_method.call_count, 1)
+        self.assertIsNot(first.exception, second.exception)
+        self.assertEqual(second.exception.args, ('Nope',))
+
+    def test_clear_failures_keeps_modules(self):
+        imports.import_module_cached('cogwheels.tests.modules.default_module')
+        with self.assertRaises(ImportError):
+            imports.import_module_cached('cogwheels.tests.modules.nope')
+        imports.clear_failures()
+        self.assertEqual(imports._failures, {})
+        self.assertIn('cogwheels.tests.modules.default_module', imports._modules)
+
+
+class TestSharedBetweenHelpers(TestCase):
+
+    def setUp(self):
+        imports.clear()
+
+    def tearDown(self):
+        imports.clear()
+
+    def test_modules_and_objects_imported_once_for_all_helpers(self):
+        helpers = (SettingsHelperOne(), SettingsHelperTwo())
+        with patch.object(imports, 'import_module', wraps=imports.import_module) as mocked_method:
+            for helper in helpers:
+                helper.get_module('VALID_MODULE')
+                helper.get_object('VALID_OBJECT')
+        self.assertEqual(mocked_method.call_count, 2)
+
+    def test_failures_retried_after_settings_change(self):
+        helper_one = SettingsHelperOne()
+        helper_two = SettingsHelperTwo()
+        with patch.object(imports, 'import_module', side_effect=ImportError) as mocked_method:
+            with self.assertRaises(DefaultValueNotImportable):
+                helper_one.get_module('UNAVAILABLE_MODULE')
+            with self.assertRaises(DefaultValueNotImportable):
+                helper_two.get_module('UNAVAILABLE_MODULE')
+            self.assertEqual(mocked_method.call_count, 1)
+            with override_settings(UNRELATED_SETTING=True):
+                with self.assertRaises(DefaultValueNotImportable):
+                    helper_two.get_module('UNAVAILABLE_MODULE')
+        self.assertEqual(mocked_method.call_count, 2)
@@ -0,0 +1,71 @@
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from cogwheels import (
+    DefaultValueTypeInvalid, OverrideValueFormatInvalid, OverrideValueTypeInvalid
+)
+from cogwheels.tests.base import AppSettingTestCase
+
+
+class TestIndexes(AppSettingTestCase):
+
+    def test_get_choices_map(self):
+        choices_map = self.appsettingshelper.get_choices_map('TUPLES_SETTING')
+        self.assertEqual(choices_map, {1: 'One', 2: 'Two', 3: 'Three', 4: 'Four'})
+        with self.assertRaises(TypeError):
+            choices_map[5] = 'Five'
+
+    def test_get_reverse_choices_map(self):
+        self.assertEqual(
+            self.appsettingshelper.get_reverse_choices_map('TUPLES_SETTING'),
+            {'One': 1, 'Two': 2, 'Three': 3, 'Four': 4}
+        )
+
+    @override_settings(COGWHEELS_TESTS_TUPLES_SETTING=(
+        (1, 'One'),
+        ('Group', ((2, 'Two'), (3, 'Three'))),
+    ))
+    def test_grouped_choices_are_flattened(self):
+        self.assertEqual(
+            self.appsettingshelper.get_choices_map('TUPLES_SETTING'),
+            {1: 'One', 2: 'Two', 3: 'Three'}
+        )
+
+    @override_settings(COGWHEELS_TESTS_TUPLES_SETTING=(1, 2, 3))
+    def test_invalid_choices_raise_error(self):
+        with self.assertRaises(OverrideValueFormatInvalid):
+            self.appsettingshelper.get_choices_map('TUPLES_SETTING')
+
+    def test_get_frozenset(self):
+        self.assertEqual(
+            self.appsettingshelper.get_frozenset('DICT_SETTING'),
+            frozenset({'backends', 'handlers', 'debug'})
+        )
+
+    @override_settings(COGWHEELS_TESTS_STRING_SETTING=[['unhashable']])
+    def test_unhashable_items_raise_error(self):
+        with self.assertRaises(OverrideValueTypeInvalid):
+            self.appsettingshelper.get_frozenset('STRING_SETTING')
+
+    def test_string_values_raise_error(self):
+        with self.assertRaises(DefaultValueTypeInvalid):
+            self.appsettingshelper.get_frozenset('STRING_SETTING')
+        with override_settings(COGWHEELS_TESTS_STRING_SETTING=b'bytes'):
+            with self.assertRaises(OverrideValueTypeInvalid):
+                self.appsettingshelper.get_frozenset('STRING_SETTING')
+
+    def test_index_is_cached(self):
+        helper = self.appsettingshelper
+        first = helper.get_choices_map('TUPLES_SETTING')
+        with patch.object(helper, '_build_choices_map') as mocked_method:
+            self.assertIs(helper.get_choices_map('TUPLES_SETTING'), first)
+            mocked_method.assert_not_called()
+
+    def test_index_invalidated_by_reset_caches(self):
+        helper = self.appsettingshelper
+        self.assertIn(1, helper.get_choices_map('TUPLES_SETTING'))
+        with override_settings(COGWHEELS_TESTS_TUPLES_SETTING=((5, 'Five'),)):
+            self.assertNotIn(1, helper.get_choices_map('TUPLES_SETTING'))
+            self.assertIn('Five', helper.get_reverse_choices_map('TUPLES_SETTING'))
+        self.assertIn(1, helper.get_choices_map('TUPLES_SETTING'))
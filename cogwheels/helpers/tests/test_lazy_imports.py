@@ -0,0 +1,103 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from django.test import SimpleTestCase
+
+import cogwheels
+from cogwheels import exceptions, helpers
+from cogwheels.utils.lazy import LAZY_ATTRIBUTES_SUPPORTED
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+# Imports cogwheels with the lazy attributes fallback for Python < 3.7 forced
+FORCE_EAGER_IMPORTS = """
+import importlib.util, os, sys
+spec = importlib.util.spec_from_file_location(
+    'cogwheels.utils.lazy', os.path.join('cogwheels', 'utils', 'lazy.py'))
+lazy = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(lazy)
+lazy.LAZY_ATTRIBUTES_SUPPORTED = False
+sys.modules['cogwheels.utils.lazy'] = lazy
+"""
+
+
+def get_imported_module_names(statement):
+    """
+    Runs ``statement`` in a fresh Python process, and returns the names of
+    all modules that were imported by the end of it.
+    """
+    env = dict(os.environ)
+    env.pop('DJANGO_SETTINGS_MODULE', None)
+    script = "{}\nimport sys\nprint('\\n'.join(sys.modules))".format(statement)
+    result = subprocess.run(
+        [sys.executable, '-c', script],
+        cwd=PROJECT_ROOT, env=env, check=True,
+        stdout=subprocess.PIPE, universal_newlines=True,
+    )
+    return set(result.stdout.splitlines())
+
+
+class TestPublicAPI(SimpleTestCase):
+
+    def test_attributes_available(self):
+        from cogwheels import (  # noqa
+            BaseAppSettingsHelper, DeprecatedAppSetting, DeprecationUsageCollector,
+            DerivedAppSetting, derived, SettingValueSource, OverrideValueError,
+            DefaultValueNotImportable, UnknownSettingNameError,
+        )
+        from cogwheels.helpers.settings import BaseAppSettingsHelper as OriginalClass
+        from cogwheels.exceptions.settings import SettingValueError
+        self.assertIs(BaseAppSettingsHelper, OriginalClass)
+        self.assertIs(helpers.BaseAppSettingsHelper, OriginalClass)
+        self.assertIs(exceptions.SettingValueError, SettingValueError)
+        self.assertTrue(callable(helpers.derived))
+
+    def test_unknown_attribute_raises_attributeerror(self):
+        with self.assertRaises(AttributeError):
+            cogwheels.NonExistent
+        with self.assertRaises(ImportError):
+            from cogwheels.exceptions import NonExistent  # noqa
+
+    def test_dir_includes_lazy_attributes(self):
+        self.assertIn('BaseAppSettingsHelper', dir(cogwheels))
+        self.assertIn('CircularDependencyError', dir(exceptions))
+
+    def test_star_imports(self):
+        for module in (cogwheels, exceptions, helpers):
+            namespace = {}
+            exec('from {} import *'.format(module.__name__), namespace)
+            self.assertIn('__all__', module.__dict__)
+            for name in module.__all__:
+                self.assertIs(namespace[name], getattr(module, name))
+        self.assertIn('BaseAppSettingsHelper', cogwheels.__all__)
+        self.assertIn('derived', helpers.__all__)
+        self.assertIn('CircularDependencyError', exceptions.__all__)
+
+    def test_eager_imports_fallback(self):
+        imported = get_imported_module_names(FORCE_EAGER_IMPORTS + (
+            "import cogwheels\n"
+            "assert cogwheels.__dict__['BaseAppSettingsHelper']\n"
+            "assert cogwheels.__dict__['OverrideValueError']\n"
+            "assert '__getattr__' not in cogwheels.__dict__"
+        ))
+        self.assertIn('cogwheels.helpers.settings', imported)
+
+
+@unittest.skipUnless(LAZY_ATTRIBUTES_SUPPORTED, "Requires Python 3.7+")
+class TestLazyImports(SimpleTestCase):
+
+    def test_importing_cogwheels_does_not_import_django(self):
+        imported = get_imported_module_names('import cogwheels')
+        self.assertIn('cogwheels', imported)
+        self.assertNotIn('cogwheels.helpers', imported)
+        self.assertNotIn('cogwheels.exceptions', imported)
+        self.assertNotIn('django.conf', imported)
+
+    def test_importing_exceptions_does_not_import_helpers(self):
+        imported = get_imported_module_names('from cogwheels import OverrideValueError')
+        self.assertIn('cogwheels.exceptions.settings', imported)
+        self.assertNotIn('cogwheels.helpers', imported)
+        self.assertNotIn('django.conf', imported)
@@ -0,0 +1,130 @@
+import warnings
+
+from django.test import override_settings
+
+from cogwheels import BaseAppSettingsHelper, exceptions
+from cogwheels.tests.base import AppSettingTestCase
+
+
+class MergingSettingsHelper(BaseAppSettingsHelper):
+    defaults_path = 'cogwheels.tests.conf.defaults'
+    prefix = 'COGWHEELS_TESTS'
+    deep_merge_settings = ('DICT_SETTING',)
+
+
+class TestOnChange(AppSettingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.calls = []
+        self.removers = []
+
+    def tearDown(self):
+        for remove in self.removers:
+            remove()
+
+    def subscribe(self, setting_name, settings_helper=None):
+        def callback(old_value, new_value):
+            self.calls.append((setting_name, old_value, new_value))
+        settings_helper = settings_helper or self.appsettingshelper
+        self.removers.append(settings_helper.on_change(setting_name, callback))
+
+    def test_called_with_old_and_new_values(self):
+        self.subscribe('INTEGER_SETTING')
+        with override_settings(COGWHEELS_TESTS_INTEGER_SETTING=2):
+            self.assertEqual(self.calls, [('INTEGER_SETTING', 1, 2)])
+        self.assertEqual(self.calls, [
+            ('INTEGER_SETTING', 1, 2),
+            ('INTEGER_SETTING', 2, 1),
+        ])
+
+    def test_not_called_for_unrelated_changes(self):
+        self.subscribe('INTEGER_SETTING')
+        with override_settings(COGWHEELS_TESTS_STRING_SETTING='changed', UNRELATED_SETTING=1):
+            pass
+        self.assertEqual(self.calls, [])
+
+    def test_not_called_when_value_unchanged(self):
+        self.subscribe('INTEGER_SETTING')
+        with override_settings(COGWHEELS_TESTS_INTEGER_SETTING=1):
+            pass
+        self.appsettingshelper.reset_caches()
+        self.assertEqual(self.calls, [])
+
+    def test_called_when_derived_setting_changes(self):
+        self.subscribe('DERIVED_SETTING')
+        with override_settings(COGWHEELS_TESTS_INTEGER_SETTING=2):
+            pass
+        self.assertEqual(self.calls, [
+            ('DERIVED_SETTING', 1000, 2000),
+            ('DERIVED_SETTING', 2000, 1000),
+        ])
+
+    def test_called_when_deprecated_setting_changes(self):
+        self.subscribe('RENAMED_SETTING_NEW')
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            with override_settings(COGWHEELS_TESTS_RENAMED_SETTING_OLD='old'):
+                pass
+        self.assertFalse([
+            warning for warning in w if 'COGWHEELS_TESTS_' in str(warning.message)
+        ])
+        self.assertEqual(self.calls, [
+            ('RENAMED_SETTING_NEW', 'renamed_new', 'old'),
+            ('RENAMED_SETTING_NEW', 'old', 'renamed_new'),
+        ])
+
+    def test_called_for_override_for_tests(self):
+        self.subscribe('STRING_SETTING')
+        with self.appsettingshelper.override_for_tests(STRING_SETTING='test'):
+            pass
+        self.assertEqual(self.calls, [
+            ('STRING_SETTING', 'stringy', 'test'),
+            ('STRING_SETTING', 'test', 'stringy'),
+        ])
+
+    def test_removed_callback_not_called(self):
+        self.subscribe('INTEGER_SETTING')
+        self.removers.pop()()
+        self.assertNotIn('INTEGER_SETTING', self.appsettingshelper._change_callbacks)
+        with override_settings(COGWHEELS_TESTS_INTEGER_SETTING=2):
+            pass
+        self.assertEqual(self.calls, [])
+
+    def test_invalid_setting_name(self):
+        with self.assertRaises(exceptions.UnknownSettingNameError):
+            self.appsettingshelper.on_change('NOT_A_SETTING', lambda old, new: None)
+
+    def test_resolution_errors_logged_and_callbacks_skipped(self):
+        helper = MergingSettingsHelper()
+        self.subscribe('DICT_SETTING', helper)
+        self.subscribe('INTEGER_SETTING', helper)
+        with self.assertLogs('cogwheels', 'ERROR') as logs:
+            with override_settings(
+                COGWHEELS_TESTS_DICT_SETTING='not a dict',
+                COGWHEELS_TESTS_INTEGER_SETTING=2,
+            ):
+                pass
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn('COGWHEELS_TESTS_DICT_SETTING', logs.output[0])
+        self.assertIsInstance(logs.records[0].exc_info[1], exceptions.OverrideValueTypeInvalid)
+        # The value returned to normal, so there was no change to report
+        self.assertEqual(self.calls, [
+            ('INTEGER_SETTING', 1, 2),
+            ('INTEGER_SETTING', 2, 1),
+        ])
+
+    def test_callback_errors_logged_and_other_callbacks_called(self):
+        def callback(old_value, new_value):
+            raise ValueError('Nope')
+        self.removers.append(self.appsettingshelper.on_change('INTEGER_SETTING', callback))
+        self.subscribe('INTEGER_SETTING')
+        with self.assertLogs('cogwheels', 'ERROR') as logs:
+            with override_settings(COGWHEELS_TESTS_INTEGER_SETTING=2):
+                pass
+        self.assertEqual(len(logs.records), 2)
+        self.assertIsInstance(logs.records[0].exc_info[1], ValueError)
+        self.assertEqual(self.calls, [
+            ('INTEGER_SETTING', 1, 2),
+            ('INTEGER_SETTING', 2, 1),
+        ])
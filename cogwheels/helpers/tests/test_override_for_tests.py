@@ -0,0 +1,104 @@
+import warnings
+
+from django.conf import settings as django_settings
+from django.core.signals import setting_changed
+from django.test import TestCase
+
+from cogwheels import OverrideValueNotImportable, UnknownSettingNameError
+from cogwheels.tests.base import AppSettingTestCase
+from cogwheels.tests.classes import ReplacementClass
+from cogwheels.tests.conf import settings
+
+
+class TestOverrideForTests(AppSettingTestCase):
+
+    def test_value_overridden_within_block(self):
+        helper = self.appsettingshelper
+        with helper.override_for_tests(STRING_SETTING='overridden'):
+            self.assertEqual(helper.STRING_SETTING, 'overridden')
+            self.assertTrue(helper.is_overridden('STRING_SETTING'))
+        self.assertEqual(helper.STRING_SETTING, 'stringy')
+
+    def test_django_settings_untouched(self):
+        received = []
+
+        def receiver(**kwargs):
+            received.append(kwargs['setting'])
+
+        setting_changed.connect(receiver)
+        try:
+            with self.appsettingshelper.override_for_tests(STRING_SETTING='overridden'):
+                self.assertFalse(hasattr(django_settings, 'COGWHEELS_TESTS_STRING_SETTING'))
+        finally:
+            setting_changed.disconnect(receiver)
+        self.assertEqual(received, [])
+
+    def test_other_cached_values_left_intact(self):
+        helper = self.appsettingshelper
+        helper.get('INTEGER_SETTING')
+        helper.get_object('VALID_OBJECT')
+        helper.get('STRING_SETTING')
+        with helper.override_for_tests(STRING_SETTING='overridden'):
+            self.assertIn('INTEGER_SETTING', helper._raw_cache)
+            self.assertIn('VALID_OBJECT', helper._objects_cache)
+            self.assertNotIn('STRING_SETTING', helper._raw_cache)
+        self.assertIn('INTEGER_SETTING', helper._raw_cache)
+        self.assertNotIn('STRING_SETTING', helper._raw_cache)
+
+    def test_imported_values_and_failures_replaced(self):
+        helper = self.appsettingshelper
+        helper.get_object('VALID_OBJECT')
+        with helper.override_for_tests(VALID_OBJECT='cogwheels.tests.classes.ReplacementClass'):
+            self.assertIs(helper.objects.VALID_OBJECT, ReplacementClass)
+        with helper.override_for_tests(VALID_OBJECT='cogwheels.tests.classes.NonExistent'):
+            with self.assertRaises(OverrideValueNotImportable):
+                helper.get_object('VALID_OBJECT')
+        self.assertIsNot(helper.objects.VALID_OBJECT, ReplacementClass)
+
+    def test_derived_settings_recomputed(self):
+        helper = self.appsettingshelper
+        self.assertEqual(helper.DERIVED_FROM_DERIVED_SETTING, 1001)
+        with helper.override_for_tests(INTEGER_SETTING=2):
+            self.assertEqual(helper.DERIVED_FROM_DERIVED_SETTING, 2001)
+        self.assertEqual(helper.DERIVED_FROM_DERIVED_SETTING, 1001)
+
+    def test_deprecated_setting_values_used_for_replacements(self):
+        helper = self.appsettingshelper
+        with helper.override_for_tests(RENAMED_SETTING_OLD='old'):
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("always")
+                self.assertEqual(helper.RENAMED_SETTING_NEW, 'old')
+            self.assertEqual(len(w), 1)
+
+    def test_nested_overrides(self):
+        helper = self.appsettingshelper
+        with helper.override_for_tests(STRING_SETTING='outer', INTEGER_SETTING=2):
+            with helper.override_for_tests(STRING_SETTING='inner'):
+                self.assertEqual(helper.get_many(['STRING_SETTING', 'INTEGER_SETTING'], as_tuple=True), ('inner', 2))
+            self.assertEqual(helper.STRING_SETTING, 'outer')
+        self.assertEqual(helper.STRING_SETTING, 'stringy')
+
+    def test_overrides_survive_reset_caches(self):
+        helper = self.appsettingshelper
+        with helper.override_for_tests(STRING_SETTING='overridden'):
+            helper.reset_caches()
+            self.assertEqual(helper.STRING_SETTING, 'overridden')
+
+    def test_unknown_setting_name_raises_error(self):
+        with self.assertRaises(UnknownSettingNameError):
+            with self.appsettingshelper.override_for_tests(NOT_A_SETTING=1):
+                pass
+
+    def test_function_decorator(self):
+        @self.appsettingshelper.override_for_tests(STRING_SETTING='decorated')
+        def get_value():
+            return self.appsettingshelper.STRING_SETTING
+        self.assertEqual(get_value(), 'decorated')
+        self.assertEqual(self.appsettingshelper.STRING_SETTING, 'stringy')
+
+
+@settings.override_for_tests(STRING_SETTING='decorated')
+class TestOverrideForTestsClassDecorator(TestCase):
+
+    def test_value_overridden(self):
+        self.assertEqual(settings.STRING_SETTING, 'decorated')
@@ -0,0 +1,200 @@
+import asyncio
+import copy
+import sys
+import traceback
+import unittest
+import warnings
+from types import MappingProxyType
+from unittest.mock import patch
+
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+
+from cogwheels import BaseAppSettingsHelper, exceptions
+from cogwheels.helpers.snapshot import pin_snapshots, unpin_snapshots
+from cogwheels.middleware import SettingsSnapshotMiddleware
+from cogwheels.tests.base import AppSettingTestCase
+
+
+class MergingSettingsHelper(BaseAppSettingsHelper):
+    defaults_path = 'cogwheels.tests.conf.defaults'
+    prefix = 'COGWHEELS_TESTS'
+    deep_merge_settings = ('DICT_SETTING',)
+
+
+class FrozenSettingsHelper(BaseAppSettingsHelper):
+    defaults_path = 'cogwheels.tests.conf.defaults'
+    prefix = 'COGWHEELS_TESTS'
+    freeze_values = True
+
+
+class TestSnapshot(AppSettingTestCase):
+
+    def test_values_unaffected_by_changes(self):
+        snapshot = self.appsettingshelper.snapshot()
+        with override_settings(COGWHEELS_TESTS_INTEGER_SETTING=2):
+            self.assertEqual(snapshot.INTEGER_SETTING, 1)
+            self.assertEqual(snapshot.get('DERIVED_SETTING'), 1000)
+            self.assertEqual(self.appsettingshelper.INTEGER_SETTING, 2)
+
+    def test_reused_until_settings_change(self):
+        helper = self.appsettingshelper
+        snapshot = helper.snapshot()
+        self.assertIs(helper.snapshot(), snapshot)
+        with override_settings(UNRELATED_SETTING=True):
+            self.assertIs(helper.snapshot(), snapshot)
+        with helper.override_for_tests(INTEGER_SETTING=2):
+            self.assertIsNot(helper.snapshot(), snapshot)
+            self.assertEqual(helper.snapshot().INTEGER_SETTING, 2)
+
+    def test_deprecation_warnings_raised(self):
+        snapshot = self.appsettingshelper.snapshot()
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            snapshot.DEPRECATED_SETTING
+        self.assertEqual(len(w), 1)
+        self.assertEqual(w[0].filename, __file__)
+
+    def test_invalid_setting_name(self):
+        snapshot = self.appsettingshelper.snapshot()
+        with self.assertRaises(exceptions.UnknownSettingNameError):
+            snapshot.NOT_A_SETTING
+        with self.assertRaises(AttributeError):
+            snapshot.not_a_setting
+
+    @override_settings(COGWHEELS_TESTS_DICT_SETTING='not a dict')
+    def test_errors_raised_when_value_requested(self):
+        snapshot = MergingSettingsHelper().snapshot()
+        self.assertEqual(snapshot.INTEGER_SETTING, 1)
+        errors = []
+        for i in range(2):
+            try:
+                snapshot.DICT_SETTING
+            except exceptions.OverrideValueTypeInvalid as e:
+                errors.append(e)
+                # Includes the traceback from when the value was resolved
+                frames = traceback.extract_tb(e.__traceback__)
+                self.assertIn('_prepare_value', [frame[2] for frame in frames])
+        # A new error is raised each time
+        self.assertEqual(len(errors), 2)
+        self.assertIsNot(errors[0], errors[1])
+        self.assertEqual(errors[0].args, errors[1].args)
+
+    @override_settings(COGWHEELS_TESTS_STRING_SETTING=None)
+    def test_any_error_raised_when_value_requested(self):
+        # Derived settings can raise any kind of error
+        snapshot = self.appsettingshelper.snapshot()
+        with self.assertRaises(AttributeError):
+            snapshot.EXPLICIT_DEPENDENCY_DERIVED_SETTING
+        self.assertEqual(snapshot.STRING_SETTING, None)
+
+    def test_values_same_as_helper_values(self):
+        helper = self.appsettingshelper
+        snapshot = helper.snapshot()
+        self.assertIs(snapshot.DICT_SETTING, helper.get('DICT_SETTING'))
+        self.assertIs(snapshot.VALID_OBJECT_LIST, helper.get('VALID_OBJECT_LIST'))
+        self.assertEqual(copy.deepcopy(snapshot.DICT_SETTING), helper.get('DICT_SETTING'))
+
+    def test_values_frozen_if_helper_freezes_values(self):
+        snapshot = FrozenSettingsHelper().snapshot()
+        self.assertIsInstance(snapshot.DICT_SETTING, MappingProxyType)
+        self.assertEqual(snapshot.DICT_SETTING['handlers'], ('console', 'file'))
+
+    @override_settings(COGWHEELS_TESTS_RENAMED_SETTING_OLD='old')
+    def test_old_setting_name_warnings_raised(self):
+        snapshot = self.appsettingshelper.snapshot()
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            self.assertEqual(snapshot.RENAMED_SETTING_NEW, 'old')
+        self.assertEqual(len(w), 1)
+        self.assertIn('COGWHEELS_TESTS_RENAMED_SETTING_OLD', str(w[0].message))
+        self.assertEqual(w[0].filename, __file__)
+
+    def test_warn_only_if_overridden(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            snapshot = self.appsettingshelper.snapshot()
+            snapshot.get('DEPRECATED_SETTING', warn_only_if_overridden=True)
+            self.assertEqual(len(w), 0)
+            with override_settings(COGWHEELS_TESTS_DEPRECATED_SETTING='overridden'):
+                snapshot = self.appsettingshelper.snapshot()
+                snapshot.get('DEPRECATED_SETTING', warn_only_if_overridden=True)
+                snapshot.get('DEPRECATED_SETTING', suppress_warnings=True)
+        self.assertEqual(len(w), 1)
+        self.assertIn('override value', str(w[0].message))
+        self.assertEqual(w[0].filename, __file__)
+
+    def test_attributes_cannot_be_set(self):
+        snapshot = self.appsettingshelper.snapshot()
+        with self.assertRaises(AttributeError):
+            snapshot.INTEGER_SETTING = 2
+        with self.assertRaises(AttributeError):
+            snapshot._values = {}
+        with self.assertRaises(AttributeError):
+            del snapshot.settings_helper
+        self.assertEqual(snapshot.INTEGER_SETTING, 1)
+
+    def test_helper_attributes_use_pinned_snapshot(self):
+        helper = self.appsettingshelper
+        token = pin_snapshots([helper])
+        try:
+            with override_settings(COGWHEELS_TESTS_INTEGER_SETTING=2):
+                self.assertEqual(helper.INTEGER_SETTING, 1)
+                self.assertEqual(helper.get('INTEGER_SETTING'), 2)
+        finally:
+            unpin_snapshots(token)
+        self.assertEqual(helper.INTEGER_SETTING, 1)
+
+    def test_pinned_snapshots_only_looked_up_while_pinned(self):
+        helper = self.appsettingshelper
+        self.assertEqual(helper._pinned_snapshots, 0)
+        with patch('cogwheels.helpers.settings.current_snapshots') as mocked_var:
+            helper.INTEGER_SETTING
+        mocked_var.get.assert_not_called()
+        token = pin_snapshots([helper])
+        self.assertEqual(helper._pinned_snapshots, 1)
+        unpin_snapshots(token)
+        self.assertEqual(helper._pinned_snapshots, 0)
+
+
+class TestSettingsSnapshotMiddleware(AppSettingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.request = RequestFactory().get('/')
+
+    def test_values_consistent_during_request(self):
+        helper = self.appsettingshelper
+        values = []
+
+        def view(request):
+            values.append(helper.INTEGER_SETTING)
+            with override_settings(COGWHEELS_TESTS_INTEGER_SETTING=2):
+                values.append(helper.INTEGER_SETTING)
+            return HttpResponse()
+
+        SettingsSnapshotMiddleware(view)(self.request)
+        self.assertEqual(values, [1, 1])
+
+    def test_new_values_used_by_next_request(self):
+        helper = self.appsettingshelper
+        middleware = SettingsSnapshotMiddleware(
+            lambda request: HttpResponse(str(helper.INTEGER_SETTING)))
+        self.assertEqual(middleware(self.request).content, b'1')
+        with override_settings(COGWHEELS_TESTS_INTEGER_SETTING=2):
+            self.assertEqual(middleware(self.request).content, b'2')
+
+    @unittest.skipIf(sys.version_info < (3, 5), "Requires Python 3.5+")
+    def test_async_requests(self):
+        from cogwheels.tests.coroutines import make_async_view
+        helper = self.appsettingshelper
+        values = []
+        middleware = SettingsSnapshotMiddleware(make_async_view(helper, values))
+        self.assertTrue(asyncio.iscoroutinefunction(middleware))
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(middleware(self.request))
+        finally:
+            loop.close()
+        self.assertEqual(values, [1, 1])
+        self.assertEqual(helper.INTEGER_SETTING, 1)
@@ -0,0 +1,121 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from cogwheels import OverrideValueFormatInvalid, OverrideValueTypeInvalid
+from cogwheels.helpers.units import Rate, parse_bytes, parse_duration, parse_rate
+from cogwheels.tests.base import AppSettingTestCase
+
+
+class TestParsers(SimpleTestCase):
+
+    def test_parse_duration(self):
+        for value, expected in (
+            ('30s', timedelta(seconds=30)),
+            ('5m', timedelta(minutes=5)),
+            ('1h 30m', timedelta(hours=1, minutes=30)),
+            ('2 days', timedelta(days=2)),
+            ('1.5h', timedelta(minutes=90)),
+            ('250ms', timedelta(milliseconds=250)),
+            (45, timedelta(seconds=45)),
+            (timedelta(hours=1), timedelta(hours=1)),
+        ):
+            with self.subTest(value=value):
+                self.assertEqual(parse_duration(value), expected)
+
+    def test_parse_duration_invalid_values(self):
+        for value in ('', '30', '5 fortnights', 's', '1h and 30m'):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_duration(value)
+        for value in (None, True, ['30s']):
+            with self.subTest(value=value):
+                with self.assertRaises(TypeError):
+                    parse_duration(value)
+
+    def test_parse_bytes(self):
+        for value, expected in (
+            ('512B', 512),
+            ('512', 512),
+            ('10MB', 10000000),
+            ('10 mb', 10000000),
+            ('1.5KiB', 1536),
+            ('2GiB', 2 * 1024 ** 3),
+            (1024, 1024),
+        ):
+            with self.subTest(value=value):
+                self.assertEqual(parse_bytes(value), expected)
+
+    def test_parse_bytes_invalid_values(self):
+        for value in ('', 'MB', '10 megabytes', '10MB 5KB'):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_bytes(value)
+
+    def test_parse_rate(self):
+        for value, expected in (
+            ('100/min', Rate(100, 60)),
+            ('10/s', Rate(10, 1)),
+            ('1000/5m', Rate(1000, 300)),
+            ('5/ day', Rate(5, 86400)),
+        ):
+            with self.subTest(value=value):
+                self.assertEqual(parse_rate(value), expected)
+        self.assertEqual(parse_rate('120/min').per_second, 2)
+
+    def test_parse_rate_invalid_values(self):
+        for value in ('100', '/min', 'ten/min', '-5/min', '100/0s', '100/fortnight'):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_rate(value)
+        with self.assertRaises(TypeError):
+            parse_rate(100)
+
+
+class TestUnitGetters(AppSettingTestCase):
+
+    def test_get_timedelta(self):
+        self.assertEqual(
+            self.appsettingshelper.get_timedelta('DURATION_SETTING'), timedelta(minutes=90)
+        )
+
+    def test_get_seconds(self):
+        self.assertEqual(self.appsettingshelper.get_seconds('DURATION_SETTING'), 5400)
+
+    def test_get_bytes(self):
+        self.assertEqual(self.appsettingshelper.get_bytes('SIZE_SETTING'), 10000000)
+
+    def test_get_rate(self):
+        self.assertEqual(self.appsettingshelper.get_rate('RATE_SETTING'), Rate(100, 60))
+
+    @override_settings(COGWHEELS_TESTS_RATE_SETTING='-5/min')
+    def test_negative_rate_raises_error(self):
+        with self.assertRaisesRegex(OverrideValueFormatInvalid, "'-5/min' is not a valid rate"):
+            self.appsettingshelper.get_rate('RATE_SETTING')
+
+    def test_values_are_parsed_once(self):
+        helper = self.appsettingshelper
+        with patch('cogwheels.helpers.settings.parse_duration', wraps=parse_duration) as mocked_parse:
+            for i in range(3):
+                helper.get_timedelta('DURATION_SETTING')
+        self.assertEqual(mocked_parse.call_count, 1)
+
+    def test_cache_cleared_when_setting_changes(self):
+        helper = self.appsettingshelper
+        helper.get_seconds('DURATION_SETTING')
+        with override_settings(COGWHEELS_TESTS_DURATION_SETTING='10s'):
+            self.assertEqual(helper.get_seconds('DURATION_SETTING'), 10)
+        with helper.override_for_tests(DURATION_SETTING='20s'):
+            self.assertEqual(helper.get_seconds('DURATION_SETTING'), 20)
+        self.assertEqual(helper.get_seconds('DURATION_SETTING'), 5400)
+
+    @override_settings(COGWHEELS_TESTS_SIZE_SETTING='10 megabytes')
+    def test_invalid_format_raises_error(self):
+        with self.assertRaisesRegex(OverrideValueFormatInvalid, "'10 megabytes' is not a valid size"):
+            self.appsettingshelper.get_bytes('SIZE_SETTING')
+
+    @override_settings(COGWHEELS_TESTS_DURATION_SETTING=['10s'])
+    def test_invalid_type_raises_error(self):
+        with self.assertRaises(OverrideValueTypeInvalid):
+            self.appsettingshelper.get_timedelta('DURATION_SETTING')
@@ -0,0 +1,80 @@
+import warnings
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from cogwheels import BaseAppSettingsHelper, DeprecatedAppSetting
+
+
+class WarnOnceSettingsHelper(BaseAppSettingsHelper):
+    prefix = 'COGWHEELS_TESTS'
+    defaults_path = 'cogwheels.tests.conf.defaults'
+    warn_once = True
+    deprecations = (
+        DeprecatedAppSetting('DEPRECATED_SETTING'),
+        DeprecatedAppSetting('RENAMED_SETTING_OLD', renamed_to='RENAMED_SETTING_NEW'),
+    )
+
+
+class TestWarnOnce(TestCase):
+
+    def setUp(self):
+        self.appsettingshelper = WarnOnceSettingsHelper()
+
+    def test_warning_raised_once_per_call_site(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            for i in range(3):
+                self.appsettingshelper.get('DEPRECATED_SETTING')
+            self.assertEqual(len(w), 1)
+            self.assertIn('/cogwheels/helpers/tests/test_warn_once.py', str(w[0]))
+
+            # A different line of code counts as a different call site
+            self.appsettingshelper.DEPRECATED_SETTING
+            self.assertEqual(len(w), 2)
+
+    @override_settings(COGWHEELS_TESTS_RENAMED_SETTING_OLD='old')
+    def test_old_name_used_warning_raised_once_per_call_site(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            for i in range(3):
+                self.appsettingshelper.reset_caches()
+                self.assertEqual(self.appsettingshelper.get('RENAMED_SETTING_NEW'), 'old')
+            self.assertEqual(len(w), 1)
+
+    def test_subsequent_requests_skip_warning_machinery(self):
+        depr = self.appsettingshelper._deprecated_settings['DEPRECATED_SETTING']
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for i in range(3):
+                with patch('cogwheels.helpers.deprecation.warnings') as mocked_module:
+                    self.appsettingshelper.get('DEPRECATED_SETTING')
+                    if i:
+                        mocked_module.warn.assert_not_called()
+        self.assertEqual(len(self.appsettingshelper._warning_registry), 1)
+        self.assertEqual(len(depr._warning_messages), 1)
+
+
+class TestWarningMessagesGeneratedOnce(TestCase):
+
+    def test_message_only_generated_once_for_each_format(self):
+        depr = DeprecatedAppSetting('DEPRECATED_SETTING')
+        depr.prefix = 'TEST_'
+        with patch.object(depr, '_make_warning_message', wraps=depr._make_warning_message) as mocked_method:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                for i in range(3):
+                    depr.warn_if_deprecated_setting_value_requested()
+                    depr.warn_if_overridden()
+            self.assertEqual(mocked_method.call_count, 2)
+
+    def test_changing_prefix_regenerates_messages(self):
+        depr = DeprecatedAppSetting('DEPRECATED_SETTING')
+        depr.prefix = 'ONE_'
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            depr.warn_if_overridden()
+            depr.prefix = 'TWO_'
+            depr.warn_if_overridden()
+        self.assertIn('ONE_', str(w[0].message))
+        self.assertIn('TWO_', str(w[1].message))
@@ -0,0 +1,128 @@
+import re
+from collections import namedtuple
+from datetime import timedelta
+
+
+DURATION_UNITS = {
+    'ms': 0.001, 'millisecond': 0.001, 'milliseconds': 0.001,
+    's': 1, 'sec': 1, 'secs': 1, 'second': 1, 'seconds': 1,
+    'm': 60, 'min': 60, 'mins': 60, 'minute': 60, 'minutes': 60,
+    'h': 3600, 'hr': 3600, 'hrs': 3600, 'hour': 3600, 'hours': 3600,
+    'd': 86400, 'day': 86400, 'days': 86400,
+    'w': 604800, 'week': 604800, 'weeks': 604800,
+}
+
+BYTE_UNITS = {
+    'b': 1,
+    'kb': 1000, 'mb': 1000 ** 2, 'gb': 1000 ** 3, 'tb': 1000 ** 4,
+    'kib': 1024, 'mib': 1024 ** 2, 'gib': 1024 ** 3, 'tib': 1024 ** 4,
+}
+
+NUMBER_WITH_UNIT_REGEX = re.compile(r'\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]*)\s*')
+
+
+class Rate(namedtuple('Rate', ('count', 'seconds'))):
+    """
+    A number of events (``count``) permitted within a period of time
+    (``seconds``), as returned by ``parse_rate()``.
+    """
+    __slots__ = ()
+
+    @property
+    def per_second(self):
+        return self.count / self.seconds
+
+
+def _check_type(value):
+    if not isinstance(value, (str, int, float)) or isinstance(value, bool):
+        raise TypeError(
+            "The value is expected to be a 'str', 'int' or 'float', but a "
+            "value of type '{}' was found.".format(type(value).__name__)
+        )
+
+
+def parse_duration(value):
+    """
+    Returns a ``timedelta`` for ``value``, which can be a ``timedelta``, a
+    number of seconds, or a string made up of one or more numbers with units
+    (e.g. ``"30s"``, ``"5m"``, ``"1h 30m"`` or ``"2days"``).
+
+    :raises: TypeError, ValueError
+    """
+    if isinstance(value, timedelta):
+        return value
+    _check_type(value)
+    if not isinstance(value, str):
+        return timedelta(seconds=value)
+    seconds = 0
+    position = 0
+    while position < len(value):
+        match = NUMBER_WITH_UNIT_REGEX.match(value, position)
+        unit = match.group(2).lower() if match else None
+        if not match or unit not in DURATION_UNITS:
+            raise ValueError(
+                "'{}' is not a valid duration. Please use numbers with units "
+                "(e.g. '500ms', '30s', '5m', '1h' or '2d').".format(value)
+            )
+        seconds += float(match.group(1)) * DURATION_UNITS[unit]
+        position = match.end()
+    if not position:
+        raise ValueError("'' is not a valid duration.")
+    return timedelta(seconds=seconds)
+
+
+def parse_bytes(value):
+    """
+    Returns a whole number of bytes for ``value``, which can be a number, or
+    a string made up of a number and a unit (e.g. ``"512B"``, ``"10MB"`` or
+    ``"1.5GiB"``). ``KB``, ``MB``, ``GB`` and ``TB`` are powers of 1000,
+    while ``KiB``, ``MiB``, ``GiB`` and ``TiB`` are powers of 1024. Units
+    are not case sensitive.
+
+    :raises: TypeError, ValueError
+    """
+    _check_type(value)
+    if not isinstance(value, str):
+        return int(value)
+    match = NUMBER_WITH_UNIT_REGEX.fullmatch(value)
+    unit = match.group(2).lower() or 'b' if match else None
+    if unit not in BYTE_UNITS:
+        raise ValueError(
+            "'{}' is not a valid size. Please use a number with a unit "
+            "(e.g. '512B', '10MB' or '1.5GiB').".format(value)
+        )
+    return int(round(float(match.group(1)) * BYTE_UNITS[unit]))
+
+
+def parse_rate(value):
+    """
+    Returns a ``Rate`` for ``value``, which should be a string made up of a
+    number of events and a period of time, separated by a slash (e.g.
+    ``"100/min"``, ``"10/s"`` or ``"1000/5m"``).
+
+    :raises: TypeError, ValueError
+    """
+    if isinstance(value, Rate):
+        return value
+    if not isinstance(value, str):
+        raise TypeError(
+            "The value is expected to be a 'str', but a value of type '{}' "
+            "was found.".format(type(value).__name__)
+        )
+    count, _, period = value.partition('/')
+    try:
+        count = int(count)
+        if count < 0:
+            raise ValueError
+        if not period.strip()[:1].isdigit():
+            period = '1' + period.strip()
+        seconds = parse_duration(period).total_seconds()
+        if seconds <= 0:
+            raise ValueError
+    except ValueError:
+        raise ValueError(
+            "'{}' is not a valid rate. Please use a number and a period of "
+            "time, separated by a slash (e.g. '100/min', '10/s' or "
+            "'1000/5m').".format(value)
+        )
+    return Rate(count, seconds)
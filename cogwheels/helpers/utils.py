@@ -1,3 +1,16 @@
+import ast
+import hashlib
+import pprint
+import sys
+import weakref
+from collections.abc import Mapping, Set
+from importlib.machinery import PathFinder
+from importlib.util import find_spec
+from types import (
+    BuiltinFunctionType, CodeType, FunctionType, MappingProxyType, ModuleType,
+)
+
+
 class AttrReferToMethodHelper:
     """
     Each settings helper defines several instances of this class as attributes,
@@ -19,6 +32,10 @@ class AttrReferToMethodHelper:
         appsettingshelper.get_object("OBJECT_SETTING_NAME")
         appsettingshelper.objects.OBJECT_SETTING_NAME
 
+        # For accessing compiled regular expressions, these are equivalent:
+        appsettingshelper.get_regex("REGEX_SETTING_NAME")
+        appsettingshelper.regexes.REGEX_SETTING_NAME
+
     """
     def __init__(self, settings_helper, getter_method_name):
         self.settings_helper = settings_helper
@@ -35,3 +52,259 @@ class AttrReferToMethodHelper:
     def get_value_via_helper_method(self, setting_name):
         method = getattr(self.settings_helper, self.getter_method_name)
         return method(setting_name, warning_stacklevel=5)
+
+
+class ImportFailuresInvalidator:
+    """
+    A 'meta path finder' that never finds any modules, but is added to
+    ``sys.meta_path`` so that it is notified whenever
+    ``importlib.invalidate_caches()`` is called. When that happens, import
+    failures cached by registered settings helpers are cleared.
+    """
+    def __init__(self):
+        self.helpers = weakref.WeakSet()
+
+    def register(self, settings_helper):
+        self.helpers.add(settings_helper)
+        if self not in sys.meta_path:
+            sys.meta_path.append(self)
+
+    def find_spec(self, fullname, path, target=None):
+        return None
+
+    def invalidate_caches(self):
+        for settings_helper in list(self.helpers):
+            settings_helper.clear_failures_cache()
+
+
+import_failures_invalidator = ImportFailuresInvalidator()
+
+
+def find_module_spec(module_path):
+    """
+    Returns a ``ModuleSpec`` for the module identified by ``module_path``, or
+    ``None`` if no such module can be found. Unlike
+    ``importlib.util.find_spec()``, parent packages are not imported if they
+    haven't been already, so no module code is executed.
+    """
+    spec = None
+    search_locations = None
+    parts = module_path.split('.')
+    for i in range(len(parts)):
+        name = '.'.join(parts[:i + 1])
+        module = sys.modules.get(name)
+        if module is not None:
+            spec = getattr(module, '__spec__', None)
+            search_locations = getattr(module, '__path__', None)
+        else:
+            try:
+                if i == 0:
+                    spec = find_spec(name)
+                else:
+                    spec = PathFinder.find_spec(name, search_locations)
+            except (ImportError, ValueError):
+                return None
+            if spec is None:
+                return None
+            search_locations = spec.submodule_search_locations
+        if search_locations is None and i < len(parts) - 1:
+            # Not a package, so cannot have submodules
+            return None
+    return spec
+
+
+# Not all node types are available in older Python versions
+DEFINITION_NODES = tuple(
+    getattr(ast, name) for name in ('FunctionDef', 'AsyncFunctionDef', 'ClassDef')
+    if hasattr(ast, name)
+)
+ASSIGNMENT_NODES = tuple(
+    getattr(ast, name) for name in ('Assign', 'AnnAssign', 'AugAssign')
+    if hasattr(ast, name)
+)
+
+
+def _add_defined_names(statements, names):
+    for node in statements:
+        if isinstance(node, DEFINITION_NODES):
+            if node.name == '__getattr__':
+                # Module attributes are resolved dynamically
+                return False
+            names.add(node.name)
+            continue
+        if isinstance(node, ASSIGNMENT_NODES):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                for item in ast.walk(target):
+                    if isinstance(item, ast.Name):
+                        names.add(item.id)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                if alias.name == '*':
+                    return False
+                names.add(alias.asname or alias.name.split('.')[0])
+        # Include names defined within 'if', 'try' and 'with' blocks
+        for field in ('body', 'orelse', 'finalbody'):
+            if not _add_defined_names(getattr(node, field, ()), names):
+                return False
+        for handler in getattr(node, 'handlers', ()):
+            if not _add_defined_names(handler.body, names):
+                return False
+    return True
+
+
+def get_defined_names(spec):
+    """
+    Returns a set of the names defined at the top level of the module
+    identified by ``spec``, by parsing its source code (without executing
+    it). Returns ``None`` if the names cannot be determined reliably (e.g. if
+    the source is unavailable, or the module uses ``import *``).
+    """
+    origin = getattr(spec, 'origin', None)
+    if not spec.has_location or not origin or not origin.endswith('.py'):
+        return None
+    try:
+        with open(origin, 'rb') as f:
+            tree = ast.parse(f.read(), origin)
+    except (OSError, SyntaxError, ValueError):
+        return None
+    names = set()
+    if not _add_defined_names(tree.body, names):
+        return None
+    return names
+
+
+def deep_merge(base, override):
+    """
+    Returns a new dictionary containing the items from ``base``, updated
+    with the items from ``override``. Where both contain a mapping for the
+    same key, the two are merged in the same way (rather than the value from
+    ``override`` replacing the other entirely). Neither argument is modified.
+    """
+    result = dict(base)
+    for key, value in override.items():
+        if isinstance(value, Mapping) and isinstance(result.get(key), Mapping):
+            value = deep_merge(result[key], value)
+        result[key] = value
+    return result
+
+
+def make_read_only(mapping):
+    """
+    Returns a read-only ``MappingProxyType`` for a copy of ``mapping``, with
+    any mappings found in its values also made read-only.
+    """
+    return MappingProxyType({
+        key: make_read_only(value) if isinstance(value, Mapping) else value
+        for key, value in mapping.items()
+    })
+
+
+def deep_freeze(value):
+    """
+    Returns an immutable version of ``value``, with lists and tuples converted
+    to tuples, sets to frozensets and mappings to read-only
+    ``MappingProxyType`` copies (all recursively). Tuple subclasses (e.g.
+    namedtuples) keep their type. Other values are returned unchanged.
+    """
+    if isinstance(value, tuple):
+        items = tuple(deep_freeze(item) for item in value)
+        if type(value) is tuple:
+            return items
+        if all(a is b for a, b in zip(items, value)):
+            # Already immutable, and the items may not be reproducible from
+            # the constructor
+            return value
+        if hasattr(value, '_make'):
+            return value._make(items)
+        try:
+            return type(value)(items)
+        except TypeError:
+            return items
+    if isinstance(value, list):
+        return tuple(deep_freeze(item) for item in value)
+    if isinstance(value, Mapping):
+        return MappingProxyType({
+            key: deep_freeze(item) for key, item in value.items()
+        })
+    if isinstance(value, Set):
+        return frozenset(deep_freeze(item) for item in value)
+    return value
+
+
+# Types whose repr() is the same for equal values in every process
+PLAIN_REPR_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+
+def stable_repr(value):
+    """
+    Returns a string representation of ``value`` which is the same for equal
+    values in every process, for use in digests. Items in mappings and sets
+    are sorted, so their order does not matter, and all mappings (including
+    read-only ``MappingProxyType`` copies) are represented in the same way.
+    Classes, modules and functions are represented by their import paths,
+    with the code of functions also included, so that changes to it are
+    detected.
+
+    :raises: ValueError if ``value`` (or any value within it) has no stable
+        representation, e.g. an object whose ``repr()`` includes its memory
+        address.
+    """
+    value_type = type(value)
+    if value_type in PLAIN_REPR_TYPES:
+        return repr(value)
+    if isinstance(value, Mapping):
+        return '{{{}}}'.format(', '.join(sorted(
+            '{}: {}'.format(stable_repr(key), stable_repr(item))
+            for key, item in value.items()
+        )))
+    if isinstance(value, Set):
+        return 'set({{{}}})'.format(', '.join(sorted(
+            stable_repr(item) for item in value)))
+    if isinstance(value, (list, tuple)):
+        items = ', '.join(stable_repr(item) for item in value)
+        if value_type is list:
+            return '[{}]'.format(items)
+        if value_type is tuple:
+            return '({})'.format(items)
+        return '{}({})'.format(get_qualified_name(value_type), items)
+    if isinstance(value, ModuleType):
+        return '<module {}>'.format(value.__name__)
+    if isinstance(value, (type, BuiltinFunctionType)):
+        return get_qualified_name(value)
+    if isinstance(value, FunctionType):
+        cells = tuple(cell.cell_contents for cell in value.__closure__ or ())
+        return '<function {} {}>'.format(get_qualified_name(value), stable_repr(
+            (value.__code__, value.__defaults__, cells)))
+    if isinstance(value, CodeType):
+        return '<code {}>'.format(stable_repr(
+            (value.co_code, value.co_consts, value.co_names)))
+    if value_type.__repr__ is object.__repr__:
+        raise ValueError(
+            "{!r} has no stable representation. Consider using an import "
+            "path for the object instead.".format(value))
+    return '{}:{!r}'.format(get_qualified_name(value_type), value)
+
+
+def get_qualified_name(obj):
+    return '{}.{}'.format(obj.__module__, obj.__qualname__)
+
+
+def make_digest(value, strict=False):
+    """
+    Returns a hex digest of ``value``, based on ``stable_repr()``, so that
+    equal values give the same result in every process, regardless of
+    ordering.
+
+    Values with no stable representation are represented by their
+    ``pprint`` output instead, so will not give the same result in other
+    processes, unless ``strict`` is ``True``, in which case ``ValueError``
+    is raised.
+    """
+    try:
+        text = stable_repr(value)
+    except ValueError:
+        if strict:
+            raise
+        text = pprint.pformat(value)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
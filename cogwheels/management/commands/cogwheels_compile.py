@@ -0,0 +1,50 @@
+import pprint
+
+from django.core.management.base import BaseCommand, CommandError
+
+from cogwheels.helpers import registry
+
+
+HEADER = (
+    "# Generated by 'manage.py cogwheels_compile'. Do not edit.\n"
+    "#\n"
+    "# Values are only used by settings helpers while their defaults modules,\n"
+    "# and override values in the project's Django settings, match those that\n"
+    "# were compiled.\n\n"
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Resolves the settings for every settings helper against the current "
+        "Django settings, and writes the values to a Python module, which "
+        "helpers can serve values from (see 'compiled_settings_module')."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path', help="The path of the Python file to write values to.")
+
+    def handle(self, *args, **options):
+        helpers = registry.autodiscover()
+        data = {}
+        for settings_helper in helpers:
+            class_path = settings_helper._get_class_path()
+            try:
+                data[class_path] = settings_helper._get_compiled_data()
+            except ValueError as e:
+                # Compiled values could never be matched to the settings
+                self.stderr.write(
+                    "Skipping {}, as its settings cannot be fingerprinted "
+                    "reliably: {}".format(class_path, e))
+        try:
+            with open(options['path'], 'w') as f:
+                f.write(HEADER)
+                f.write('HELPERS = {}\n'.format(pprint.pformat(data)))
+        except OSError as e:
+            raise CommandError(
+                "Compiled settings could not be written to '{}': {}".format(
+                    options['path'], e))
+        if options['verbosity']:
+            self.stdout.write("Compiled settings for {} settings helper(s) to {}".format(
+                len(data), options['path']))
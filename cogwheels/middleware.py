@@ -0,0 +1,52 @@
+import asyncio
+import sys
+
+from cogwheels.helpers.snapshot import pin_snapshots, unpin_snapshots
+
+if sys.version_info >= (3, 5):
+    from cogwheels.middleware_async import get_response_with_snapshots
+else:
+    get_response_with_snapshots = None
+
+
+class SettingsSnapshotMiddleware:
+    """
+    Pins a snapshot of setting values for every registered settings helper
+    at the start of each request (see ``BaseAppSettingsHelper.snapshot()``),
+    so that setting values requested as helper attributes (e.g.
+    ``appsettings.SETTING_NAME``) are consistent for the whole request, even
+    if settings are changed while it is being handled. Requests that start
+    after a change see the new values. Values requested using helper
+    methods (e.g. ``appsettings.get('SETTING_NAME')``) are not taken from
+    the snapshots.
+
+    Supports both WSGI and ASGI (where snapshots are pinned to the request's
+    context, rather than to the current thread). ASGI support requires
+    Python 3.5 or newer.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self._is_async = (
+            get_response_with_snapshots is not None and
+            asyncio.iscoroutinefunction(get_response)
+        )
+        if self._is_async:
+            # Allow Django to identify this as a coroutine function
+            try:
+                from asgiref.sync import markcoroutinefunction
+            except ImportError:
+                self._is_coroutine = getattr(asyncio.coroutines, '_is_coroutine', None)
+            else:
+                markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self._is_async:
+            return get_response_with_snapshots(self.get_response, request)
+        token = pin_snapshots()
+        try:
+            return self.get_response(request)
+        finally:
+            unpin_snapshots(token)
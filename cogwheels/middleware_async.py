@@ -0,0 +1,15 @@
+from cogwheels.helpers.snapshot import pin_snapshots, unpin_snapshots
+
+
+# This is kept separate from cogwheels.middleware, because 'async def' is a
+# syntax error in Python versions earlier than 3.5
+async def get_response_with_snapshots(get_response, request):
+    """
+    Awaits ``get_response(request)`` with snapshots pinned for every
+    registered settings helper (see ``pin_snapshots()``).
+    """
+    token = pin_snapshots()
+    try:
+        return await get_response(request)
+    finally:
+        unpin_snapshots(token)
@@ -4,3 +4,17 @@ class DefaultClass:
 
 class ReplacementClass:
     pass
+
+
+class ConfigurableClass:
+
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+
+def handle_value(value, request=None):
+    return (value, request)
+
+
+NOT_CALLABLE = 'not callable'
@@ -0,0 +1,10 @@
+from cogwheels import derived
+
+
+INTEGER_SETTING = 1
+
+DERIVED_ONE = derived(lambda s: s.INTEGER_SETTING + s.DERIVED_THREE)
+
+DERIVED_TWO = derived(lambda s: s.DERIVED_ONE + 1)
+
+DERIVED_THREE = derived(lambda s: s.DERIVED_TWO + 1)
@@ -1,3 +1,6 @@
+from cogwheels import derived
+
+
 # -----------------------------------------------------------------------------
 # Standard type settings
 # -----------------------------------------------------------------------------
@@ -15,6 +18,24 @@ TUPLES_SETTING = (
     (4, 'Four'),
 )
 
+DICT_SETTING = {
+    'backends': {
+        'default': {'timeout': 10, 'retries': 1},
+    },
+    'handlers': ['console', 'file'],
+    'debug': False,
+}
+
+REGEX_SETTING = r'^/(?P<slug>[\w-]+)/$'
+
+INVALID_REGEX_SETTING = r'^/(?P<slug>[\w-]+/$'
+
+DURATION_SETTING = '1h 30m'
+
+SIZE_SETTING = '10MB'
+
+RATE_SETTING = '100/min'
+
 
 # -----------------------------------------------------------------------------
 # Model/class and module settings
@@ -38,6 +59,29 @@ MODULE_UNAVAILABLE_OBJECT = 'cogwheels.imaginary_module.Class'
 
 OBJECT_UNAVAILABLE_OBJECT = 'cogwheels.tests.classes.NonExistent'
 
+CALLABLE_OBJECT = 'cogwheels.tests.classes.handle_value'
+
+NOT_CALLABLE_OBJECT = 'cogwheels.tests.classes.NOT_CALLABLE'
+
+VALID_MODEL_LIST = ('tests.DefaultModel', 'tests.ReplacementModel')
+
+VALID_MODULE_LIST = (
+    'cogwheels.tests.modules.default_module',
+    'cogwheels.tests.modules.replacement_module',
+)
+
+VALID_OBJECT_LIST = [
+    'cogwheels.tests.classes.DefaultClass',
+    'cogwheels.tests.classes.ReplacementClass',
+]
+
+INVALID_OBJECT_LIST = (
+    'cogwheels.tests.classes.DefaultClass',
+    'DefaultClass',
+    'cogwheels.tests.classes.NonExistent',
+    1,
+)
+
 
 # -----------------------------------------------------------------------------
 # Deprecations
@@ -72,3 +116,16 @@ REPLACED_SETTING_TWO = 'replaced_two'
 REPLACED_SETTING_THREE = 'replaced_three'
 
 REPLACES_MULTIPLE = 'replaces_multiple'
+
+
+# -----------------------------------------------------------------------------
+# Derived settings
+# -----------------------------------------------------------------------------
+
+DERIVED_SETTING = derived(lambda s: s.INTEGER_SETTING * 1000)
+
+DERIVED_FROM_DERIVED_SETTING = derived(lambda s: s.DERIVED_SETTING + 1)
+
+EXPLICIT_DEPENDENCY_DERIVED_SETTING = derived(
+    lambda s: s.get('STRING_SETTING').upper(), depends_on=['STRING_SETTING']
+)
@@ -0,0 +1,16 @@
+import asyncio
+
+from django.http import HttpResponse
+from django.test import override_settings
+
+
+# Kept out of the test modules, because 'async def' is a syntax error in
+# Python versions earlier than 3.5
+def make_async_view(settings_helper, values):
+    async def view(request):
+        values.append(settings_helper.INTEGER_SETTING)
+        with override_settings(COGWHEELS_TESTS_INTEGER_SETTING=2):
+            await asyncio.sleep(0)
+            values.append(settings_helper.INTEGER_SETTING)
+        return HttpResponse()
+    return view
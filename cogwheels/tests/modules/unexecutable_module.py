@@ -0,0 +1,18 @@
+# Used to test that settings can be validated without importing modules
+try:
+    from cogwheels.tests.classes import DefaultClass
+except ImportError:
+    DefaultClass = None
+
+CONSTANT, OTHER_CONSTANT = 1, 2
+
+
+class DefinedClass:
+    pass
+
+
+def defined_function():
+    pass
+
+
+raise RuntimeError("This module should never be executed.")
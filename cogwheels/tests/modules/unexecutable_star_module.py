@@ -0,0 +1,4 @@
+# Used to test that settings can be validated without importing modules
+from cogwheels.tests.classes import *  # noqa
+
+raise RuntimeError("This module should never be executed.")
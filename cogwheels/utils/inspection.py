@@ -12,3 +12,74 @@ def accepts_kwarg(func, kwarg):
         return True
     except TypeError:
         return False
+
+
+KEYWORD_PARAMETER_KINDS = (
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    inspect.Parameter.KEYWORD_ONLY,
+)
+
+
+class CallableInfo:
+    """
+    Wraps the callable `func`, along with the results of analysing its
+    signature, so that the (relatively slow) analysis only happens once,
+    rather than every time the callable is used. Calling an instance calls
+    `func` with the same arguments.
+
+    If the signature of `func` cannot be determined (e.g. for some built-in
+    functions), it is assumed to accept any arguments.
+    """
+    def __init__(self, func):
+        self.func = func
+        try:
+            self.signature = inspect.signature(func)
+        except (TypeError, ValueError):
+            self.signature = None
+
+        if self.signature is None:
+            self.keyword_names = frozenset()
+            self.accepts_var_args = True
+            self.accepts_var_kwargs = True
+            return
+
+        parameters = self.signature.parameters.values()
+        self.keyword_names = frozenset(
+            p.name for p in parameters if p.kind in KEYWORD_PARAMETER_KINDS
+        )
+        self.accepts_var_args = any(
+            p.kind == inspect.Parameter.VAR_POSITIONAL for p in parameters
+        )
+        self.accepts_var_kwargs = any(
+            p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters
+        )
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def __repr__(self):
+        return '<{} for {!r}>'.format(self.__class__.__name__, self.func)
+
+    def accepts_kwarg(self, kwarg):
+        """
+        Determine whether the signature of `func` accepts the keyword
+        argument `kwarg` (equivalent to `accepts_kwarg(func, kwarg)`).
+        """
+        return self.accepts_var_kwargs or kwarg in self.keyword_names
+
+    def filter_kwargs(self, kwargs):
+        """
+        Return a dictionary of the items from `kwargs` that `func` accepts as
+        keyword arguments.
+        """
+        if self.accepts_var_kwargs:
+            return kwargs
+        return {k: v for k, v in kwargs.items() if k in self.keyword_names}
+
+    def call_with_supported_kwargs(self, *args, **kwargs):
+        """
+        Call `func` with `args`, and any items from `kwargs` that it accepts
+        as keyword arguments (others are ignored). Useful for calling
+        user-supplied callables that might not support newer arguments.
+        """
+        return self.func(*args, **self.filter_kwargs(kwargs))
@@ -0,0 +1,51 @@
+import sys
+from importlib import import_module
+
+# Module-level __getattr__() is supported from Python 3.7 (PEP 562)
+LAZY_ATTRIBUTES_SUPPORTED = sys.version_info >= (3, 7)
+
+
+def setup_lazy_attributes(module_name, attribute_modules):
+    """
+    Allows the attributes of the package named by `module_name` to be
+    imported from its submodules when they are first accessed, rather than
+    when the package is imported. `attribute_modules` should be a sequence
+    of `(attribute_name, submodule_name)` pairs, where `submodule_name` is
+    the (relative) name of the submodule the attribute should be imported
+    from.
+
+    On Python versions that do not support module-level `__getattr__()`,
+    all attributes are imported straight away instead, in the order they
+    are given in (so that submodules which import names from the package
+    itself can be imported after those names are set).
+
+    Unless the package defines `__all__` itself, it is set to the names in
+    `attribute_modules`, so that `from package import *` imports them.
+    """
+    module = sys.modules[module_name]
+    names = [name for name, submodule_name in attribute_modules]
+    attribute_modules = dict(attribute_modules)
+    if '__all__' not in module.__dict__:
+        module.__all__ = names
+
+    def __getattr__(name):
+        try:
+            submodule_name = attribute_modules[name]
+        except KeyError:
+            raise AttributeError(
+                "module '{}' has no attribute '{}'".format(module_name, name))
+        value = getattr(import_module(submodule_name, module_name), name)
+        # Future lookups will find the attribute without calling this again
+        setattr(module, name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(module.__dict__) | set(attribute_modules))
+
+    if not LAZY_ATTRIBUTES_SUPPORTED:
+        for name in names:
+            __getattr__(name)
+        return
+
+    module.__getattr__ = __getattr__
+    module.__dir__ = __dir__